@@ -5,29 +5,156 @@ Implements DS-F-001: Austria Democracy Radar Dataset Integration
 Implements DS-F-004: Democratic Trust Metrics Development
 """
 
+import cProfile
+import functools
 import json
 import logging
-from dataclasses import dataclass
+import os
+import re
+import subprocess
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("../.logs/data_pipeline.log"),
-        logging.StreamHandler(),
-    ],
-)
+try:
+    from lumin_ai import metrics
+except ImportError:  # the pipeline also runs without the lumin_ai package installed
+    metrics = None
+
 logger = logging.getLogger(__name__)
 
 
+def configure_logging(log_dir: str = "../.logs") -> None:
+    """Configure file and console logging for a pipeline run"""
+    logs_dir = Path(log_dir)
+    logs_dir.mkdir(exist_ok=True)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler(logs_dir / "data_pipeline.log"),
+            logging.StreamHandler(),
+        ],
+    )
+
+
+# Git LFS pointer files start with this line and are always under 1024 bytes
+LFS_POINTER_PREFIX = b"version https://git-lfs.github.com/spec/v1\n"
+LFS_POINTER_MAX_SIZE = 1024
+# Object ids are lowercase hex SHA-256 digests; they become object store paths
+LFS_OID = re.compile(r"[0-9a-f]{64}")
+# Seconds to wait for "git lfs fetch" before giving up on an object
+LFS_FETCH_TIMEOUT = 300.0
+
+
+@dataclass
+class LfsPointer:
+    """Object a Git LFS pointer file stands in for"""
+
+    oid: str
+    size: int
+
+
+def read_lfs_pointer(path: Path) -> Optional[LfsPointer]:
+    """
+    Return the LFS pointer stored at path, or None for a regular file.
+    Only files small enough to be pointers are opened, and only their first
+    LFS_POINTER_MAX_SIZE bytes are read.
+    """
+    if path.stat().st_size >= LFS_POINTER_MAX_SIZE:
+        return None
+    with open(path, "rb") as f:
+        head = f.read(LFS_POINTER_MAX_SIZE)
+    if not head.startswith(LFS_POINTER_PREFIX):
+        return None
+
+    fields = dict(
+        line.split(" ", 1) for line in head.decode("ascii", "replace").splitlines() if " " in line
+    )
+    algorithm, _, oid = fields.get("oid", "").partition(":")
+    if (
+        algorithm != "sha256"
+        or not LFS_OID.fullmatch(oid)
+        or not fields.get("size", "").isdigit()
+    ):
+        raise ValueError(f"Malformed Git LFS pointer file: {path}")
+    return LfsPointer(oid=oid, size=int(fields["size"]))
+
+
+def find_lfs_objects_dir(path: Path) -> Optional[Path]:
+    """Locate .git/lfs/objects of the repository containing path (worktrees included)"""
+    for parent in path.resolve().parents:
+        git_path = parent / ".git"
+        if git_path.is_dir():
+            git_dir = git_path
+        elif git_path.is_file():
+            # Worktrees and submodules: ".git" holds "gitdir: <path>"
+            git_dir = Path(git_path.read_text().split("gitdir:", 1)[1].strip())
+            git_dir = git_dir if git_dir.is_absolute() else parent / git_dir
+            commondir = git_dir / "commondir"
+            if commondir.is_file():
+                git_dir = git_dir / commondir.read_text().strip()
+        else:
+            continue
+        return git_dir.resolve() / "lfs" / "objects"
+    return None
+
+
+def resolve_lfs_object(
+    path: Path,
+    pointer: LfsPointer,
+    objects_dir: Optional[Path] = None,
+    fetch: bool = True,
+    fetch_timeout: float = LFS_FETCH_TIMEOUT,
+) -> Path:
+    """
+    Path of the local LFS object behind a pointer file, in
+    objects/<oid[:2]>/<oid[2:4]>/<oid>. A missing object is fetched into the
+    object store (never checked out into the working tree) when fetch is set,
+    without prompting for credentials and for at most fetch_timeout seconds.
+    """
+    objects_dir = objects_dir or find_lfs_objects_dir(path)
+    if objects_dir is None:
+        raise FileNotFoundError(f"{path} is a Git LFS pointer outside of a git repository")
+    object_path = objects_dir / pointer.oid[:2] / pointer.oid[2:4] / pointer.oid
+
+    if not object_path.is_file() and fetch:
+        logger.info(f"Fetching LFS object {pointer.oid[:12]} for {path}")
+        # A pattern without a slash matches the file name anywhere in the repository
+        try:
+            subprocess.run(
+                ["git", "lfs", "fetch", "--include", path.name],
+                cwd=path.parent,
+                capture_output=True,
+                check=False,
+                timeout=fetch_timeout,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"git lfs fetch for {path} timed out after {fetch_timeout:g}s")
+        except OSError as e:
+            logger.warning(f"Could not run git lfs fetch: {e}")
+    if not object_path.is_file():
+        raise FileNotFoundError(
+            f"{path} is a Git LFS pointer and object {pointer.oid} is not available locally; "
+            f"run 'git lfs pull --include \"{path}\"'"
+        )
+    if object_path.stat().st_size != pointer.size:
+        raise FileNotFoundError(
+            f"Git LFS object {pointer.oid} for {path} is incomplete "
+            f"({object_path.stat().st_size} of {pointer.size} bytes)"
+        )
+    return object_path
+
+
 @dataclass
 class TrustMetrics:
     """Data class for trust metrics with validation"""
@@ -45,26 +172,289 @@ class TrustMetrics:
                 raise ValueError(f"{field_name} must be between 0 and 10, got {value}")
 
 
+# Per-respondent trust scores, in TrustMetrics field order
+TRUST_COMPONENTS = (
+    "institutional_trust",
+    "process_satisfaction",
+    "democratic_efficacy",
+    "composite_score",
+)
+
+# Prefix of the group keys for a demographic column, as in calculate_trust_metrics
+GROUP_PREFIXES = {
+    "age_group": "age",
+    "region": "region",
+    "education_level": "education",
+    "income_level": "income",
+}
+
+
+# DS-F-004 asks for composite indices with Cronbach's alpha above this
+RELIABILITY_THRESHOLD = 0.7
+
+
+class ReliabilityAccumulator:
+    """
+    Mergeable sufficient statistics for Cronbach's alpha: per group, the number
+    of complete responses, the item sums and the item Gram matrix (X^T X).
+    Chunks of a survey can be added in any order with update, and accumulators
+    built separately (e.g. per file or per worker) combined with merge; the
+    result is the same as accumulating all rows at once.
+    """
+
+    def __init__(self, items: List[str]):
+        self.items = list(items)
+        k = len(self.items)
+        # (group label, wave or None) -> row in the arrays below
+        self.keys: Dict[Tuple[str, Any], int] = {}
+        self.counts = np.zeros(0)
+        self.sums = np.zeros((0, k))
+        self.gram = np.zeros((0, k, k))
+
+    def update(
+        self,
+        df: pd.DataFrame,
+        group_columns: Tuple[str, ...] = (),
+        wave_column: Optional[str] = None,
+    ) -> None:
+        """Add a chunk of responses; rows with a missing item are left out (listwise)"""
+        values = df[self.items].to_numpy(dtype=float)
+        complete = ~np.isnan(values).any(axis=1)
+        values = values[complete]
+        k = len(self.items)
+        # One row of statistics per response: 1, x and the flattened outer product x x^T
+        cell_values = pd.DataFrame(
+            np.hstack(
+                [
+                    np.ones((len(values), 1)),
+                    values,
+                    np.einsum("ni,nj->nij", values, values).reshape(len(values), k * k),
+                ]
+            )
+        )
+        waves = [df[wave_column].to_numpy()[complete]] if wave_column else []
+
+        overall_added = False
+        for column in group_columns:
+            if column not in df.columns:
+                continue
+            cells = cell_values.groupby(
+                [df[column].to_numpy()[complete]] + waves, dropna=False, sort=False
+            ).sum()
+            if not overall_added:
+                # Each response is in exactly one cell, so the cells merge into the overall group
+                overall = cells.groupby(level=1).sum() if waves else cells.sum().to_frame().T
+                self._add_cells("overall", overall, wave_column is not None)
+                overall_added = True
+            cells = cells[cells.index.get_level_values(0).notna()]
+            prefix = GROUP_PREFIXES.get(column, column)
+            labels = [f"{prefix}_{value}" for value in cells.index.get_level_values(0)]
+            self._add_cells(labels, cells, wave_column is not None)
+        if not overall_added:
+            overall = cell_values.groupby(waves[0]).sum() if waves else cell_values.sum().to_frame().T
+            self._add_cells("overall", overall, wave_column is not None)
+
+    def merge(self, other: "ReliabilityAccumulator") -> "ReliabilityAccumulator":
+        """Add the statistics of another accumulator over the same items"""
+        if other.items != self.items:
+            raise ValueError("Can only merge reliability statistics over the same items")
+        keys = list(other.keys)
+        self._add(keys, other.counts, other.sums, other.gram)
+        return self
+
+    def _add_cells(self, labels, cells: pd.DataFrame, by_wave: bool) -> None:
+        k = len(self.items)
+        if isinstance(labels, str):
+            labels = [labels] * len(cells)
+        if by_wave:
+            waves = cells.index.get_level_values(-1)
+            keys = list(zip(labels, waves))
+        else:
+            keys = [(label, None) for label in labels]
+        array = cells.to_numpy()
+        self._add(keys, array[:, 0], array[:, 1 : k + 1], array[:, k + 1 :].reshape(-1, k, k))
+
+    def _add(self, keys: List[Tuple[str, Any]], counts: np.ndarray, sums: np.ndarray, gram: np.ndarray) -> None:
+        new_keys = [key for key in dict.fromkeys(keys) if key not in self.keys]
+        if new_keys:
+            for key in new_keys:
+                self.keys[key] = len(self.keys)
+            grow = len(new_keys)
+            self.counts = np.concatenate([self.counts, np.zeros(grow)])
+            self.sums = np.concatenate([self.sums, np.zeros((grow,) + self.sums.shape[1:])])
+            self.gram = np.concatenate([self.gram, np.zeros((grow,) + self.gram.shape[1:])])
+        rows = np.array([self.keys[key] for key in keys], dtype=np.intp)
+        np.add.at(self.counts, rows, counts)
+        np.add.at(self.sums, rows, sums)
+        np.add.at(self.gram, rows, gram)
+
+    def results(self) -> pd.DataFrame:
+        """
+        Cronbach's alpha per group, with each item's corrected item-total
+        correlation (against the sum of the other items) and the alpha the
+        scale would have without it. Computed for all groups at once from
+        the covariance matrices; undefined values are NaN.
+        """
+        k = len(self.items)
+        n = self.counts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = self.sums / n[:, None]
+            cov = (self.gram - n[:, None, None] * mean[:, :, None] * mean[:, None, :]) / (
+                n - 1
+            )[:, None, None]
+            item_var = np.diagonal(cov, axis1=1, axis2=2)
+            total_var = cov.sum(axis=(1, 2))
+            alpha = k / (k - 1) * (1 - item_var.sum(axis=1) / total_var)
+
+            row_cov = cov.sum(axis=2)
+            rest_var = total_var[:, None] - 2 * row_cov + item_var
+            item_total_r = (row_cov - item_var) / np.sqrt(item_var * rest_var)
+            if k > 2:
+                alpha_if_deleted = (k - 1) / (k - 2) * (
+                    1 - (item_var.sum(axis=1)[:, None] - item_var) / rest_var
+                )
+            else:
+                alpha_if_deleted = np.full((len(n), k), np.nan)
+
+        columns = {"n": n.astype(np.int64), "alpha": alpha}
+        for i, item in enumerate(self.items):
+            columns[f"{item}_item_total_r"] = item_total_r[:, i]
+        for i, item in enumerate(self.items):
+            columns[f"{item}_alpha_if_deleted"] = alpha_if_deleted[:, i]
+
+        keys = list(self.keys)
+        by_wave = any(wave is not None for _, wave in keys)
+        if by_wave:
+            index = pd.MultiIndex.from_tuples(keys, names=["group", "wave"])
+        else:
+            index = pd.Index([label for label, _ in keys], name="group")
+        reliability = pd.DataFrame(columns, index=index)
+        # The overall group first, like calculate_trust_metrics
+        order = sorted(range(len(keys)), key=lambda row: (keys[row][0] != "overall",) + keys[row])
+        return reliability.iloc[order]
+
+
+@dataclass
+class StageProfile:
+    """Resource usage recorded for a single pipeline stage"""
+
+    stage: str
+    wall_time_s: float
+    cpu_time_s: float
+    rows_processed: int
+    peak_memory_mb: float
+    profile_file: Optional[str] = None
+
+
+def _json_number(value: float) -> Optional[float]:
+    """A float for JSON export, with NaN as null"""
+    return None if pd.isna(value) else float(value)
+
+
+def _count_rows(args: Tuple[Any, ...], result: Any) -> int:
+    """Rows handled by a stage: the size of its input frame/mapping, else of its output"""
+    for arg in args:
+        if isinstance(arg, (pd.DataFrame, dict)):
+            return len(arg)
+    return len(result) if hasattr(result, "__len__") else 0
+
+
+def profile_stage(method: Callable) -> Callable:
+    """
+    Record wall time, CPU time, rows processed and peak traced memory for a
+    processor stage. A no-op unless the processor was created with profile=True.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.profile:
+            if metrics is None:
+                return method(self, *args, **kwargs)
+            with metrics.STAGE_DURATION.time(stage=method.__name__):
+                return method(self, *args, **kwargs)
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        baseline_memory, _ = tracemalloc.get_traced_memory()
+
+        profiler = cProfile.Profile() if self.profile_dir else None
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            if profiler is not None:
+                result = profiler.runcall(method, self, *args, **kwargs)
+            else:
+                result = method(self, *args, **kwargs)
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            _, peak_memory = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+
+        if metrics is not None:
+            metrics.STAGE_DURATION.observe(wall_time, stage=method.__name__)
+
+        profile_file = None
+        if profiler is not None:
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+            profile_file = str(self.profile_dir / f"{method.__name__}-{timestamp}.prof")
+            profiler.dump_stats(profile_file)
+
+        stage_profile = StageProfile(
+            stage=method.__name__,
+            wall_time_s=round(wall_time, 6),
+            cpu_time_s=round(cpu_time, 6),
+            rows_processed=_count_rows(args, result),
+            peak_memory_mb=round(max(peak_memory - baseline_memory, 0) / (1024 * 1024), 3),
+            profile_file=profile_file,
+        )
+        self.stage_profiles.append(stage_profile)
+        logger.info(f"Stage profile: {json.dumps(asdict(stage_profile))}")
+        return result
+
+    return wrapper
+
+
 class DemocracyRadarProcessor:
     """
     Processes Austria Democracy Radar data for trust analysis
     Implements requirements DS-F-001, DS-F-002, DS-F-004
     """
 
-    def __init__(self, data_dir: str = "../data"):
+    def __init__(
+        self,
+        data_dir: str = "../data",
+        profile: bool = False,
+        profile_dir: Optional[str] = None,
+        lfs_objects_dir: Optional[str] = None,
+        fetch_lfs_objects: bool = True,
+    ):
         self.data_dir = Path(data_dir)
         self.raw_dir = self.data_dir / "raw" / "democracy-radar"
         self.processed_dir = self.data_dir / "processed" / "statistical-ready"
         self.processed_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create logs directory if it doesn't exist
-        logs_dir = Path("../.logs")
-        logs_dir.mkdir(exist_ok=True)
+        # Opt-in per-stage instrumentation; profile_dir additionally dumps cProfile stats
+        self.profile = profile or profile_dir is not None
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        if self.profile_dir:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+        self.stage_profiles: List[StageProfile] = []
+
+        # Raw files may be Git LFS pointers; their content is read from the local
+        # object store (found from the enclosing repository unless given)
+        self.lfs_objects_dir = Path(lfs_objects_dir) if lfs_objects_dir else None
+        self.fetch_lfs_objects = fetch_lfs_objects
 
         logger.info(
             f"Initialized DemocracyRadarProcessor with data_dir: {self.data_dir}"
         )
 
+    @profile_stage
     def load_democracy_radar_data(self, wave: Optional[int] = None) -> pd.DataFrame:
         """
         Load Democracy Radar data with validation
@@ -78,17 +468,21 @@ class DemocracyRadarProcessor:
                         f"Wave {wave} data not found at {file_path}"
                     )
 
-                df = pd.read_csv(file_path)
+                df = self._read_csv(file_path)
+                if metrics is not None:
+                    metrics.ROWS_LOADED.inc(len(df), wave=str(wave))
                 logger.info(f"Loaded wave {wave} with {len(df)} records")
                 return df
             else:
                 # Load all waves
                 all_waves = []
                 for wave_file in self.raw_dir.glob("wave-*.csv"):
-                    wave_df = pd.read_csv(wave_file)
+                    wave_df = self._read_csv(wave_file)
                     wave_num = int(wave_file.stem.split("-")[1])
                     wave_df["wave"] = wave_num
                     all_waves.append(wave_df)
+                    if metrics is not None:
+                        metrics.ROWS_LOADED.inc(len(wave_df), wave=str(wave_num))
 
                 if not all_waves:
                     raise FileNotFoundError(f"No wave data found in {self.raw_dir}")
@@ -103,6 +497,20 @@ class DemocracyRadarProcessor:
             logger.error(f"Failed to load Democracy Radar data: {str(e)}")
             raise
 
+    def _read_csv(self, file_path: Path) -> pd.DataFrame:
+        """Read a CSV file, or the LFS object behind it if it is a Git LFS pointer"""
+        pointer = read_lfs_pointer(file_path)
+        if pointer is None:
+            return pd.read_csv(file_path)
+
+        object_path = resolve_lfs_object(
+            file_path, pointer, self.lfs_objects_dir, fetch=self.fetch_lfs_objects
+        )
+        logger.info(f"Reading {file_path} from LFS object {pointer.oid[:12]} ({pointer.size} bytes)")
+        # Parse straight from the object store through a memory map, without a copy
+        return pd.read_csv(object_path, memory_map=True)
+
+    @profile_stage
     def standardize_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Standardize data formats and variable definitions
@@ -162,6 +570,7 @@ class DemocracyRadarProcessor:
         )
         return df_standardized
 
+    @profile_stage
     def calculate_trust_metrics(self, df: pd.DataFrame) -> Dict[str, TrustMetrics]:
         """
         Calculate comprehensive trust metrics with reliability validation
@@ -270,11 +679,210 @@ class DemocracyRadarProcessor:
 
         return (mean - margin_error, mean + margin_error)
 
+    def _component_scores(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Per-respondent component and composite scores, using the same columns
+        as calculate_trust_metrics (without its mock data fallback)"""
+        component_cols = {
+            "institutional_trust": [col for col in df.columns if col.startswith("trust_")],
+            "process_satisfaction": [
+                col for col in df.columns if "transparency" in col or "satisfaction" in col
+            ],
+            "democratic_efficacy": [
+                col for col in df.columns if "participation" in col or "efficacy" in col
+            ],
+        }
+        missing = [name for name, cols in component_cols.items() if not cols]
+        if missing:
+            raise ValueError(f"No columns found for trust components: {', '.join(missing)}")
+
+        scores = pd.DataFrame(
+            {name: df[cols].mean(axis=1) for name, cols in component_cols.items()},
+            index=df.index,
+        )
+        scores["composite_score"] = scores[list(component_cols)].sum(axis=1, skipna=False) / 3
+        return scores
+
+    @profile_stage
+    def calculate_trust_time_series(
+        self,
+        df: pd.DataFrame,
+        group_columns: Tuple[str, ...] = ("age_group",),
+        windows: Tuple[int, ...] = (3,),
+        ewm_span: float = 3.0,
+        confidence: float = 0.95,
+    ) -> pd.DataFrame:
+        """
+        Per-wave trust component and composite series for the overall sample and
+        every demographic group, with rolling and exponentially weighted windows
+        and wave-over-wave deltas with confidence intervals
+        Implements DS-F-005: Temporal Trend Analysis Framework
+
+        Respondents are reduced to count, sum and sum of squares per
+        (group value, wave) in one grouped pass; the overall series is the sum
+        of those cells, and every window and delta is derived from the cells,
+        so no window requires another pass over the rows.
+
+        Returns a frame indexed by (group, wave) with, for each component:
+        the wave mean and its CI, the mean pooled over the last w observed waves
+        ("<component>_rolling_<w>"), the EWM of the wave means ("<component>_ewm"),
+        and the change from the previous observed wave with a Welch CI
+        ("<component>_delta", "_delta_ci_lower", "_delta_ci_upper").
+        """
+        if "wave" not in df.columns:
+            raise ValueError("Trust time series need a 'wave' column")
+        logger.info("Calculating trust time series")
+        from scipy import stats
+
+        scores = self._component_scores(df)
+        components = list(TRUST_COMPONENTS)
+        cells = pd.concat(
+            [scores.notna().astype(np.int64), scores.fillna(0.0), scores.pow(2).fillna(0.0)],
+            axis=1,
+            keys=["n", "sum", "sumsq"],
+        )
+        group_columns = [col for col in group_columns if col in df.columns]
+
+        # One grouped pass: sufficient statistics per (group column value, wave)
+        overall = None
+        frames = []
+        for column in group_columns:
+            cell_stats = cells.groupby([df[column], df["wave"]], dropna=False).sum()
+            if overall is None:
+                # Every respondent falls in exactly one cell (missing group values
+                # included), so the cells add up to the overall series
+                overall = cell_stats.groupby(level=1).sum()
+            cell_stats = cell_stats[cell_stats.index.get_level_values(0).notna()]
+            prefix = GROUP_PREFIXES.get(column, column)
+            labels = prefix + "_" + cell_stats.index.get_level_values(0).astype(str)
+            cell_stats.index = pd.MultiIndex.from_arrays(
+                [labels, cell_stats.index.get_level_values(1)], names=["group", "wave"]
+            )
+            frames.append(cell_stats.sort_index())
+        if overall is None:
+            overall = cells.groupby(df["wave"]).sum()
+        overall.index = pd.MultiIndex.from_arrays(
+            [np.full(len(overall), "overall", dtype=object), overall.index], names=["group", "wave"]
+        )
+        # The overall series first, like calculate_trust_metrics; each group's waves in order
+        cell_stats = pd.concat([overall] + frames)
+
+        n, sums, sumsq = cell_stats["n"], cell_stats["sum"], cell_stats["sumsq"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = sums / n
+            variance = ((sumsq - sums * mean) / (n - 1)).clip(lower=0)
+            sq_err = variance / n
+        t_value = pd.DataFrame(
+            stats.t.ppf((1 + confidence) / 2, n - 1), index=n.index, columns=n.columns
+        )
+        margin = t_value * np.sqrt(sq_err)
+
+        by_group = n.groupby(level="group", sort=False)
+        result = {"n": n["composite_score"]}
+        columns = {}
+        for component in components:
+            columns[component] = mean[component]
+            columns[f"{component}_ci_lower"] = mean[component] - margin[component]
+            columns[f"{component}_ci_upper"] = mean[component] + margin[component]
+
+        # Pooled means over the last w waves come from rolling sums of the cells
+        for window in windows:
+            rolled_sums = (
+                sums.groupby(level="group", sort=False)
+                .rolling(window, min_periods=1)
+                .sum()
+                .droplevel(0)
+            )
+            rolled_n = by_group.rolling(window, min_periods=1).sum().droplevel(0)
+            pooled = rolled_sums / rolled_n
+            for component in components:
+                columns[f"{component}_rolling_{window}"] = pooled[component]
+
+        ewm = mean.groupby(level="group", sort=False).ewm(span=ewm_span).mean().droplevel(0)
+
+        # Wave-over-wave change with a Welch-Satterthwaite t interval
+        previous_mean = mean.groupby(level="group", sort=False).shift(1)
+        previous_sq_err = sq_err.groupby(level="group", sort=False).shift(1)
+        previous_n = by_group.shift(1)
+        delta = mean - previous_mean
+        delta_sq_err = sq_err + previous_sq_err
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dof = delta_sq_err ** 2 / (
+                sq_err ** 2 / (n - 1) + previous_sq_err ** 2 / (previous_n - 1)
+            )
+        delta_margin = (
+            pd.DataFrame(stats.t.ppf((1 + confidence) / 2, dof), index=n.index, columns=n.columns)
+            * np.sqrt(delta_sq_err)
+        )
+        for component in components:
+            columns[f"{component}_ewm"] = ewm[component]
+            columns[f"{component}_delta"] = delta[component]
+            columns[f"{component}_delta_ci_lower"] = delta[component] - delta_margin[component]
+            columns[f"{component}_delta_ci_upper"] = delta[component] + delta_margin[component]
+
+        result.update(columns)
+        time_series = pd.DataFrame(result, index=n.index)
+        time_series["n"] = time_series["n"].astype(np.int64)
+        logger.info(
+            f"Calculated trust time series for {time_series.index.get_level_values('group').nunique()} "
+            f"groups over {time_series.index.get_level_values('wave').nunique()} waves"
+        )
+        return time_series
+
+    @profile_stage
+    def calculate_reliability(
+        self,
+        df: pd.DataFrame,
+        items: Optional[List[str]] = None,
+        group_columns: Tuple[str, ...] = ("age_group",),
+        by_wave: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Internal consistency of the trust items: Cronbach's alpha, corrected
+        item-total correlations and alpha-if-item-deleted for the overall sample
+        and every demographic group (and wave, with by_wave)
+        Implements the reliability validation of DS-F-004
+
+        Rows are folded into a ReliabilityAccumulator chunk_size at a time (all
+        at once by default), so memory does not grow with the survey; every
+        group's statistics come from the same pass.
+        """
+        items = items or [col for col in df.columns if col.startswith("trust_")]
+        if len(items) < 2:
+            raise ValueError("Reliability needs at least two items")
+        if by_wave and "wave" not in df.columns:
+            raise ValueError("Reliability by wave needs a 'wave' column")
+        logger.info(f"Calculating reliability of {len(items)} items")
+
+        accumulator = ReliabilityAccumulator(items)
+        chunk_size = chunk_size or max(len(df), 1)
+        for start in range(0, len(df), chunk_size):
+            accumulator.update(
+                df.iloc[start : start + chunk_size], group_columns, "wave" if by_wave else None
+            )
+        reliability = accumulator.results()
+
+        unreliable = reliability.index[reliability["alpha"] < RELIABILITY_THRESHOLD]
+        if len(unreliable):
+            logger.warning(
+                f"Cronbach's alpha below {RELIABILITY_THRESHOLD} for {len(unreliable)} groups: "
+                f"{', '.join(map(str, unreliable[:10]))}"
+            )
+        logger.info(f"Calculated reliability for {len(reliability)} groups")
+        return reliability
+
+    @profile_stage
     def export_for_api(
-        self, trust_metrics: Dict[str, TrustMetrics], output_file: str = None
+        self,
+        trust_metrics: Dict[str, TrustMetrics],
+        output_file: str = None,
+        time_series: Optional[pd.DataFrame] = None,
+        reliability: Optional[pd.DataFrame] = None,
     ) -> Dict:
         """
-        Export trust metrics in API-ready format
+        Export trust metrics in API-ready format, with the per-wave series from
+        calculate_trust_time_series and the statistics from calculate_reliability
+        if given
         Implements DS-F-010: Data Export and API Framework
         """
         if output_file is None:
@@ -289,6 +897,9 @@ class DemocracyRadarProcessor:
             "trust_metrics": {},
         }
 
+        if self.profile:
+            api_data["metadata"]["stage_profiles"] = self.profile_report()
+
         for group_name, metrics in trust_metrics.items():
             api_data["trust_metrics"][group_name] = {
                 "institutional_trust": round(metrics.institutional_trust, 3),
@@ -301,6 +912,31 @@ class DemocracyRadarProcessor:
                 },
             }
 
+        if time_series is not None:
+            # NaN (e.g. the delta of a group's first wave) becomes null
+            rounded = time_series.round(3).astype(object)
+            rounded = rounded.where(rounded.notna(), None).reset_index(level="wave")
+            api_data["trust_time_series"] = {
+                group: records.to_dict("records")
+                for group, records in rounded.groupby(level="group", sort=False)
+            }
+
+        if reliability is not None:
+            items = [col[: -len("_item_total_r")] for col in reliability.columns if col.endswith("_item_total_r")]
+            api_data["reliability"] = {}
+            for key, row in reliability.round(3).iterrows():
+                group = key if isinstance(key, str) else f"{key[0]}_wave_{key[1]}"
+                api_data["reliability"][group] = {
+                    "n": int(row["n"]),
+                    "cronbach_alpha": _json_number(row["alpha"]),
+                    "item_total_correlation": {
+                        item: _json_number(row[f"{item}_item_total_r"]) for item in items
+                    },
+                    "alpha_if_item_deleted": {
+                        item: _json_number(row[f"{item}_alpha_if_deleted"]) for item in items
+                    },
+                }
+
         # Save to file
         with open(output_file, "w") as f:
             json.dump(api_data, f, indent=2)
@@ -308,14 +944,23 @@ class DemocracyRadarProcessor:
         logger.info(f"Exported API data to {output_file}")
         return api_data
 
+    def profile_report(self) -> List[Dict]:
+        """Return the recorded stage profiles as JSON-serializable dicts"""
+        return [asdict(stage_profile) for stage_profile in self.stage_profiles]
+
 
 def main():
     """Main pipeline execution"""
+    configure_logging()
     logger.info("Starting LUMIN.AI Data Science Pipeline")
 
     try:
-        # Initialize processor
-        processor = DemocracyRadarProcessor()
+        # Initialize processor (LUMIN_PIPELINE_PROFILE=1 enables stage profiling,
+        # LUMIN_PIPELINE_PROFILE_DIR additionally dumps cProfile stats)
+        processor = DemocracyRadarProcessor(
+            profile=os.environ.get("LUMIN_PIPELINE_PROFILE") == "1",
+            profile_dir=os.environ.get("LUMIN_PIPELINE_PROFILE_DIR"),
+        )
 
         # Load and process data
         logger.info("Loading Democracy Radar data...")
@@ -327,8 +972,23 @@ def main():
         logger.info("Calculating trust metrics...")
         trust_metrics = processor.calculate_trust_metrics(df_standardized)
 
+        logger.info("Calculating trust time series...")
+        time_series = processor.calculate_trust_time_series(df_standardized)
+
+        trust_items = [col for col in df_standardized.columns if col.startswith("trust_")]
+        reliability = None
+        if len(trust_items) >= 2:
+            logger.info("Calculating reliability...")
+            reliability = processor.calculate_reliability(df_standardized, trust_items)
+        else:
+            logger.warning(
+                f"Skipping reliability: found {len(trust_items)} trust item(s), need at least two"
+            )
+
         logger.info("Exporting API data...")
-        api_data = processor.export_for_api(trust_metrics)
+        api_data = processor.export_for_api(
+            trust_metrics, time_series=time_series, reliability=reliability
+        )
 
         # Save processed data
         output_file = processor.processed_dir / "democracy_radar_processed.csv"
@@ -344,9 +1004,19 @@ def main():
         print(
             f"✅ Overall composite trust score: {trust_metrics['overall'].composite_score:.2f}"
         )
+        if reliability is not None:
+            print(
+                f"✅ Overall Cronbach's alpha of trust items: {reliability.loc['overall', 'alpha']:.2f}"
+            )
         print(f"✅ API data exported with {len(api_data['trust_metrics'])} groups")
         print("=" * 50)
 
+        # Write runtime metrics for the node_exporter textfile collector
+        metrics_file = os.environ.get("LUMIN_METRICS_TEXTFILE")
+        if metrics_file and metrics is not None:
+            metrics.REGISTRY.write_textfile(metrics_file)
+            logger.info(f"Wrote pipeline metrics to {metrics_file}")
+
         logger.info("Pipeline completed successfully")
 
     except Exception as e:
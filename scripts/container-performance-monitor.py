@@ -7,22 +7,39 @@ alerting, and historical tracking.
 
 Usage:
     python scripts/container-performance-monitor.py [--duration 300] [--interval 5] [--export-csv]
+        [--sample-timeout 2] [--backend api|cli|cgroup] [--docker-socket /var/run/docker.sock]
+        [--history-size 17280] [--store .logs/metrics.db]
+        [--export-csv [--export-format csv|ndjson|parquet] [--rotate-size MB] [--rotate-interval S]]
+        [--listen 0.0.0.0:9465 | --push-to http://aggregator:9465/ingest [--agent-host NAME]]
 """
 
 import argparse
+import asyncio
+import bisect
 import csv
+import heapq
+import http.client
 import json
 import logging
+import math
+import operator
 import os
+import re
+import socket
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass, asdict
+import urllib.parse
+from array import array
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import MISSING, dataclass, asdict, field, fields
 from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-import psutil
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
 
 
 @dataclass
@@ -42,12 +59,29 @@ class ContainerMetrics:
     pids: int
     status: str
     uptime_seconds: int
+    # Monotonic sample time and per-interval rates derived from consecutive samples
+    sampled_at: float = field(default_factory=time.monotonic)
+    network_rx_rate_mb_s: float = 0.0
+    network_tx_rate_mb_s: float = 0.0
+    block_read_rate_mb_s: float = 0.0
+    block_write_rate_mb_s: float = 0.0
 
 
 @dataclass
 class PerformanceAlert:
     """Performance alert data structure."""
 
+    __slots__ = (
+        "timestamp",
+        "container_name",
+        "alert_type",
+        "metric",
+        "current_value",
+        "threshold",
+        "severity",
+        "message",
+    )
+
     timestamp: str
     container_name: str
     alert_type: str
@@ -58,11 +92,1635 @@ class PerformanceAlert:
     message: str
 
 
+BYTES_PER_MB = 1024 * 1024
+
+# Numeric ContainerMetrics fields stored column-wise in the metric history
+NUMERIC_FIELDS = (
+    "cpu_percent",
+    "memory_usage_mb",
+    "memory_percent",
+    "memory_limit_mb",
+    "network_rx_mb",
+    "network_tx_mb",
+    "block_read_mb",
+    "block_write_mb",
+    "pids",
+    "uptime_seconds",
+    "sampled_at",
+    "network_rx_rate_mb_s",
+    "network_tx_rate_mb_s",
+    "block_read_rate_mb_s",
+    "block_write_rate_mb_s",
+)
+INTEGER_FIELDS = ("pids", "uptime_seconds")
+
+# Cumulative counters and the rate field derived from each
+RATE_FIELDS = {
+    "network_rx_mb": "network_rx_rate_mb_s",
+    "network_tx_mb": "network_tx_rate_mb_s",
+    "block_read_mb": "block_read_rate_mb_s",
+    "block_write_mb": "block_write_rate_mb_s",
+}
+
+# Metrics watched by the anomaly detectors -> noise floor for their z-scores
+ANOMALY_FIELDS = {
+    "cpu_percent": 5.0,
+    "memory_percent": 1.0,
+    "network_rx_rate_mb_s": 1.0,
+    "network_tx_rate_mb_s": 1.0,
+    "block_read_rate_mb_s": 1.0,
+    "block_write_rate_mb_s": 1.0,
+}
+
+ANOMALY_ALERT_TYPES = ("METRIC_ANOMALY", "MEMORY_GROWTH")
+
+# Metrics summarized in the performance report
+REPORT_FIELDS = (
+    "cpu_percent",
+    "memory_percent",
+    "memory_usage_mb",
+    "network_rx_mb",
+    "network_tx_mb",
+    "block_read_mb",
+    "block_write_mb",
+    "uptime_seconds",
+    "network_rx_rate_mb_s",
+    "network_tx_rate_mb_s",
+    "block_read_rate_mb_s",
+    "block_write_rate_mb_s",
+)
+
+
+class RingBuffer:
+    """Fixed-capacity circular buffer backed by a preallocated ``array``."""
+
+    __slots__ = ("capacity", "_data", "_next", "_size")
+
+    def __init__(self, capacity: int, typecode: str = "d"):
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be at least 1")
+        self.capacity = capacity
+        self._data = array(typecode, [0]) * capacity
+        self._next = 0
+        self._size = 0
+
+    def append(self, value: float) -> None:
+        """Add a value, overwriting the oldest one once the buffer is full."""
+        self._data[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return iter(self.to_array())
+
+    def to_array(self) -> array:
+        """Return the buffered values, oldest first, as one contiguous array."""
+        if self._size < self.capacity:
+            return self._data[: self._size]
+        return self._data[self._next :] + self._data[: self._next]
+
+    def tail(self, n: int) -> array:
+        """Return the last ``n`` values (fewer until the buffer fills), oldest first."""
+        n = min(n, self._size)
+        start = self._next - n
+        if start >= 0:
+            return self._data[start : self._next]
+        return self._data[start:] + self._data[: self._next]
+
+    def latest(self) -> float:
+        """Return the most recently appended value."""
+        if not self._size:
+            raise IndexError("RingBuffer is empty")
+        return self._data[self._next - 1]
+
+
+class P2Quantile:
+    """Streaming quantile estimate using the P² algorithm (Jain & Chlamtac, 1985).
+
+    Keeps five markers, so memory and update cost are O(1) per sample.
+    """
+
+    __slots__ = ("p", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, p: float):
+        self.p = p
+        self._heights: List[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [1.0, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def update(self, x: float) -> None:
+        heights = self._heights
+        if len(heights) < 5:
+            bisect.insort(heights, x)
+            return
+
+        # Find the cell the observation falls in, widening the extremes if needed
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = bisect.bisect_right(heights, x) - 1
+
+        positions = self._positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the middle markers towards their desired positions
+        for i in (1, 2, 3):
+            d = self._desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (
+                d <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if d > 0 else -1
+                candidate = heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+                    (positions[i] - positions[i - 1] + step)
+                    * (heights[i + 1] - heights[i])
+                    / (positions[i + 1] - positions[i])
+                    + (positions[i + 1] - positions[i] - step)
+                    * (heights[i] - heights[i - 1])
+                    / (positions[i] - positions[i - 1])
+                )
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    # Parabolic prediction left the cell; fall back to linear
+                    candidate = heights[i] + step * (heights[i + step] - heights[i]) / (
+                        positions[i + step] - positions[i]
+                    )
+                heights[i] = candidate
+                positions[i] += step
+
+    def value(self) -> float:
+        heights = self._heights
+        if not heights:
+            return 0.0
+        if len(heights) < 5:
+            return heights[round(self.p * (len(heights) - 1))]
+        return heights[2]
+
+
+class StreamingStats:
+    """Running count, mean, min, max, Welford variance and P² percentiles."""
+
+    __slots__ = ("count", "mean", "min", "max", "_m2", "_quantiles")
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self._m2 = 0.0
+        self._quantiles = [P2Quantile(p) for p in self.QUANTILES]
+
+    def update(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        for quantile in self._quantiles:
+            quantile.update(x)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """Report-ready statistics (average/max/min plus stddev and percentiles)."""
+        if not self.count:
+            return {}
+        summary = {
+            "average": self.mean,
+            "max": self.max,
+            "min": self.min,
+            "stddev": self.variance**0.5,
+        }
+        for quantile in self._quantiles:
+            summary[f"p{round(quantile.p * 100)}"] = quantile.value()
+        return summary
+
+
+class ContainerHistory:
+    """Bounded per-container sample history with one ring buffer per metric."""
+
+    __slots__ = ("timestamps", "columns", "statuses", "_status_names")
+
+    def __init__(self, capacity: int):
+        # Microseconds since the epoch, so timestamps round-trip exactly
+        self.timestamps = RingBuffer(capacity, "q")
+        self.columns = {name: RingBuffer(capacity) for name in NUMERIC_FIELDS}
+        self.statuses = RingBuffer(capacity, "H")
+        self._status_names: List[str] = []
+
+    def append(self, metrics: ContainerMetrics) -> None:
+        timestamp = datetime.fromisoformat(metrics.timestamp)
+        self.timestamps.append(int(timestamp.timestamp() * 1_000_000))
+        for name, buffer in self.columns.items():
+            buffer.append(getattr(metrics, name))
+        if metrics.status not in self._status_names:
+            self._status_names.append(metrics.status)
+        self.statuses.append(self._status_names.index(metrics.status))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def records(self, container_name: str):
+        """Yield the buffered samples as ContainerMetrics, oldest first."""
+        columns = {name: buffer.to_array() for name, buffer in self.columns.items()}
+        statuses = self.statuses.to_array()
+        for i, micros in enumerate(self.timestamps.to_array()):
+            values = {name: column[i] for name, column in columns.items()}
+            for name in INTEGER_FIELDS:
+                values[name] = int(values[name])
+            yield ContainerMetrics(
+                timestamp=datetime.fromtimestamp(micros / 1_000_000).isoformat(),
+                container_name=container_name,
+                status=self._status_names[statuses[i]],
+                **values,
+            )
+
+
+class MetricHistory:
+    """Fixed-memory metrics history: ``capacity`` samples per container.
+
+    Iterating yields retained samples in timestamp order across containers;
+    ``column`` exposes a metric as a contiguous array for reporting.
+    """
+
+    def __init__(self, capacity: int = 17280):
+        self.capacity = capacity
+        self.total_samples = 0
+        self._containers: Dict[str, ContainerHistory] = {}
+
+    def append(self, metrics: ContainerMetrics) -> None:
+        history = self._containers.get(metrics.container_name)
+        if history is None:
+            history = self._containers[metrics.container_name] = ContainerHistory(self.capacity)
+        history.append(metrics)
+        self.total_samples += 1
+
+    def __len__(self) -> int:
+        return sum(len(history) for history in self._containers.values())
+
+    def __iter__(self):
+        return heapq.merge(
+            *(history.records(name) for name, history in self._containers.items()),
+            key=lambda metrics: metrics.timestamp,
+        )
+
+    def container_names(self) -> List[str]:
+        return list(self._containers)
+
+    def column(self, container_name: str, field: str) -> array:
+        """Return one metric for one container, oldest first."""
+        history = self._containers.get(container_name)
+        if history is None:
+            return array("d")
+        return history.columns[field].to_array()
+
+    def recent(self, container_name: str, field: str, n: int) -> array:
+        """Return the last ``n`` values of one metric for one container."""
+        history = self._containers.get(container_name)
+        if history is None:
+            return array("d")
+        return history.columns[field].tail(n)
+
+
+def calculate_uptime(started_at: str) -> int:
+    """Calculate container uptime in seconds from a Docker StartedAt timestamp."""
+    try:
+        # Docker reports nanosecond precision, which fromisoformat can't parse
+        started_at = re.sub(
+            r"\.\d+", lambda m: m.group(0)[:7].ljust(7, "0"), started_at.replace("Z", "+00:00")
+        )
+        start_time = datetime.fromisoformat(started_at)
+        now = datetime.now(start_time.tzinfo)
+        return int((now - start_time).total_seconds())
+    except Exception:
+        return 0
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket (e.g. the Docker Engine API)."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+def docker_socket_from_env() -> Optional[str]:
+    """Docker daemon socket named by DOCKER_HOST, the default socket if it is
+    unset, or None for a daemon that isn't reached over a Unix socket."""
+    docker_host = os.environ.get("DOCKER_HOST")
+    if not docker_host:
+        return "/var/run/docker.sock"
+    if docker_host.startswith("unix://"):
+        return docker_host[len("unix://") :]
+    return None
+
+
+class DockerStatsStreamCollector:
+    """Collect container metrics from the Docker Engine API stats stream.
+
+    Each container gets one long-lived streaming connection to
+    ``/containers/{name}/stats`` (the Engine API has no multi-container stats
+    stream), read by a background thread that keeps the latest sample.
+    ``collect`` is then a dictionary lookup. Inspect data (status and start
+    time) is cached for ``inspect_ttl`` seconds.
+
+    Docker streams a sample about once a second. A sample older than
+    ``stale_after`` seconds, or from a stream that has closed, is not
+    reported, so the monitor falls back to polling instead of repeating it.
+    A stream that keeps failing is retried with exponential backoff, from
+    ``reconnect_delay`` up to ``max_reconnect_delay`` seconds, and logged
+    once per run of failures.
+    """
+
+    def __init__(
+        self,
+        containers: List[str],
+        socket_path: str = "/var/run/docker.sock",
+        inspect_ttl: float = 30.0,
+        reconnect_delay: float = 1.0,
+        timeout: float = 30.0,
+        stale_after: float = 2.0,
+        max_reconnect_delay: float = 60.0,
+    ):
+        self.containers = containers
+        self.socket_path = socket_path
+        self.inspect_ttl = inspect_ttl
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.logger = logging.getLogger(__name__)
+
+        # Per container: (monotonic receive time, stats sample)
+        self._latest: Dict[str, Tuple[float, Dict]] = {}
+        self._inspect_cache: Dict[str, Tuple[float, str, str]] = {}
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._connections: Dict[str, UnixHTTPConnection] = {}
+
+    def start(self) -> None:
+        """Open one stats stream per container."""
+        self._stop.clear()
+        for container_name in self.containers:
+            thread = threading.Thread(
+                target=self._stream_stats,
+                args=(container_name,),
+                name=f"docker-stats-{container_name}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Close all stats streams and wait for the reader threads."""
+        self._stop.set()
+        for connection in list(self._connections.values()):
+            # Shutting the socket down unblocks the reader thread immediately; the
+            # reader closes the connection itself, closing it here races its read
+            if connection.sock is not None:
+                try:
+                    connection.sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        for thread in self._threads:
+            thread.join(timeout=self.timeout)
+        self._threads = []
+
+    def api_get(self, path: str) -> Optional[Dict]:
+        """Perform a single GET request against the Engine API."""
+        connection = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+        try:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            body = response.read()
+            if response.status != 200:
+                self.logger.error(f"Docker API {path} returned {response.status}")
+                return None
+            return json.loads(body)
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            self.logger.error(f"Docker API request failed: {path}, Error: {e}")
+            return None
+        finally:
+            connection.close()
+
+    def _stream_stats(self, container_name: str) -> None:
+        """Read the stats stream for one container, reconnecting on errors."""
+        delay = self.reconnect_delay
+        failures = 0
+        while not self._stop.is_set():
+            error = "closed without a sample"
+            connection = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+            self._connections[container_name] = connection
+            try:
+                connection.request("GET", f"/containers/{container_name}/stats?stream=1")
+                response = connection.getresponse()
+                if response.status != 200:
+                    error = f"returned {response.status}"
+                    response.read()
+                else:
+                    for line in iter(response.readline, b""):
+                        if self._stop.is_set():
+                            break
+                        if line.strip():
+                            self._latest[container_name] = (time.monotonic(), json.loads(line))
+                            error = None
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                error = f"failed: {e}"
+            finally:
+                connection.close()
+                # The last sample stops describing the container once its stream is gone
+                self._latest.pop(container_name, None)
+                self._connections.pop(container_name, None)
+            if self._stop.is_set():
+                break
+
+            if error is None:
+                if failures:
+                    self.logger.info(f"Stats stream for {container_name} recovered")
+                failures, delay = 0, self.reconnect_delay
+            else:
+                failures += 1
+                # Polling covers the container meanwhile; don't flood the log with retries
+                log = self.logger.warning if failures == 1 else self.logger.debug
+                log(f"Stats stream for {container_name} {error}; retrying with backoff")
+            self._stop.wait(delay)
+            if error is not None:
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _inspect(self, container_name: str) -> Tuple[str, str]:
+        """Return (status, started_at), refreshing the cache when it expires."""
+        cached = self._inspect_cache.get(container_name)
+        if cached and time.monotonic() - cached[0] < self.inspect_ttl:
+            return cached[1], cached[2]
+
+        data = self.api_get(f"/containers/{container_name}/json")
+        if not data:
+            return "unknown", ""
+        state = data.get("State", {})
+        status, started_at = state.get("Status", "unknown"), state.get("StartedAt", "")
+        self._inspect_cache[container_name] = (time.monotonic(), status, started_at)
+        return status, started_at
+
+    def collect(self, container_name: str) -> Optional["ContainerMetrics"]:
+        """Return metrics from the latest streamed sample, if it is still fresh."""
+        latest = self._latest.get(container_name)
+        if latest is None:
+            return None
+        received_at, stats = latest
+        if time.monotonic() - received_at > self.stale_after:
+            return None
+
+        status, started_at = self._inspect(container_name)
+        return metrics_from_docker_stats(container_name, stats, status, started_at)
+
+
+class CgroupV2Collector:
+    """Collect metrics straight from cgroup v2 and /proc, without Docker.
+
+    Targets map a container name to ``(cgroup_dir, proc_dir)``; for
+    in-container self-monitoring that is ``("/sys/fs/cgroup", "/proc")``. The
+    stat files are opened once in ``start`` and re-read with ``os.pread``, and
+    values are sliced out of the raw bytes instead of splitting whole files,
+    which keeps a sample well under a millisecond.
+    """
+
+    FILES = ("cpu.stat", "memory.current", "memory.max", "memory.stat", "io.stat", "pids.current")
+    READ_SIZE = 65536
+
+    def __init__(self, targets: Dict[str, Tuple[str, str]]):
+        self.targets = targets
+        self.containers = list(targets)
+        self._fds: Dict[str, Dict[str, int]] = {}
+        # Per target: (usage_usec, monotonic_ns) of the previous sample
+        self._previous_cpu: Dict[str, Tuple[int, int]] = {}
+        self._uptime_offset: Dict[str, float] = {}
+        self._host_memory_bytes = 0
+
+    def start(self) -> None:
+        """Open the cgroup and /proc files of every target."""
+        for name, (cgroup_dir, proc_dir) in self.targets.items():
+            fds = {}
+            for filename in self.FILES:
+                try:
+                    fds[filename] = os.open(os.path.join(cgroup_dir, filename), os.O_RDONLY)
+                except OSError:
+                    pass  # e.g. io.stat is missing when the io controller is disabled
+            try:
+                fds["net/dev"] = os.open(os.path.join(proc_dir, "net", "dev"), os.O_RDONLY)
+            except OSError:
+                pass
+            self._fds[name] = fds
+            self._uptime_offset[name] = self._read_uptime_offset(proc_dir)
+            if not self._host_memory_bytes:
+                self._host_memory_bytes = self._read_host_memory(proc_dir)
+
+    def stop(self) -> None:
+        """Close all open files."""
+        for fds in self._fds.values():
+            for fd in fds.values():
+                os.close(fd)
+        self._fds = {}
+
+    def collect(self, container_name: str) -> Optional[ContainerMetrics]:
+        """Sample one target's cgroup counters."""
+        fds = self._fds.get(container_name)
+        if fds is None:
+            return None
+
+        now_ns = time.monotonic_ns()
+        usage_usec = self._stat_value(self._read(fds, "cpu.stat"), b"usage_usec ")
+        previous = self._previous_cpu.get(container_name)
+        self._previous_cpu[container_name] = (usage_usec, now_ns)
+        cpu_percent = 0.0
+        if previous is not None and now_ns > previous[1]:
+            # 100% is one fully used core, as reported by docker stats
+            cpu_percent = (usage_usec - previous[0]) * 1000 / (now_ns - previous[1]) * 100
+
+        memory_current = self._int(self._read(fds, "memory.current"))
+        memory_max = self._read(fds, "memory.max")
+        memory_limit = (
+            self._int(memory_max) if memory_max[:1].isdigit() else self._host_memory_bytes
+        )
+        inactive_file = self._stat_value(self._read(fds, "memory.stat"), b"inactive_file ")
+        memory_used = max(memory_current - inactive_file, 0)
+
+        io_stat = self._read(fds, "io.stat")
+        network_rx, network_tx = self._net_dev_bytes(self._read(fds, "net/dev"))
+        uptime_offset = self._uptime_offset.get(container_name, 0.0)
+
+        return ContainerMetrics(
+            timestamp=datetime.now().isoformat(),
+            container_name=container_name,
+            cpu_percent=round(cpu_percent, 2),
+            memory_usage_mb=memory_used / BYTES_PER_MB,
+            memory_percent=round(memory_used / memory_limit * 100, 2) if memory_limit else 0.0,
+            memory_limit_mb=memory_limit / BYTES_PER_MB,
+            network_rx_mb=network_rx / BYTES_PER_MB,
+            network_tx_mb=network_tx / BYTES_PER_MB,
+            block_read_mb=self._sum_values(io_stat, b"rbytes=") / BYTES_PER_MB,
+            block_write_mb=self._sum_values(io_stat, b"wbytes=") / BYTES_PER_MB,
+            pids=self._int(self._read(fds, "pids.current")),
+            status="running",
+            uptime_seconds=int(uptime_offset + now_ns / 1e9) if uptime_offset else 0,
+        )
+
+    def _read(self, fds: Dict[str, int], filename: str) -> bytes:
+        fd = fds.get(filename)
+        return os.pread(fd, self.READ_SIZE, 0) if fd is not None else b""
+
+    @staticmethod
+    def _int(data: bytes) -> int:
+        try:
+            return int(data)
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def _stat_value(data: bytes, key: bytes) -> int:
+        """Value of a ``key value`` line in a flat-keyed cgroup file."""
+        start = data.find(key)
+        while start > 0 and data[start - 1] != 0x0A:
+            start = data.find(key, start + 1)
+        if start < 0:
+            return 0
+        end = data.find(b"\n", start)
+        return int(data[start + len(key) : end if end >= 0 else len(data)])
+
+    @staticmethod
+    def _sum_values(data: bytes, key: bytes) -> int:
+        """Sum every ``key=value`` occurrence (io.stat has one line per device)."""
+        total = 0
+        start = data.find(key)
+        while start >= 0:
+            start += len(key)
+            end = start
+            while end < len(data) and 0x30 <= data[end] <= 0x39:
+                end += 1
+            total += int(data[start:end])
+            start = data.find(key, end)
+        return total
+
+    @staticmethod
+    def _net_dev_bytes(data: bytes) -> Tuple[int, int]:
+        """Total received and transmitted bytes over non-loopback interfaces."""
+        rx = tx = 0
+        for line in data.splitlines()[2:]:
+            interface, _, counters = line.partition(b":")
+            if interface.strip() == b"lo":
+                continue
+            values = counters.split()
+            if len(values) >= 9:
+                rx += int(values[0])
+                tx += int(values[8])
+        return rx, tx
+
+    @staticmethod
+    def _read_uptime_offset(proc_dir: str) -> float:
+        """Offset that turns time.monotonic() into the uptime of the target's PID 1."""
+        try:
+            with open(os.path.join(proc_dir, "uptime"), "rb") as f:
+                system_uptime = float(f.read().split()[0])
+            with open(os.path.join(proc_dir, "1", "stat"), "rb") as f:
+                # Field 22 (starttime) counts clock ticks since boot; skip past "(comm)"
+                fields_after_comm = f.read().rsplit(b")", 1)[1].split()
+            started = int(fields_after_comm[19]) / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError):
+            return 0.0
+        return system_uptime - started - time.monotonic()
+
+    @staticmethod
+    def _read_host_memory(proc_dir: str) -> int:
+        """MemTotal in bytes, used as the limit when memory.max is "max"."""
+        try:
+            with open(os.path.join(proc_dir, "meminfo"), "rb") as f:
+                for line in f:
+                    if line.startswith(b"MemTotal:"):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
+        return 0
+
+
+def metrics_from_docker_stats(
+    container_name: str, stats: Dict, status: str, started_at: str
+) -> ContainerMetrics:
+    """Convert a Docker Engine API stats object to ContainerMetrics (as ``docker stats`` does)."""
+    cpu_stats = stats.get("cpu_stats", {})
+    precpu_stats = stats.get("precpu_stats", {})
+    cpu_delta = cpu_stats.get("cpu_usage", {}).get("total_usage", 0) - precpu_stats.get(
+        "cpu_usage", {}
+    ).get("total_usage", 0)
+    system_delta = cpu_stats.get("system_cpu_usage", 0) - precpu_stats.get("system_cpu_usage", 0)
+    online_cpus = cpu_stats.get("online_cpus") or len(
+        cpu_stats.get("cpu_usage", {}).get("percpu_usage") or []
+    ) or 1
+    cpu_percent = cpu_delta / system_delta * online_cpus * 100 if cpu_delta > 0 and system_delta > 0 else 0.0
+
+    memory_stats = stats.get("memory_stats", {})
+    memory_detail = memory_stats.get("stats", {})
+    # Page cache is excluded like the docker CLI does (cgroup v1 "cache", v2 "inactive_file")
+    cache = memory_detail.get("cache", memory_detail.get("inactive_file", 0))
+    memory_used = max(memory_stats.get("usage", 0) - cache, 0)
+    memory_limit = memory_stats.get("limit", 0)
+    memory_percent = memory_used / memory_limit * 100 if memory_limit else 0.0
+
+    networks = stats.get("networks") or {}
+    network_rx = sum(n.get("rx_bytes", 0) for n in networks.values())
+    network_tx = sum(n.get("tx_bytes", 0) for n in networks.values())
+
+    block_read = block_write = 0
+    for entry in (stats.get("blkio_stats") or {}).get("io_service_bytes_recursive") or []:
+        op = entry.get("op", "").lower()
+        if op == "read":
+            block_read += entry.get("value", 0)
+        elif op == "write":
+            block_write += entry.get("value", 0)
+
+    return ContainerMetrics(
+        timestamp=datetime.now().isoformat(),
+        container_name=container_name,
+        cpu_percent=round(cpu_percent, 2),
+        memory_usage_mb=memory_used / BYTES_PER_MB,
+        memory_percent=round(memory_percent, 2),
+        memory_limit_mb=memory_limit / BYTES_PER_MB,
+        network_rx_mb=network_rx / BYTES_PER_MB,
+        network_tx_mb=network_tx / BYTES_PER_MB,
+        block_read_mb=block_read / BYTES_PER_MB,
+        block_write_mb=block_write / BYTES_PER_MB,
+        pids=(stats.get("pids_stats") or {}).get("current", 0),
+        status=status,
+        uptime_seconds=calculate_uptime(started_at) if started_at else 0,
+    )
+
+
+# Numeric fields persisted by MetricsStore (the monotonic clock is meaningless across runs)
+STORE_FIELDS = tuple(name for name in NUMERIC_FIELDS if name != "sampled_at")
+
+ROLLUP_RESOLUTIONS = {"1m": 60, "1h": 3600}
+
+
+class MetricsStore:
+    """Append-only SQLite (WAL mode) time-series store for container metrics.
+
+    Samples are buffered and written in batches. Each flush also folds the
+    batch into 1m and 1h rollups (count/sum/min/max per metric), so long
+    ranges can be read without touching raw samples. Retention is applied per
+    resolution (seconds; ``None`` keeps data forever).
+
+    Writes run on a dedicated writer thread with its own connection, so
+    ``append`` never blocks the sampling loop on SQLite; ``connection`` is used
+    for reads. ``flush`` waits for all queued writes.
+    """
+
+    DEFAULT_RETENTION = {"raw": 2 * 86400, "1m": 30 * 86400, "1h": 365 * 86400}
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        retention: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention = {**self.DEFAULT_RETENTION, **(retention or {})}
+        self._pending: List[Tuple] = []
+        self._last_flush = time.monotonic()
+        self._last_retention = 0.0
+        self.logger = logging.getLogger(__name__)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(f"{name} REAL" for name in STORE_FIELDS)
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS samples (ts REAL NOT NULL, container TEXT NOT NULL, status TEXT, {columns})"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS samples_container_ts ON samples (container, ts)"
+            )
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS rollups (
+                    resolution INTEGER NOT NULL,
+                    container TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    bucket REAL NOT NULL,
+                    count INTEGER NOT NULL,
+                    sum REAL NOT NULL,
+                    min REAL NOT NULL,
+                    max REAL NOT NULL,
+                    PRIMARY KEY (resolution, container, metric, bucket)
+                )"""
+            )
+
+        # A single worker keeps writes ordered; its connection is only used there
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metrics-store")
+        self._write_connection = sqlite3.connect(path, check_same_thread=False)
+        self._write_connection.execute("PRAGMA synchronous=NORMAL")
+
+    def append(self, metrics: ContainerMetrics) -> None:
+        """Buffer a sample, flushing when the batch is full or due."""
+        ts = datetime.fromisoformat(metrics.timestamp).timestamp()
+        self._pending.append(
+            (ts, metrics.container_name, metrics.status)
+            + tuple(getattr(metrics, name) for name in STORE_FIELDS)
+        )
+        if (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._submit().add_done_callback(self._log_write_error)
+
+    def flush(self) -> None:
+        """Write buffered samples and wait until every queued write is done."""
+        self._submit().result()
+
+    def _submit(self) -> "Future[None]":
+        """Hand the buffered samples to the writer thread."""
+        self._last_flush = time.monotonic()
+        rows, self._pending = self._pending, []
+        apply_retention = self._last_flush - self._last_retention >= 60
+        if apply_retention:
+            self._last_retention = self._last_flush
+        return self._writer.submit(self._write, rows, apply_retention)
+
+    def _log_write_error(self, future: "Future[None]") -> None:
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Writing metrics to {self.path} failed: {error}")
+
+    def _write(self, rows: List[Tuple], apply_retention: bool) -> None:
+        """Write samples and their rollups in one transaction (writer thread)."""
+        if apply_retention:
+            self._delete_expired(time.time())
+        if not rows:
+            return
+
+        # Pre-aggregate the batch so each rollup bucket is upserted once
+        partials: Dict[Tuple[int, str, str, float], List[float]] = {}
+        for row in rows:
+            ts, container = row[0], row[1]
+            for resolution in ROLLUP_RESOLUTIONS.values():
+                bucket = ts - ts % resolution
+                for name, value in zip(STORE_FIELDS, row[3:]):
+                    partial = partials.get((resolution, container, name, bucket))
+                    if partial is None:
+                        partials[(resolution, container, name, bucket)] = [1, value, value, value]
+                    else:
+                        partial[0] += 1
+                        partial[1] += value
+                        partial[2] = min(partial[2], value)
+                        partial[3] = max(partial[3], value)
+
+        placeholders = ", ".join("?" * (len(STORE_FIELDS) + 3))
+        connection = self._write_connection
+        with connection:
+            connection.executemany(f"INSERT INTO samples VALUES ({placeholders})", rows)
+            connection.executemany(
+                """INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (resolution, container, metric, bucket) DO UPDATE SET
+                    count = count + excluded.count,
+                    sum = sum + excluded.sum,
+                    min = MIN(min, excluded.min),
+                    max = MAX(max, excluded.max)""",
+                [key + tuple(values) for key, values in partials.items()],
+            )
+
+    def apply_retention(self, now: Optional[float] = None) -> None:
+        """Delete samples and rollups older than their resolution's retention."""
+        now = time.time() if now is None else now
+        self._last_retention = time.monotonic()
+        self._writer.submit(self._delete_expired, now).result()
+
+    def _delete_expired(self, now: float) -> None:
+        connection = self._write_connection
+        with connection:
+            if self.retention.get("raw") is not None:
+                connection.execute(
+                    "DELETE FROM samples WHERE ts < ?", (now - self.retention["raw"],)
+                )
+            for name, resolution in ROLLUP_RESOLUTIONS.items():
+                if self.retention.get(name) is not None:
+                    connection.execute(
+                        "DELETE FROM rollups WHERE resolution = ? AND bucket < ?",
+                        (resolution, now - self.retention[name]),
+                    )
+
+    def query_range(
+        self, container: str, start: float, end: float, resolution: str = "raw"
+    ) -> List[Dict]:
+        """Return samples (or rollup buckets) for a container in [start, end), oldest first.
+
+        Raw rows map every stored field to its value; rollup rows map each
+        metric to ``{"count", "average", "min", "max"}``. Both carry ``ts``.
+        """
+        if resolution == "raw":
+            cursor = self.connection.execute(
+                f"SELECT ts, status, {', '.join(STORE_FIELDS)} FROM samples "
+                "WHERE container = ? AND ts >= ? AND ts < ? ORDER BY ts",
+                (container, start, end),
+            )
+            return [
+                {"ts": row[0], "status": row[1], **dict(zip(STORE_FIELDS, row[2:]))}
+                for row in cursor
+            ]
+
+        buckets: Dict[float, Dict] = {}
+        cursor = self.connection.execute(
+            "SELECT bucket, metric, count, sum, min, max FROM rollups "
+            "WHERE resolution = ? AND container = ? AND bucket >= ? AND bucket < ? ORDER BY bucket",
+            (self._resolution_seconds(resolution), container, start, end),
+        )
+        for bucket, metric, count, total, minimum, maximum in cursor:
+            buckets.setdefault(bucket, {"ts": bucket})[metric] = {
+                "count": count,
+                "average": total / count,
+                "min": minimum,
+                "max": maximum,
+            }
+        return list(buckets.values())
+
+    def aggregate(
+        self, container: str, metric: str, start: float, end: float, resolution: str = "raw"
+    ) -> Dict[str, float]:
+        """Return count/average/min/max of one metric over [start, end)."""
+        if metric not in STORE_FIELDS:
+            raise ValueError(f"Unknown metric: {metric}")
+
+        if resolution == "raw":
+            row = self.connection.execute(
+                f"SELECT COUNT({metric}), AVG({metric}), MIN({metric}), MAX({metric}) "
+                "FROM samples WHERE container = ? AND ts >= ? AND ts < ?",
+                (container, start, end),
+            ).fetchone()
+        else:
+            row = self.connection.execute(
+                "SELECT SUM(count), SUM(sum) / SUM(count), MIN(min), MAX(max) FROM rollups "
+                "WHERE resolution = ? AND container = ? AND metric = ? AND bucket >= ? AND bucket < ?",
+                (self._resolution_seconds(resolution), container, metric, start, end),
+            ).fetchone()
+        return {"count": row[0] or 0, "average": row[1], "min": row[2], "max": row[3]}
+
+    def close(self) -> None:
+        """Flush pending samples and close the database."""
+        try:
+            self.flush()
+        finally:
+            self._writer.shutdown(wait=True)
+            self._write_connection.close()
+            self.connection.close()
+
+    def _resolution_seconds(self, resolution: str) -> int:
+        if resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        return ROLLUP_RESOLUTIONS[resolution]
+
+
+# Export format -> file extension
+EXPORT_FORMATS = {"csv": "csv", "ndjson": "jsonl", "parquet": "parquet"}
+
+
+class StreamingExporter:
+    """Appends dataclass records to CSV, NDJSON or Parquet files during a run.
+
+    Records are buffered as tuples and written every ``batch_size`` records or
+    ``flush_interval`` seconds, so the export is complete when monitoring
+    stops. With ``max_bytes`` or ``rotate_interval`` set, output rolls over to
+    numbered part files (``<stem>-0001.csv``, ...) once the current file
+    reaches that size (bytes) or age (seconds).
+    """
+
+    def __init__(
+        self,
+        record_type: type,
+        directory: Union[str, Path],
+        stem: str,
+        fmt: str = "csv",
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        max_bytes: Optional[int] = None,
+        rotate_interval: Optional[float] = None,
+    ):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+
+        self.fieldnames = [f.name for f in fields(record_type)]
+        self.directory = Path(directory)
+        self.stem = stem
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.files: List[Path] = []
+        self.records_written = 0
+
+        self._getter = operator.attrgetter(*self.fieldnames)
+        self._pending: List[Tuple] = []
+        self._last_flush = time.monotonic()
+        self._file = None
+        self._writer = None
+        self._opened_at = 0.0
+        self._schema = None
+        if fmt == "parquet":
+            # Imported here so the monitor doesn't pay for pyarrow unless it's used
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)") from None
+            self._pyarrow = pyarrow
+            types = {float: pyarrow.float64(), int: pyarrow.int64(), str: pyarrow.string()}
+            self._schema = pyarrow.schema(
+                [(f.name, types[f.type]) for f in fields(record_type)]
+            )
+
+    def write(self, record) -> None:
+        """Buffer a record, flushing when the batch is full or due."""
+        self._pending.append(self._getter(record))
+        if (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records to the current file, rotating it if due."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+
+        if self._writer is None:
+            self._open()
+        if self.fmt == "csv":
+            self._writer.writerows(rows)
+            self._file.flush()
+        elif self.fmt == "ndjson":
+            names = self.fieldnames
+            self._file.write("".join(json.dumps(dict(zip(names, row))) + "\n" for row in rows))
+            self._file.flush()
+        else:
+            columns = zip(*rows)
+            self._writer.write_table(
+                self._pyarrow.table(
+                    {name: list(column) for name, column in zip(self.fieldnames, columns)},
+                    schema=self._schema,
+                )
+            )
+        self.records_written += len(rows)
+
+        if (self.max_bytes is not None and self.files[-1].stat().st_size >= self.max_bytes) or (
+            self.rotate_interval is not None
+            and time.monotonic() - self._opened_at >= self.rotate_interval
+        ):
+            self._close_file()
+
+    def close(self) -> None:
+        """Write any buffered records and close the current file."""
+        self.flush()
+        self._close_file()
+
+    def _open(self) -> None:
+        extension = EXPORT_FORMATS[self.fmt]
+        if self.max_bytes is None and self.rotate_interval is None:
+            name = f"{self.stem}.{extension}"
+        else:
+            name = f"{self.stem}-{len(self.files) + 1:04d}.{extension}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / name
+        self.files.append(path)
+        self._opened_at = time.monotonic()
+
+        if self.fmt == "csv":
+            self._file = open(path, "w", newline="")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self.fieldnames)
+        elif self.fmt == "ndjson":
+            self._file = self._writer = open(path, "w")
+        else:
+            self._writer = self._pyarrow.parquet.ParquetWriter(str(path), self._schema)
+
+    def _close_file(self) -> None:
+        if self._writer is None:
+            return
+        if self.fmt == "parquet":
+            self._writer.close()
+        else:
+            self._file.close()
+        self._file = self._writer = None
+
+
+class ThroughputAlarm:
+    """Sustained-throughput detector with hysteresis.
+
+    Fires once the rate has stayed at or above ``threshold`` for
+    ``min_duration`` seconds, and only re-arms after the rate drops below
+    ``threshold * clear_ratio``, so a rate hovering at the threshold doesn't
+    flap.
+    """
+
+    __slots__ = ("threshold", "min_duration", "clear_ratio", "active", "_above_since")
+
+    def __init__(self, threshold: float, min_duration: float, clear_ratio: float):
+        self.threshold = threshold
+        self.min_duration = min_duration
+        self.clear_ratio = clear_ratio
+        self.active = False
+        self._above_since: Optional[float] = None
+
+    def update(self, rate: float, now: float) -> Optional[str]:
+        """Feed one rate sample; returns "raise" or "clear" on a state change."""
+        if self.active:
+            if rate < self.threshold * self.clear_ratio:
+                self.active = False
+                self._above_since = None
+                return "clear"
+            return None
+
+        if rate < self.threshold:
+            self._above_since = None
+            return None
+        if self._above_since is None:
+            self._above_since = now
+        if now - self._above_since >= self.min_duration:
+            self.active = True
+            return "raise"
+        return None
+
+
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+# Dashboard columns as (title, width); cells are padded or truncated to fit
+DASHBOARD_COLUMNS = (
+    ("Container", 20),
+    ("Status", 10),
+    ("CPU%", 6),
+    ("CPU trend", 16),
+    ("Memory", 17),
+    ("Net MB/s", 15),
+    ("Uptime", 8),
+)
+
+
+def sparkline(values, width: int, low: float = 0.0, high: float = 100.0) -> str:
+    """Render the last ``width`` values as block characters, right-aligned.
+
+    Values are scaled between ``low`` and ``high`` and clamped to that range.
+    """
+    values = list(values)[-width:]
+    span = (high - low) or 1.0
+    top = len(SPARK_BLOCKS) - 1
+    blocks = "".join(
+        SPARK_BLOCKS[min(top, max(0, int((value - low) / span * top + 0.5)))] for value in values
+    )
+    return blocks.rjust(width)
+
+
+class TerminalDashboard:
+    """In-place terminal renderer that rewrites only the cells that changed.
+
+    A frame is a list of rows, each a list of ``(text, style)`` cells where
+    ``style`` is an ANSI SGR sequence or "". Cells are placed by the length of
+    the cells before them, so their text must be single-width characters.
+    The first frame clears the screen; later frames move the cursor to each
+    changed cell and overwrite it, all in a single write.
+    """
+
+    RESET = "\x1b[0m"
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self._frame: List[List[Tuple[str, str]]] = []
+        self._full_redraw = True
+        self._active = False
+
+    def invalidate(self) -> None:
+        """Repaint the whole screen next frame, e.g. after log output scrolled it."""
+        self._full_redraw = True
+
+    def render(self, frame: List[List[Tuple[str, str]]]) -> None:
+        """Draw a frame, emitting escape sequences only for changed cells."""
+        out: List[str] = []
+        previous = self._frame
+        if self._full_redraw:
+            # Hide the cursor, home it and clear the screen
+            out.append("\x1b[?25l\x1b[H\x1b[2J")
+            previous = []
+            self._full_redraw = False
+
+        for row_number, row in enumerate(frame, 1):
+            old = previous[row_number - 1] if row_number <= len(previous) else []
+            column = old_column = 1
+            for i, cell in enumerate(row):
+                if i >= len(old) or old[i] != cell or old_column != column:
+                    text, style = cell
+                    out.append(f"\x1b[{row_number};{column}H")
+                    out.append(f"{style}{text}{self.RESET}" if style else text)
+                column += len(cell[0])
+                if i < len(old):
+                    old_column += len(old[i][0])
+            old_width = sum(len(text) for text, _ in old)
+            if column - 1 < old_width:
+                out.append(f"\x1b[{row_number};{column}H\x1b[K")
+
+        for row_number in range(len(frame) + 1, len(previous) + 1):
+            out.append(f"\x1b[{row_number};1H\x1b[2K")
+
+        self._frame = [list(row) for row in frame]
+        if out:
+            # Park the cursor below the frame so other output doesn't overwrite it
+            out.append(f"\x1b[{len(frame) + 1};1H")
+            self.stream.write("".join(out))
+            self.stream.flush()
+            self._active = True
+
+    def close(self) -> None:
+        """Restore the cursor below the last frame."""
+        if self._active:
+            self.stream.write(f"\x1b[{len(self._frame) + 1};1H\x1b[?25h")
+            self.stream.flush()
+            self._active = False
+
+
+class AnomalyDetector:
+    """Online anomaly detector for one metric of one container.
+
+    An exponentially weighted mean and variance give each sample a z-score;
+    after ``warmup`` samples, ``|z| >= z_threshold`` is a spike. With
+    ``trend_threshold`` set, an exponentially weighted least-squares fit of
+    the value over time also flags sustained growth (units per hour), such
+    as a memory leak too slow to ever show up as a spike. The fit's weights
+    decay with elapsed time (``trend_window`` seconds), not sample count, so
+    it spans the same period at any sampling interval; a trend is only
+    reported once a full window has been observed. Updates are O(1).
+    """
+
+    __slots__ = (
+        "alpha",
+        "trend_window",
+        "z_threshold",
+        "warmup",
+        "min_std",
+        "trend_threshold",
+        "count",
+        "mean",
+        "variance",
+        "zscore",
+        "slope",
+        "_origin",
+        "_last",
+        "_sums",
+    )
+
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        trend_window: float = 1800.0,
+        z_threshold: float = 4.0,
+        warmup: int = 30,
+        min_std: float = 1.0,
+        trend_threshold: Optional[float] = None,
+    ):
+        self.alpha = alpha
+        self.trend_window = trend_window
+        self.z_threshold = z_threshold
+        self.warmup = warmup
+        self.min_std = min_std
+        self.trend_threshold = trend_threshold
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self.zscore = 0.0
+        self.slope = 0.0
+        self._origin = 0.0
+        self._last = 0.0
+        # Decayed sums of weight, t, x, t*t and t*x for the trend fit
+        self._sums = [0.0] * 5
+
+    def update(self, value: float, now: float) -> Optional[str]:
+        """Feed one sample; returns "spike" or "trend" if it is anomalous."""
+        if not self.count:
+            self.mean = value
+            self._origin = self._last = now
+        self.count += 1
+
+        diff = value - self.mean
+        self.zscore = diff / max(self.variance**0.5, self.min_std)
+        self.mean += self.alpha * diff
+        self.variance = (1 - self.alpha) * (self.variance + self.alpha * diff * diff)
+
+        if self.trend_threshold is not None:
+            t = (now - self._origin) / 3600
+            decay = math.exp(-max(now - self._last, 0.0) / self.trend_window)
+            self._last = now
+            sums = self._sums
+            for i, term in enumerate((1.0, t, value, t * t, t * value)):
+                sums[i] = sums[i] * decay + term
+            weight, sum_t, sum_x, sum_tt, sum_tx = sums
+            denominator = weight * sum_tt - sum_t * sum_t
+            self.slope = (weight * sum_tx - sum_t * sum_x) / denominator if denominator > 0 else 0.0
+
+        if self.count <= self.warmup:
+            return None
+        if abs(self.zscore) >= self.z_threshold:
+            return "spike"
+        if (
+            self.trend_threshold is not None
+            and now - self._origin >= self.trend_window
+            and self.slope >= self.trend_threshold
+        ):
+            return "trend"
+        return None
+
+
+class FanInAggregator:
+    """HTTP endpoint receiving sample batches pushed by ``MetricsPushAgent``.
+
+    Agents POST ``{"host", "fields", "samples"}`` to ``/ingest``, where
+    ``samples`` are rows of values in ``fields`` order. Every row is checked
+    and converted to ``ContainerMetrics`` on arrival, so a malformed batch is
+    refused with 400 as a whole. Accepted batches wait in a bounded queue
+    until the monitor drains them; when the queue (or one host's share of it)
+    is full the batch is refused with 503 and ``Retry-After`` so the agent
+    backs off. Each request is served on its own
+    thread, so a slow host only delays itself.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_pending: int = 50000,
+        max_pending_per_host: int = 5000,
+        retry_after: float = 1.0,
+    ):
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.max_pending_per_host = max_pending_per_host
+        self.retry_after = retry_after
+        self.accepted: Dict[str, int] = {}
+        self.rejected: Dict[str, int] = {}
+        self.logger = logging.getLogger(__name__)
+
+        self._field_types = {f.name: f.type for f in fields(ContainerMetrics)}
+        self._required_fields = {
+            f.name
+            for f in fields(ContainerMetrics)
+            if f.default is MISSING and f.default_factory is MISSING
+        }
+        self._pending: Deque[List[ContainerMetrics]] = deque()
+        self._pending_total = 0
+        self._pending_per_host: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The bound (host, port), once started."""
+        if self._server is None:
+            return self.host, self.port
+        return self._server.server_address[:2]
+
+    def start(self) -> None:
+        """Start serving ``/ingest`` from a daemon thread."""
+        aggregator = self
+
+        class IngestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.path != "/ingest":
+                    self._reply(404)
+                    return
+                try:
+                    payload = json.loads(body)
+                    accepted = aggregator.offer(
+                        str(payload["host"]), list(payload["fields"]), list(payload["samples"])
+                    )
+                except (ValueError, KeyError, TypeError):
+                    self._reply(400)
+                    return
+                if accepted:
+                    self._reply(204)
+                else:
+                    self._reply(503, {"Retry-After": f"{aggregator.retry_after:g}"})
+
+            def _reply(self, status: int, headers: Optional[Dict[str, str]] = None) -> None:
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), IngestHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fan-in-aggregator", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"Aggregator listening on {self.address[0]}:{self.address[1]}")
+
+    def stop(self) -> None:
+        """Stop accepting batches."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def offer(self, host: str, names: List[str], rows: List[List]) -> bool:
+        """Validate and queue a batch from one host; returns False if it must be retried later.
+
+        Raises:
+            ValueError: If the batch names unknown fields, lacks a required one,
+                or has a row that doesn't convert to ContainerMetrics
+        """
+        unknown = set(names) - self._field_types.keys()
+        missing = self._required_fields - set(names)
+        if unknown or missing:
+            raise ValueError(
+                f"Batch fields don't match ContainerMetrics "
+                f"(unknown: {sorted(unknown)}, missing: {sorted(missing)})"
+            )
+        types = [self._field_types[name] for name in names]
+        samples = []
+        for row in rows:
+            if len(row) != len(names):
+                raise ValueError("Batch rows don't match the field list")
+            values = {name: _coerce(value, kind) for name, kind, value in zip(names, types, row)}
+            values["container_name"] = f"{host}/{values['container_name']}"
+            samples.append(ContainerMetrics(**values))
+
+        with self._lock:
+            host_pending = self._pending_per_host.get(host, 0)
+            if (
+                self._pending_total + len(rows) > self.max_pending
+                or host_pending + len(rows) > self.max_pending_per_host
+            ):
+                self.rejected[host] = self.rejected.get(host, 0) + len(rows)
+                return False
+            self._pending.append(samples)
+            self._pending_total += len(rows)
+            self._pending_per_host[host] = host_pending + len(rows)
+            self.accepted[host] = self.accepted.get(host, 0) + len(rows)
+        return True
+
+    def drain(self) -> List[ContainerMetrics]:
+        """Take every queued sample; containers are named ``<host>/<container>``."""
+        with self._lock:
+            batches, self._pending = self._pending, deque()
+            self._pending_total = 0
+            self._pending_per_host.clear()
+
+        # Batches were validated and converted by offer, so nothing here can fail
+        return [sample for batch in batches for sample in batch]
+
+
+def _coerce(value: object, kind: type) -> object:
+    """Convert a pushed JSON value to a ContainerMetrics field type."""
+    if value is None or isinstance(value, (list, dict)):
+        raise ValueError(f"Expected {kind.__name__}, got {value!r}")
+    if kind is int and isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"Expected int, got {value!r}")
+    return kind(value)
+
+
+class MetricsPushAgent:
+    """Forwards samples to a ``FanInAggregator`` in compact batches.
+
+    ``write`` only appends to a bounded buffer (dropping the oldest sample
+    when it is full), so sampling never waits on the network. A sender thread
+    posts a batch every ``batch_size`` samples or ``flush_interval`` seconds
+    over a keep-alive connection. While the aggregator refuses a batch or is
+    unreachable the thread keeps it and retries with exponential backoff,
+    honouring ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        host: Optional[str] = None,
+        batch_size: int = 200,
+        flush_interval: float = 5.0,
+        max_buffer: int = 20000,
+        timeout: float = 5.0,
+        max_backoff: float = 30.0,
+    ):
+        parts = urllib.parse.urlsplit(url)
+        self.address = (parts.hostname or "127.0.0.1", parts.port or 80)
+        self.path = parts.path or "/ingest"
+        self.host = host or socket.gethostname()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.fieldnames = [f.name for f in fields(ContainerMetrics)]
+        self.sent = 0
+        self.dropped = 0
+        self.logger = logging.getLogger(__name__)
+
+        self._getter = operator.attrgetter(*self.fieldnames)
+        self._buffer: Deque[Tuple] = deque(maxlen=max_buffer)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._connection: Optional[http.client.HTTPConnection] = None
+
+    def start(self) -> None:
+        """Start the sender thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-push", daemon=True)
+        self._thread.start()
+
+    def write(self, metrics: ContainerMetrics) -> None:
+        """Queue a sample for the next batch."""
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(self._getter(metrics))
+            if len(self._buffer) >= self.batch_size:
+                self._wake.set()
+
+    def close(self) -> None:
+        """Send what is buffered (one attempt per batch) and stop the sender."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout * 2)
+            self._thread = None
+        if self._connection is not None:
+            self._connection.close()
+        # Whatever the sender didn't get to (or gave up on) is lost
+        with self._lock:
+            self.dropped += len(self._buffer)
+            self._buffer.clear()
+
+    def _run(self) -> None:
+        batch: List[Tuple] = []
+        failures = 0
+        delay = self.flush_interval
+        while True:
+            self._wake.wait(delay)
+            self._wake.clear()
+            stopping = self._stop.is_set()
+            delay = self.flush_interval
+            while True:
+                if not batch:
+                    with self._lock:
+                        count = min(self.batch_size, len(self._buffer))
+                        batch = [self._buffer.popleft() for _ in range(count)]
+                if not batch:
+                    break
+                retry_after = self._send(batch)
+                if retry_after is not None:
+                    failures += 1
+                    delay = retry_after or min(self.max_backoff, 0.5 * 2**failures)
+                    break
+                failures = 0
+                batch = []
+            if stopping:
+                with self._lock:
+                    self.dropped += len(batch)
+                return
+
+    def _send(self, batch: List[Tuple]) -> Optional[float]:
+        """POST one batch.
+
+        Returns:
+            None once the batch is done with, otherwise the server's
+            ``Retry-After`` delay (0.0 when it gave none) before retrying
+        """
+        body = json.dumps(
+            {"host": self.host, "fields": self.fieldnames, "samples": batch},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        try:
+            if self._connection is None:
+                self._connection = http.client.HTTPConnection(*self.address, timeout=self.timeout)
+            self._connection.request(
+                "POST", self.path, body, {"Content-Type": "application/json"}
+            )
+            response = self._connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException) as e:
+            self.logger.warning(f"Pushing metrics to {self.address[0]}:{self.address[1]} failed: {e}")
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            return 0.0
+
+        if response.status == 503:
+            return float(response.getheader("Retry-After") or 0.0)
+        if response.status >= 400:
+            # Retrying a malformed batch won't help
+            self.logger.error(f"Aggregator rejected a batch of {len(batch)} samples: {response.status}")
+            with self._lock:
+                self.dropped += len(batch)
+        else:
+            self.sent += len(batch)
+        return None
+
+
 class ContainerPerformanceMonitor:
     """Advanced container performance monitoring system."""
 
-    def __init__(self, containers: List[str], log_dir: str = ".logs"):
+    def __init__(
+        self,
+        containers: List[str],
+        log_dir: str = ".logs",
+        collector: Optional[Union[DockerStatsStreamCollector, CgroupV2Collector]] = None,
+        history_size: int = 17280,
+        alert_history_size: int = 10000,
+        store: Optional[MetricsStore] = None,
+        metrics_exporter: Optional[StreamingExporter] = None,
+        alerts_exporter: Optional[StreamingExporter] = None,
+        aggregator: Optional[FanInAggregator] = None,
+        forwarder: Optional[MetricsPushAgent] = None,
+    ):
         self.containers = containers
+        # Optional streaming collector; without one, each sample shells out to the docker CLI
+        self.collector = collector
+        # Optional on-disk time-series store that survives restarts
+        self.store = store
+        # Optional exporters that write samples and alerts as they arrive
+        self.metrics_exporter = metrics_exporter
+        self.alerts_exporter = alerts_exporter
+        # Fan-in: samples pushed by remote agents, or push local samples to an aggregator
+        # instead of processing them here
+        self.aggregator = aggregator
+        self.forwarder = forwarder
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
 
@@ -74,11 +1732,45 @@ class ContainerPerformanceMonitor:
             "memory_warning": 85.0,
             "disk_io_warning": 100.0,  # MB/s
             "network_io_warning": 50.0,  # MB/s
+            "io_min_duration": 30.0,  # seconds above the I/O threshold before alerting
+            "io_clear_ratio": 0.8,  # I/O alerts re-arm below threshold * ratio
+            "anomaly_zscore": 4.0,  # EWMA standard deviations from the baseline
+            "anomaly_warmup": 30,  # samples per container before anomaly detection starts
+            "memory_trend_warning": 5.0,  # memory percentage points per hour
+            "memory_trend_window": 1800.0,  # seconds of history the growth trend is fitted over
+            "anomaly_cooldown": 300.0,  # seconds before the same anomaly alert repeats
+            "alert_cooldown": 300.0,  # same for threshold alerts during a sustained breach
         }
 
-        # Historical data storage
-        self.metrics_history: List[ContainerMetrics] = []
-        self.alerts_history: List[PerformanceAlert] = []
+        # Real-time dashboard, redrawn in place each tick
+        self.dashboard = TerminalDashboard()
+
+        # Containers whose collection is still running in the executor, possibly
+        # past its timeout; they are skipped until it returns
+        self._collecting: Set[str] = set()
+
+        # Previous sample per container for rate calculation, and I/O alarm state
+        self._previous_samples: Dict[str, ContainerMetrics] = {}
+        self._io_alarms: Dict[Tuple[str, str], ThroughputAlarm] = {}
+
+        # Anomaly detectors per (container, metric), the anomalies currently
+        # in progress, and the last emission time per alert for cooldowns
+        self._detectors: Dict[Tuple[str, str], AnomalyDetector] = {}
+        self._active_anomalies: Dict[Tuple[str, str], str] = {}
+        self._last_alert_at: Dict[Tuple[str, str, str, str], float] = {}
+        self.alerts_suppressed = 0
+
+        # Historical data storage, bounded so long-running monitors use constant memory
+        # (history_size samples per container; 17280 is one day at a 5s interval)
+        self.metrics_history = MetricHistory(history_size)
+        self.alerts_history: Deque[PerformanceAlert] = deque(maxlen=alert_history_size)
+        self.alerts_generated = 0
+
+        # Report aggregates, updated as samples arrive so reporting is O(containers)
+        self.container_stats: Dict[str, Dict[str, StreamingStats]] = {}
+        self.alert_counts: Dict[str, int] = {}
+        self.first_sample_at: Optional[float] = None
+        self.last_sample_at: Optional[float] = None
 
         # Setup logging
         self.setup_logging()
@@ -203,8 +1895,6 @@ class ContainerPerformanceMonitor:
             return 0.0
 
         # Extract number and unit
-        import re
-
         match = re.match(r"([0-9.]+)([A-Za-z]+)", size_str)
         if not match:
             return 0.0
@@ -229,13 +1919,17 @@ class ContainerPerformanceMonitor:
 
     def _calculate_uptime(self, started_at: str) -> int:
         """Calculate container uptime in seconds."""
-        try:
-            # Parse Docker timestamp format
-            start_time = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
-            now = datetime.now(start_time.tzinfo)
-            return int((now - start_time).total_seconds())
-        except Exception:
-            return 0
+        return calculate_uptime(started_at)
+
+    def collect_metrics(self, container_name: str) -> Optional[ContainerMetrics]:
+        """Get metrics from the configured collector, falling back to the docker CLI."""
+        if self.collector is not None:
+            metrics = self.collector.collect(container_name)
+            if metrics is None and isinstance(self.collector, DockerStatsStreamCollector):
+                # No fresh streamed sample (stream closed or stalled): poll instead
+                return self.get_container_stats(container_name)
+            return metrics
+        return self.get_container_stats(container_name)
 
     def check_performance_thresholds(
         self, metrics: ContainerMetrics
@@ -301,49 +1995,206 @@ class ContainerPerformanceMonitor:
 
         return alerts
 
-    def display_real_time_metrics(self, metrics: List[ContainerMetrics]) -> None:
-        """Display real-time metrics in a formatted table."""
-        os.system("clear" if os.name == "posix" else "cls")
-
-        print("╔" + "═" * 98 + "╗")
-        print(
-            "║" + " " * 30 + "LUMIN.AI Container Performance Monitor" + " " * 30 + "║"
-        )
-        print("╠" + "═" * 98 + "╣")
+    def compute_io_rates(self, metrics: ContainerMetrics) -> None:
+        """Fill in MB/s rates from the previous sample of the same container."""
+        previous = self._previous_samples.get(metrics.container_name)
+        self._previous_samples[metrics.container_name] = metrics
+        if previous is None:
+            return
 
-        if not metrics:
-            print("║" + " " * 40 + "No container data available" + " " * 40 + "║")
-            print("╚" + "═" * 98 + "╝")
+        elapsed = metrics.sampled_at - previous.sampled_at
+        if elapsed <= 0:
             return
+        for counter, rate_field in RATE_FIELDS.items():
+            delta = getattr(metrics, counter) - getattr(previous, counter)
+            # Counters reset when a container restarts; skip that interval
+            setattr(metrics, rate_field, delta / elapsed if delta > 0 else 0.0)
 
-        # Header
-        print(
-            f"║ {'Container':<20} {'Status':<10} {'CPU%':<8} {'Memory':<15} {'Network I/O':<15} {'Uptime':<12} ║"
+    def check_io_throughput(self, metrics: ContainerMetrics) -> List[PerformanceAlert]:
+        """Alert on disk and network throughput sustained above the MB/s thresholds."""
+        alerts = []
+        checks = (
+            (
+                "disk",
+                "HIGH_DISK_IO",
+                "block_io_mb_s",
+                metrics.block_read_rate_mb_s + metrics.block_write_rate_mb_s,
+                self.thresholds["disk_io_warning"],
+            ),
+            (
+                "network",
+                "HIGH_NETWORK_IO",
+                "network_io_mb_s",
+                metrics.network_rx_rate_mb_s + metrics.network_tx_rate_mb_s,
+                self.thresholds["network_io_warning"],
+            ),
         )
-        print("╠" + "═" * 98 + "╣")
 
-        for metric in metrics:
-            uptime_str = self._format_uptime(metric.uptime_seconds)
-            memory_str = (
-                f"{metric.memory_usage_mb:.0f}MB ({metric.memory_percent:.1f}%)"
-            )
-            network_str = f"↓{metric.network_rx_mb:.1f}MB ↑{metric.network_tx_mb:.1f}MB"
+        for kind, alert_type, metric_name, rate, threshold in checks:
+            key = (metrics.container_name, kind)
+            alarm = self._io_alarms.get(key)
+            if alarm is None:
+                alarm = self._io_alarms[key] = ThroughputAlarm(
+                    threshold,
+                    self.thresholds["io_min_duration"],
+                    self.thresholds["io_clear_ratio"],
+                )
+
+            transition = alarm.update(rate, metrics.sampled_at)
+            if transition == "raise":
+                alerts.append(
+                    PerformanceAlert(
+                        timestamp=metrics.timestamp,
+                        container_name=metrics.container_name,
+                        alert_type=alert_type,
+                        metric=metric_name,
+                        current_value=rate,
+                        threshold=threshold,
+                        severity="WARNING",
+                        message=f"Sustained {kind} I/O is high: {rate:.1f}MB/s for over {alarm.min_duration:.0f}s",
+                    )
+                )
+            elif transition == "clear":
+                self.logger.info(
+                    f"{metrics.container_name}: {kind} I/O back to normal ({rate:.1f}MB/s)"
+                )
+
+        return alerts
+
+    def check_anomalies(self, metrics: ContainerMetrics) -> List[PerformanceAlert]:
+        """Alert on samples that break from each metric's own recent behaviour.
 
+        One alert is raised per anomaly; it isn't repeated while consecutive
+        samples stay anomalous.
+        """
+        alerts = []
+        for name, min_std in ANOMALY_FIELDS.items():
+            key = (metrics.container_name, name)
+            detector = self._detectors.get(key)
+            if detector is None:
+                detector = self._detectors[key] = AnomalyDetector(
+                    z_threshold=self.thresholds["anomaly_zscore"],
+                    warmup=int(self.thresholds["anomaly_warmup"]),
+                    min_std=min_std,
+                    trend_window=self.thresholds["memory_trend_window"],
+                    trend_threshold=(
+                        self.thresholds["memory_trend_warning"]
+                        if name == "memory_percent"
+                        else None
+                    ),
+                )
+
+            value = getattr(metrics, name)
+            kind = detector.update(value, metrics.sampled_at)
+            if kind is None:
+                self._active_anomalies.pop(key, None)
+                continue
+            if self._active_anomalies.get(key) == kind:
+                continue
+            self._active_anomalies[key] = kind
+
+            if kind == "spike":
+                direction = "above" if detector.zscore > 0 else "below"
+                alerts.append(
+                    PerformanceAlert(
+                        timestamp=metrics.timestamp,
+                        container_name=metrics.container_name,
+                        alert_type="METRIC_ANOMALY",
+                        metric=name,
+                        current_value=value,
+                        threshold=detector.z_threshold,
+                        severity="WARNING",
+                        message=f"{name} is {abs(detector.zscore):.1f} standard deviations {direction} its recent baseline: {value:.1f}",
+                    )
+                )
+            else:
+                alerts.append(
+                    PerformanceAlert(
+                        timestamp=metrics.timestamp,
+                        container_name=metrics.container_name,
+                        alert_type="MEMORY_GROWTH",
+                        metric=name,
+                        current_value=detector.slope,
+                        threshold=detector.trend_threshold,
+                        severity="WARNING",
+                        message=f"Memory usage keeps growing: {detector.slope:.1f}% per hour (now {value:.1f}%)",
+                    )
+                )
+
+        return alerts
+
+    def _should_emit(self, alert: PerformanceAlert, now: float) -> bool:
+        """Apply the per-alert cooldown, counting alerts it suppresses."""
+        if alert.alert_type in ANOMALY_ALERT_TYPES:
+            cooldown = self.thresholds["anomaly_cooldown"]
+        else:
+            cooldown = self.thresholds["alert_cooldown"]
+        if cooldown <= 0:
+            return True
+
+        # Per severity, so escalating to CRITICAL is reported within the cooldown
+        key = (alert.container_name, alert.alert_type, alert.metric, alert.severity)
+        last = self._last_alert_at.get(key)
+        if last is not None and now - last < cooldown:
+            self.alerts_suppressed += 1
+            return False
+        self._last_alert_at[key] = now
+        return True
+
+    def display_real_time_metrics(self, metrics: List[ContainerMetrics]) -> None:
+        """Display real-time metrics, redrawing only the cells that changed."""
+        width = sum(w for _, w in DASHBOARD_COLUMNS) + len(DASHBOARD_COLUMNS) + 1
+        border = "═" * width
+        frame = [
+            [("╔" + border + "╗", "")],
+            [("║" + "LUMIN.AI Container Performance Monitor".center(width) + "║", "")],
+            [("╠" + border + "╣", "")],
+        ]
+
+        if not metrics:
+            frame.append([("║" + "No container data available".center(width) + "║", "")])
+        else:
+            frame.append(self._dashboard_row([title for title, _ in DASHBOARD_COLUMNS]))
+            frame.append([("╠" + border + "╣", "")])
+
+        for metric in metrics:
             # Color code CPU based on usage
-            cpu_color = ""
             if metric.cpu_percent >= self.thresholds["cpu_critical"]:
-                cpu_color = "🔴"
+                cpu_style = "\x1b[31m"
             elif metric.cpu_percent >= self.thresholds["cpu_warning"]:
-                cpu_color = "🟡"
+                cpu_style = "\x1b[33m"
             else:
-                cpu_color = "🟢"
+                cpu_style = "\x1b[32m"
 
-            print(
-                f"║ {metric.container_name:<20} {metric.status:<10} {cpu_color}{metric.cpu_percent:<7.1f} {memory_str:<15} {network_str:<15} {uptime_str:<12} ║"
+            cpu_history = self.metrics_history.recent(
+                metric.container_name, "cpu_percent", DASHBOARD_COLUMNS[3][1]
             )
-
-        print("╚" + "═" * 98 + "╝")
-        print(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            values = [
+                metric.container_name,
+                metric.status,
+                f"{metric.cpu_percent:.1f}",
+                sparkline(cpu_history, DASHBOARD_COLUMNS[3][1]),
+                f"{metric.memory_usage_mb:.0f}MB ({metric.memory_percent:.1f}%)",
+                f"↓{metric.network_rx_rate_mb_s:.2f} ↑{metric.network_tx_rate_mb_s:.2f}",
+                self._format_uptime(metric.uptime_seconds),
+            ]
+            frame.append(self._dashboard_row(values, {2: cpu_style, 3: cpu_style}))
+
+        frame.append([("╚" + border + "╝", "")])
+        frame.append([(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", "")])
+        self.dashboard.render(frame)
+
+    @staticmethod
+    def _dashboard_row(
+        values: List[str], styles: Optional[Dict[int, str]] = None
+    ) -> List[Tuple[str, str]]:
+        """Lay out one table row as fixed-width dashboard cells."""
+        styles = styles or {}
+        cells = [("║ ", "")]
+        for i, (value, (_, w)) in enumerate(zip(values, DASHBOARD_COLUMNS)):
+            cells.append((f"{value:<{w}.{w}} ", styles.get(i, "")))
+        cells.append(("║", ""))
+        return cells
 
     def _format_uptime(self, uptime_seconds: int) -> str:
         """Format uptime seconds into human-readable string."""
@@ -369,13 +2220,11 @@ class ContainerPerformanceMonitor:
         csv_file = self.log_dir / filename
 
         with open(csv_file, "w", newline="") as csvfile:
-            writer = csv.DictWriter(
-                csvfile, fieldnames=asdict(self.metrics_history[0]).keys()
-            )
-            writer.writeheader()
-
-            for metrics in self.metrics_history:
-                writer.writerow(asdict(metrics))
+            fieldnames = [f.name for f in fields(ContainerMetrics)]
+            getter = operator.attrgetter(*fieldnames)
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(getter(metrics) for metrics in self.metrics_history)
 
         self.logger.info(f"Metrics exported to {csv_file}")
 
@@ -396,87 +2245,214 @@ class ContainerPerformanceMonitor:
 
     def generate_performance_report(self) -> Dict:
         """Generate comprehensive performance report."""
-        if not self.metrics_history:
+        if not self.container_stats:
             return {"error": "No metrics data available"}
 
         # Calculate statistics for each container
         container_stats = {}
 
-        for container in self.containers:
-            container_metrics = [
-                m for m in self.metrics_history if m.container_name == container
-            ]
-
-            if not container_metrics:
-                continue
-
-            cpu_values = [m.cpu_percent for m in container_metrics]
-            memory_values = [m.memory_percent for m in container_metrics]
-
+        for container, stats in self.container_stats.items():
             container_stats[container] = {
-                "cpu": {
-                    "average": sum(cpu_values) / len(cpu_values),
-                    "max": max(cpu_values),
-                    "min": min(cpu_values),
-                },
-                "memory": {
-                    "average": sum(memory_values) / len(memory_values),
-                    "max": max(memory_values),
-                    "min": min(memory_values),
-                },
-                "alerts_count": len(
-                    [a for a in self.alerts_history if a.container_name == container]
-                ),
-                "uptime_average": sum([m.uptime_seconds for m in container_metrics])
-                / len(container_metrics),
+                "cpu": stats["cpu_percent"].summary(),
+                "memory": stats["memory_percent"].summary(),
+                "memory_usage_mb": stats["memory_usage_mb"].summary(),
+                "network_rx_mb": stats["network_rx_mb"].summary(),
+                "network_tx_mb": stats["network_tx_mb"].summary(),
+                "block_read_mb": stats["block_read_mb"].summary(),
+                "block_write_mb": stats["block_write_mb"].summary(),
+                "network_rx_rate_mb_s": stats["network_rx_rate_mb_s"].summary(),
+                "network_tx_rate_mb_s": stats["network_tx_rate_mb_s"].summary(),
+                "block_read_rate_mb_s": stats["block_read_rate_mb_s"].summary(),
+                "block_write_rate_mb_s": stats["block_write_rate_mb_s"].summary(),
+                "alerts_count": self.alert_counts.get(container, 0),
+                "uptime_average": stats["uptime_seconds"].mean,
+                "samples": stats["cpu_percent"].count,
             }
 
         return {
             "report_timestamp": datetime.now().isoformat(),
-            "monitoring_duration_minutes": (
-                len(self.metrics_history) * 5 / 60 if self.metrics_history else 0
-            ),
-            "total_metrics_collected": len(self.metrics_history),
-            "total_alerts_generated": len(self.alerts_history),
+            # Measured between the first and last sample, so it holds for any interval
+            "monitoring_duration_minutes": (self.last_sample_at - self.first_sample_at) / 60,
+            "total_metrics_collected": self.metrics_history.total_samples,
+            "total_alerts_generated": self.alerts_generated,
+            "total_alerts_suppressed": self.alerts_suppressed,
             "container_statistics": container_stats,
         }
 
+    def record_metrics(self, metrics: ContainerMetrics) -> List[PerformanceAlert]:
+        """Store a sample in the history and raise any threshold and anomaly alerts."""
+        self.compute_io_rates(metrics)
+        self.metrics_history.append(metrics)
+        if self.store is not None:
+            self.store.append(metrics)
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.write(metrics)
+
+        now = time.monotonic()
+        if self.first_sample_at is None:
+            self.first_sample_at = now
+        self.last_sample_at = now
+
+        stats = self.container_stats.get(metrics.container_name)
+        if stats is None:
+            stats = self.container_stats[metrics.container_name] = {
+                name: StreamingStats() for name in REPORT_FIELDS
+            }
+        for name in REPORT_FIELDS:
+            stats[name].update(getattr(metrics, name))
+
+        alerts = [
+            alert
+            for alert in self.check_performance_thresholds(metrics)
+            + self.check_io_throughput(metrics)
+            + self.check_anomalies(metrics)
+            if self._should_emit(alert, metrics.sampled_at)
+        ]
+        for alert in alerts:
+            self.alerts_history.append(alert)
+            self.alerts_generated += 1
+            self.alert_counts[alert.container_name] = (
+                self.alert_counts.get(alert.container_name, 0) + 1
+            )
+            self.logger.warning(f"ALERT: {alert.container_name} - {alert.message}")
+            if self.alerts_exporter is not None:
+                self.alerts_exporter.write(alert)
+        if alerts:
+            # The log lines may have scrolled the dashboard
+            self.dashboard.invalidate()
+        return alerts
+
+    async def _sample_container(
+        self, executor: ThreadPoolExecutor, container_name: str, timeout: float
+    ) -> Optional[ContainerMetrics]:
+        """Collect one container's metrics in the executor, giving up after timeout.
+
+        A collection that timed out keeps its worker until it returns; the
+        container is skipped meanwhile so stuck workers don't pile up.
+        """
+        if container_name in self._collecting:
+            self.logger.warning(f"Skipping {container_name}: previous sample still running")
+            self.dashboard.invalidate()
+            return None
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor, self.collect_metrics, container_name)
+        self._collecting.add(container_name)
+
+        def finished(done: "asyncio.Future[Optional[ContainerMetrics]]") -> None:
+            self._collecting.discard(container_name)
+            if not done.cancelled():
+                done.exception()  # mark retrieved; it is raised to the awaiter if any
+
+        future.add_done_callback(finished)
+        try:
+            # Shielded so a timeout doesn't mark the still-running worker as done
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Sampling {container_name} timed out after {timeout:.1f}s")
+            self.dashboard.invalidate()
+            return None
+
+    async def _sampling_loop(
+        self, duration: float, interval: float, sample_timeout: float
+    ) -> int:
+        """Sample all containers concurrently on a drift-free monotonic schedule.
+
+        Tick ``n`` starts at ``start + n * interval`` regardless of how long
+        collection took. Ticks that are missed entirely because a round overran
+        are skipped rather than run back to back.
+
+        Returns:
+            Number of ticks executed
+        """
+        workers = max(1, min(len(self.containers), 64))
+        start = time.monotonic()
+        end = start + duration
+        tick = 0
+        ticks_run = 0
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sampler")
+        try:
+            while start + tick * interval < end:
+                results = await asyncio.gather(
+                    *(
+                        self._sample_container(executor, container, sample_timeout)
+                        for container in self.containers
+                    )
+                )
+                current_metrics = [metrics for metrics in results if metrics]
+                if self.aggregator is not None:
+                    current_metrics.extend(self.aggregator.drain())
+
+                if self.forwarder is not None:
+                    for metrics in current_metrics:
+                        self.forwarder.write(metrics)
+                else:
+                    for metrics in current_metrics:
+                        self.record_metrics(metrics)
+
+                    # Display real-time metrics, latest sample per container
+                    latest = {metrics.container_name: metrics for metrics in current_metrics}
+                    self.display_real_time_metrics(list(latest.values()))
+                ticks_run += 1
+
+                tick += 1
+                now = time.monotonic()
+                if now > start + tick * interval:
+                    missed = int((now - start) // interval) + 1 - tick
+                    self.logger.warning(f"Sampling overran the interval, skipping {missed} tick(s)")
+                    self.dashboard.invalidate()
+                    tick += missed
+                await asyncio.sleep(max(0.0, min(start + tick * interval, end) - time.monotonic()))
+        finally:
+            # Don't wait for samples that already timed out
+            executor.shutdown(wait=False)
+
+        return ticks_run
+
     def monitor(
-        self, duration: int = 300, interval: int = 5, export_csv: bool = False
+        self,
+        duration: int = 300,
+        interval: float = 5,
+        export_csv: bool = False,
+        sample_timeout: Optional[float] = None,
     ) -> None:
         """Run performance monitoring for specified duration."""
         self.logger.info(
             f"Starting performance monitoring for {duration} seconds (interval: {interval}s)"
         )
-
-        start_time = time.time()
-        end_time = start_time + duration
+        for service in (self.collector, self.aggregator, self.forwarder):
+            if service is not None:
+                service.start()
 
         try:
-            while time.time() < end_time:
-                current_metrics = []
-
-                for container in self.containers:
-                    metrics = self.get_container_stats(container)
-                    if metrics:
-                        current_metrics.append(metrics)
-                        self.metrics_history.append(metrics)
-
-                        # Check for alerts
-                        alerts = self.check_performance_thresholds(metrics)
-                        for alert in alerts:
-                            self.alerts_history.append(alert)
-                            self.logger.warning(
-                                f"ALERT: {alert.container_name} - {alert.message}"
-                            )
-
-                # Display real-time metrics
-                self.display_real_time_metrics(current_metrics)
-
-                time.sleep(interval)
-
+            asyncio.run(
+                self._sampling_loop(duration, interval, sample_timeout or interval)
+            )
         except KeyboardInterrupt:
             self.logger.info("Performance monitoring stopped by user")
+        finally:
+            self.dashboard.close()
+            if self.collector is not None:
+                self.collector.stop()
+            if self.aggregator is not None:
+                self.aggregator.stop()
+                for metrics in self.aggregator.drain():
+                    self.record_metrics(metrics)
+            if self.forwarder is not None:
+                self.forwarder.close()
+            if self.store is not None:
+                self.store.close()
+            for exporter in (self.metrics_exporter, self.alerts_exporter):
+                if exporter is not None:
+                    exporter.close()
+
+        if self.forwarder is not None:
+            # Agents leave alerting and reporting to the aggregator
+            self.logger.info(
+                f"Forwarded {self.forwarder.sent} samples ({self.forwarder.dropped} dropped)"
+            )
+            return
 
         # Generate final report
         report = self.generate_performance_report()
@@ -490,8 +2466,12 @@ class ContainerPerformanceMonitor:
 
         self.logger.info(f"Performance report saved to {report_file}")
 
-        # Export data if requested
-        if export_csv:
+        # Export data if requested; streaming exporters have already written everything
+        for exporter in (self.metrics_exporter, self.alerts_exporter):
+            if exporter is not None:
+                for path in exporter.files:
+                    self.logger.info(f"Exported {exporter.stem} to {path}")
+        if export_csv and self.metrics_exporter is None:
             timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
             self.export_metrics_to_csv(f"performance-metrics-{timestamp}.csv")
             self.export_alerts_to_json(f"performance-alerts-{timestamp}.json")
@@ -499,8 +2479,8 @@ class ContainerPerformanceMonitor:
         # Display summary
         print(f"\n📊 Performance Monitoring Summary:")
         print(f"Duration: {duration // 60}m {duration % 60}s")
-        print(f"Metrics collected: {len(self.metrics_history)}")
-        print(f"Alerts generated: {len(self.alerts_history)}")
+        print(f"Metrics collected: {self.metrics_history.total_samples}")
+        print(f"Alerts generated: {self.alerts_generated}")
         print(f"Report saved to: {report_file}")
 
 
@@ -517,24 +2497,164 @@ def main():
     )
     parser.add_argument(
         "--interval",
-        type=int,
+        type=float,
         default=5,
         help="Monitoring interval in seconds (default: 5)",
     )
     parser.add_argument(
-        "--export-csv", action="store_true", help="Export metrics to CSV files"
+        "--sample-timeout",
+        type=float,
+        default=None,
+        help="Per-container sampling timeout in seconds (default: the interval)",
+    )
+    parser.add_argument(
+        "--export-csv",
+        action="store_true",
+        help="Export metrics and alerts to files in .logs while monitoring",
+    )
+    parser.add_argument(
+        "--export-format",
+        choices=sorted(EXPORT_FORMATS),
+        default="csv",
+        help="Metrics export format; alerts are written as NDJSON unless parquet "
+        "is chosen (default: csv)",
+    )
+    parser.add_argument(
+        "--rotate-size",
+        type=float,
+        default=None,
+        help="Start a new export file once the current one reaches this many MB",
+    )
+    parser.add_argument(
+        "--rotate-interval",
+        type=float,
+        default=None,
+        help="Start a new export file after this many seconds",
     )
     parser.add_argument(
         "--containers",
         nargs="+",
-        default=["lumin-ai-dev", "lumin-governance-db"],
-        help="Container names to monitor",
+        default=None,
+        help="Container names to monitor (default: lumin-ai-dev lumin-governance-db; "
+        "with the cgroup backend, the name to report, default: the hostname)",
+    )
+
+    parser.add_argument(
+        "--history-size",
+        type=int,
+        default=17280,
+        help="Samples kept in memory per container (default: 17280, one day at 5s)",
+    )
+    parser.add_argument(
+        "--store",
+        default=None,
+        help="SQLite file for persistent metrics with 1m/1h rollups (e.g. .logs/metrics.db)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["api", "cli", "cgroup"],
+        default=None,
+        help="Metrics source: Docker Engine API stats stream, docker CLI polling, "
+        "or this container's own cgroup v2 files (default: api if the Docker socket "
+        "exists, else cli)",
+    )
+    parser.add_argument(
+        "--cgroup-root",
+        default="/sys/fs/cgroup",
+        help="cgroup v2 directory for the cgroup backend (default: /sys/fs/cgroup)",
+    )
+    parser.add_argument(
+        "--proc-root",
+        default="/proc",
+        help="/proc directory for the cgroup backend (default: /proc)",
+    )
+    parser.add_argument(
+        "--listen",
+        default=None,
+        metavar="HOST:PORT",
+        help="Aggregate samples pushed by agents on other hosts; without --containers "
+        "no local containers are sampled",
+    )
+    parser.add_argument(
+        "--push-to",
+        default=None,
+        metavar="URL",
+        help="Run as an agent pushing samples to an aggregator (e.g. http://monitor:9465/ingest)",
+    )
+    parser.add_argument(
+        "--agent-host",
+        default=None,
+        help="Host name agents report to the aggregator (default: the hostname)",
+    )
+    parser.add_argument(
+        "--docker-socket",
+        default=None,
+        help="Docker Engine API socket for the api backend (default: from a unix:// "
+        "DOCKER_HOST, else /var/run/docker.sock)",
     )
 
     args = parser.parse_args()
 
-    monitor = ContainerPerformanceMonitor(args.containers)
-    monitor.monitor(args.duration, args.interval, args.export_csv)
+    docker_socket = args.docker_socket or docker_socket_from_env()
+    if args.backend is None:
+        # A TCP DOCKER_HOST or a missing socket leaves the docker CLI to find the daemon
+        args.backend = "api" if docker_socket and os.path.exists(docker_socket) else "cli"
+    elif args.backend == "api" and docker_socket is None:
+        parser.error("--backend api needs a Unix socket: DOCKER_HOST isn't unix://, pass --docker-socket")
+
+    collector = None
+    if args.listen and not args.containers:
+        containers = []
+    elif args.backend == "cgroup":
+        name = args.containers[0] if args.containers else socket.gethostname()
+        collector = CgroupV2Collector({name: (args.cgroup_root, args.proc_root)})
+        containers = [name]
+    else:
+        containers = args.containers or ["lumin-ai-dev", "lumin-governance-db"]
+        if args.backend == "api":
+            collector = DockerStatsStreamCollector(containers, socket_path=docker_socket)
+
+    log_dir = ".logs"
+    metrics_exporter = alerts_exporter = None
+    if args.export_csv:
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        rotation = {
+            "max_bytes": int(args.rotate_size * BYTES_PER_MB) if args.rotate_size else None,
+            "rotate_interval": args.rotate_interval,
+        }
+        metrics_exporter = StreamingExporter(
+            ContainerMetrics,
+            log_dir,
+            f"performance-metrics-{timestamp}",
+            args.export_format,
+            **rotation,
+        )
+        alerts_exporter = StreamingExporter(
+            PerformanceAlert,
+            log_dir,
+            f"performance-alerts-{timestamp}",
+            "parquet" if args.export_format == "parquet" else "ndjson",
+            **rotation,
+        )
+
+    aggregator = None
+    if args.listen:
+        host, _, port = args.listen.rpartition(":")
+        aggregator = FanInAggregator(host or "0.0.0.0", int(port))
+    forwarder = MetricsPushAgent(args.push_to, args.agent_host) if args.push_to else None
+
+    monitor = ContainerPerformanceMonitor(
+        containers,
+        log_dir=log_dir,
+        collector=collector,
+        history_size=args.history_size,
+        store=MetricsStore(args.store) if args.store else None,
+        metrics_exporter=metrics_exporter,
+        alerts_exporter=alerts_exporter,
+        aggregator=aggregator,
+        forwarder=forwarder,
+    )
+    monitor.monitor(args.duration, args.interval, args.export_csv, args.sample_timeout)
 
 
 if __name__ == "__main__":
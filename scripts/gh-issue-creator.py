@@ -5,51 +5,433 @@ Automates creation of GitHub issues from parsed PRD requirements
 and adds them to the LUMIN Project Tracker board
 """
 
+import hashlib
 import json
+import os
+import random
+import re
 import requests
+import sqlite3
+import statistics
+import threading
 import time
-from typing import List, Dict, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
 import argparse
 import sys
 
+class RateLimiter:
+    """Paces GitHub API requests shared by several worker threads.
+
+    Tracks the primary rate limit per resource (core REST, GraphQL) from the
+    X-RateLimit-* headers and, once fewer than `low_water` requests remain,
+    spreads the rest evenly until the reset. A Retry-After or rate limit
+    response pauses every thread, and content-creating requests are kept
+    `min_interval` seconds apart as GitHub recommends to avoid secondary
+    rate limits.
+    """
+
+    def __init__(self, min_interval: float = 1.0, low_water: int = 50):
+        self.min_interval = min_interval
+        self.low_water = low_water
+        self.limits: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._next_write = 0.0
+        self._next_request: Dict[str, float] = {}
+
+    def acquire(self, resource: str = 'core', write: bool = False) -> None:
+        """Block until the calling thread may send its request"""
+        with self._lock:
+            now = time.time()
+            start = max(now, self._paused_until, self._next_request.get(resource, 0.0))
+            if write:
+                start = max(start, self._next_write)
+                self._next_write = start + self.min_interval
+
+            if resource in self.limits:
+                remaining, reset_at = self.limits[resource]
+                if remaining < self.low_water:
+                    spacing = max(0.0, reset_at - start) / max(remaining, 1)
+                    self._next_request[resource] = start + spacing
+                    # Reserve one request until the response reports the real count
+                    self.limits[resource] = (max(remaining - 1, 0), reset_at)
+
+        delay = start - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, resource: str, headers) -> None:
+        """Record the rate limit state reported by a response"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_at = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset_at is None:
+            return
+        with self._lock:
+            self.limits[headers.get('X-RateLimit-Resource', resource)] = (int(remaining), float(reset_at))
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every thread for `seconds`"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.time() + seconds)
+
+class RequestStats:
+    """Latency of the API requests sent by a creator and how often they reused
+    a pooled connection"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.latencies.append(seconds)
+
+    def summary(self, adapter: HTTPAdapter) -> Dict:
+        """Request count, connections opened, reuse rate and latency percentiles (ms).
+
+        The latency keys are left out when no request got a response.
+        """
+        with self._lock:
+            latencies = sorted(self.latencies)
+        pools = adapter.poolmanager.pools
+        connections = sum(pools[key].num_connections for key in pools.keys())
+        requests_sent = sum(pools[key].num_requests for key in pools.keys())
+        summary = {
+            'requests': requests_sent,
+            'connections': connections,
+            'reuse_rate': 1 - connections / requests_sent if requests_sent else 0.0,
+        }
+        if latencies:
+            summary.update({
+                'latency_mean_ms': statistics.mean(latencies) * 1000,
+                'latency_p50_ms': latencies[len(latencies) // 2] * 1000,
+                'latency_p95_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+                'latency_max_ms': latencies[-1] * 1000,
+            })
+        return summary
+
+def issue_key(issue_data: Dict) -> str:
+    """Content hash identifying an issue across runs"""
+    content = {field: issue_data.get(field) for field in ('title', 'body', 'labels', 'milestone', 'assignees')}
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def _never_sent(error: requests.RequestException) -> bool:
+    """Whether a request failed before reaching the server, so retrying it is safe"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(error, requests.ConnectionError) and isinstance(reason, NewConnectionError)
+
+class IssueJournal:
+    """Local write-ahead journal (SQLite, WAL mode) of an issue import.
+
+    Every issue is keyed by its content hash. An issue is recorded as
+    'pending' before it is posted, 'created' with its number and node ID
+    once GitHub confirms it, and 'added' once it's on the project board, so
+    a rerun after a crash skips finished work. A 'pending' entry means the
+    outcome of its request is unknown; the creator resolves those against
+    the issues that already exist in the repository.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS issues ("
+            "key TEXT PRIMARY KEY, title TEXT NOT NULL, state TEXT NOT NULL, "
+            "number INTEGER, node_id TEXT, updated_at REAL NOT NULL)"
+        )
+        self.connection.commit()
+        # Journal contents are small; lookups are served from memory
+        self.entries: Dict[str, Dict] = {
+            key: {'title': title, 'state': state, 'number': number, 'node_id': node_id}
+            for key, title, state, number, node_id in self.connection.execute(
+                "SELECT key, title, state, number, node_id FROM issues"
+            )
+        }
+
+    def get(self, key: str) -> Optional[Dict]:
+        """The journal entry for an issue key, if any"""
+        with self._lock:
+            entry = self.entries.get(key)
+            return dict(entry) if entry is not None else None
+
+    def record(self, key: str, title: str, state: str, number: Optional[int] = None,
+               node_id: Optional[str] = None) -> None:
+        """Durably record an issue's state before the caller moves on"""
+        with self._lock:
+            self.entries[key] = {'title': title, 'state': state, 'number': number, 'node_id': node_id}
+            self.connection.execute(
+                "INSERT OR REPLACE INTO issues (key, title, state, number, node_id, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, title, state, number, node_id, time.time()),
+            )
+            self.connection.commit()
+
+    def mark_added(self, keys: List[str]) -> None:
+        """Record that the created issues behind `keys` are on the project board"""
+        with self._lock:
+            for key in keys:
+                self.entries[key]['state'] = 'added'
+            self.connection.executemany(
+                "UPDATE issues SET state = 'added', updated_at = ? WHERE key = ?",
+                [(time.time(), key) for key in keys],
+            )
+            self.connection.commit()
+
+    def counts(self) -> Dict[str, int]:
+        """Number of journal entries per state"""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for entry in self.entries.values():
+                counts[entry['state']] = counts.get(entry['state'], 0) + 1
+            return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
+
 class GitHubIssueCreator:
-    def __init__(self, token: str, owner: str, repo: str):
+    def __init__(self, token: str, owner: str, repo: str,
+                 api_url: str = 'https://api.github.com', max_retries: int = 5,
+                 backoff_base: float = 1.0, secondary_wait: float = 60.0, timeout: float = 30.0,
+                 metadata_ttl: float = 600.0, project_batch_size: int = 50,
+                 pool_size: int = 10):
         self.token = token
         self.owner = owner
         self.repo = repo
-        self.base_url = f"https://api.github.com/repos/{owner}/{repo}"
+        self.api_url = api_url.rstrip('/')
+        self.base_url = f"{self.api_url}/repos/{owner}/{repo}"
         self.headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json"
         }
-        self.graphql_url = "https://api.github.com/graphql"
+        self.graphql_url = f"{self.api_url}/graphql"
+        # One keep-alive connection pool shared by all workers; pool_size should
+        # be at least the number of workers
+        self.adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        self.session.headers.update(self.headers)
+        self.session.headers['Accept-Encoding'] = 'gzip'
+        self.stats = RequestStats()
         self.project_id = None
         self.project_field_id = None
         self.backlog_option_id = None
-        
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        # GitHub asks clients to wait at least a minute after a secondary rate limit
+        self.secondary_wait = secondary_wait
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter()
+        # Aliased project mutations per GraphQL request (1 = two requests per issue)
+        self.project_batch_size = project_batch_size
+        # Per-run metadata (milestones, labels, projects, project fields): key -> (fetched_at, value)
+        self.metadata_ttl = metadata_ttl
+        self._metadata: Dict[str, Tuple[float, object]] = {}
+        self._metadata_lock = threading.Lock()
+
+    def _request(self, method: str, url: str, write: Optional[bool] = None,
+                 **kwargs) -> Optional[requests.Response]:
+        """Send an API request through the rate limiter, retrying rate limits and
+        transient failures with jittered exponential backoff.
+
+        Rate limits and failed connections are always retried, since GitHub
+        never saw the request. Timeouts, dropped connections and 5xx responses
+        are only retried for reads: a write (issue POST, GraphQL mutation) may
+        already have been applied, and repeating it could create duplicates.
+
+        Returns the final response (which may still be an error), or None if the
+        request never got a response.
+        """
+        resource = 'graphql' if url == self.graphql_url else 'core'
+        if write is None:
+            write = method != 'GET'
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(resource, write)
+            try:
+                started = time.perf_counter()
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+                self.stats.record(time.perf_counter() - started)
+            except requests.RequestException as e:
+                if attempt == self.max_retries or (write and not _never_sent(e)):
+                    print(f"❌ {method} {url} failed: {e}")
+                    return None
+                wait = self._backoff(attempt)
+                print(f"⚠️  {method} {url} failed ({e}), retrying in {wait:.1f}s")
+                time.sleep(wait)
+                continue
+
+            self.rate_limiter.update(resource, response.headers)
+            rate_limit_wait = self._rate_limit_wait(response, attempt)
+            if rate_limit_wait is not None:
+                if attempt == self.max_retries:
+                    return response
+                print(f"⏳ Rate limited, pausing requests for {rate_limit_wait:.1f}s")
+                self.rate_limiter.pause(rate_limit_wait)
+            elif response.status_code >= 500 and attempt < self.max_retries and not write:
+                wait = self._backoff(attempt)
+                print(f"⚠️  {method} {url} returned {response.status_code}, retrying in {wait:.1f}s")
+                time.sleep(wait)
+            else:
+                return response
+
+        return None
+
+    def _rate_limit_wait(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait if the response is a rate limit, otherwise None"""
+        if response.status_code not in (403, 429):
+            return None
+
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            reset_at = float(response.headers.get('X-RateLimit-Reset', 0))
+            return max(reset_at - time.time(), 0.0) + random.uniform(0, self.backoff_base)
+        if 'secondary rate limit' in response.text.lower():
+            return max(self.secondary_wait, self._backoff(attempt))
+        # A plain permission error
+        return None
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(60.0, self.backoff_base * 2 ** attempt))
+
+    def _get_paginated(self, url: str, params: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """GET every page of a REST list endpoint by following its Link headers"""
+        items = []
+        params = {'per_page': 100, **(params or {})}
+        while url:
+            response = self._request('GET', url, params=params)
+            if response is None or response.status_code != 200:
+                status = response.status_code if response is not None else 'no response'
+                print(f"Error fetching {url}: {status}")
+                return None
+            items.extend(response.json())
+            # The next link already carries the query string
+            url = response.links.get('next', {}).get('url')
+            params = None
+        return items
+
+    def _graphql_nodes(self, query: str, variables: Dict, connection: str) -> Optional[List[Dict]]:
+        """Collect the nodes of a paginated GraphQL connection.
+
+        `query` must take an `$after` cursor variable and select `nodes` and
+        `pageInfo { hasNextPage endCursor }` of the connection, which is
+        found by the first key under `data` holding `connection`.
+        """
+        nodes = []
+        after = None
+        while True:
+            result = self.graphql_query(query, {**variables, 'after': after})
+            if not result.get('data'):
+                return None
+            parent = next(iter(result['data'].values()))
+            if parent is None:
+                return None
+            page = parent[connection]
+            nodes.extend(node for node in page['nodes'] if node)
+            if not page['pageInfo']['hasNextPage']:
+                return nodes
+            after = page['pageInfo']['endCursor']
+
+    def _cached(self, key: str, fetch):
+        """Return run metadata, fetching it on first use or after it expires.
+
+        The lock makes concurrent workers wait for a single fetch. Failed
+        fetches (None) aren't cached.
+        """
+        with self._metadata_lock:
+            entry = self._metadata.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.metadata_ttl:
+                return entry[1]
+            value = fetch()
+            if value is not None:
+                self._metadata[key] = (time.monotonic(), value)
+            return value
+
+    def invalidate_metadata(self, key: Optional[str] = None) -> None:
+        """Drop cached metadata ('milestones', 'labels', 'issues', 'projects',
+        'project_fields:<id>') so the next lookup refetches it; all of it by default"""
+        with self._metadata_lock:
+            if key is None:
+                self._metadata.clear()
+            else:
+                self._metadata.pop(key, None)
+
+    def prefetch_metadata(self) -> None:
+        """Load milestones and labels up front so issue creation only does dictionary lookups"""
+        milestones = self.get_milestones()
+        labels = self.get_labels()
+        print(f"📋 Cached {len(milestones)} milestones and {len(labels)} labels")
+
     def get_milestones(self) -> Dict[str, int]:
         """Fetch existing milestones and return mapping"""
-        url = f"{self.base_url}/milestones"
-        response = requests.get(url, headers=self.headers)
-        
-        if response.status_code != 200:
-            print(f"Error fetching milestones: {response.status_code}")
-            return {}
-            
-        milestones = {}
-        for milestone in response.json():
-            milestones[milestone['title']] = milestone['number']
-            
-        return milestones
-    
-    def graphql_query(self, query: str) -> Dict:
+        def fetch() -> Optional[Dict[str, int]]:
+            milestones = self._get_paginated(f"{self.base_url}/milestones")
+            if milestones is None:
+                return None
+            return {milestone['title']: milestone['number'] for milestone in milestones}
+
+        return self._cached('milestones', fetch) or {}
+
+    def get_labels(self) -> Dict[str, Optional[int]]:
+        """Fetch existing labels and return a name to ID mapping (None for labels
+        created by this run)"""
+        def fetch() -> Optional[Dict[str, Optional[int]]]:
+            labels = self._get_paginated(f"{self.base_url}/labels")
+            if labels is None:
+                return None
+            return {label['name']: label['id'] for label in labels}
+
+        return self._cached('labels', fetch) or {}
+
+    def get_existing_issues(self) -> Dict[str, Dict]:
+        """Fetch every issue in the repository once and return a title to
+        {'number', 'node_id'} mapping (pull requests excluded)"""
+        def fetch() -> Optional[Dict[str, Dict]]:
+            issues = self._get_paginated(f"{self.base_url}/issues", {'state': 'all'})
+            if issues is None:
+                return None
+            existing = {}
+            for issue in issues:
+                if 'pull_request' not in issue:
+                    existing.setdefault(issue['title'], {'number': issue['number'], 'node_id': issue['node_id']})
+            return existing
+
+        return self._cached('issues', fetch) or {}
+
+    def graphql_query(self, query: str, variables: Optional[Dict] = None) -> Dict:
         """Execute a GraphQL query"""
-        response = requests.post(
+        payload = {'query': query}
+        if variables:
+            payload['variables'] = variables
+        response = self._request(
+            'POST',
             self.graphql_url,
-            json={'query': query},
-            headers=self.headers
+            write=query.lstrip().startswith('mutation'),
+            json=payload
         )
         
+        if response is None:
+            print("GraphQL query failed: no response")
+            return {}
         if response.status_code != 200:
             print(f"GraphQL query failed: {response.status_code}")
             print(response.text)
@@ -59,68 +441,76 @@ class GitHubIssueCreator:
     
     def find_project(self, project_name: str) -> Optional[str]:
         """Find project by name and get its ID"""
-        query = f"""
-        {{
-          repository(owner: "{self.owner}", name: "{self.repo}") {{
-            projectsV2(first: 10) {{
-              nodes {{
+        query = """
+        query($owner: String!, $repo: String!, $after: String) {
+          repository(owner: $owner, name: $repo) {
+            projectsV2(first: 100, after: $after) {
+              nodes {
                 id
                 title
-              }}
-            }}
-          }}
-        }}
+              }
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+            }
+          }
+        }
         """
         
-        result = self.graphql_query(query)
+        def fetch() -> Optional[Dict[str, str]]:
+            projects = self._graphql_nodes(
+                query, {'owner': self.owner, 'repo': self.repo}, 'projectsV2'
+            )
+            if projects is None:
+                return None
+            return {project['title']: project['id'] for project in projects}
         
-        if 'data' not in result:
-            return None
-            
-        projects = result['data']['repository']['projectsV2']['nodes']
+        projects = self._cached('projects', fetch) or {}
         
-        for project in projects:
-            if project['title'] == project_name:
-                print(f"✅ Found project: {project['title']}")
-                return project['id']
+        if project_name in projects:
+            print(f"✅ Found project: {project_name}")
+            return projects[project_name]
                 
         return None
     
     def get_project_field_info(self, project_id: str) -> Tuple[Optional[str], Optional[str]]:
         """Get the Status field ID and Backlog option ID"""
-        query = f"""
-        {{
-          node(id: "{project_id}") {{
-            ... on ProjectV2 {{
-              fields(first: 20) {{
-                nodes {{
-                  ... on ProjectV2Field {{
+        query = """
+        query($project: ID!, $after: String) {
+          node(id: $project) {
+            ... on ProjectV2 {
+              fields(first: 100, after: $after) {
+                nodes {
+                  ... on ProjectV2Field {
                     id
                     name
-                  }}
-                  ... on ProjectV2SingleSelectField {{
+                  }
+                  ... on ProjectV2SingleSelectField {
                     id
                     name
-                    options {{
+                    options {
                       id
                       name
-                    }}
-                  }}
-                }}
-              }}
-            }}
-          }}
-        }}
+                    }
+                  }
+                }
+                pageInfo {
+                  hasNextPage
+                  endCursor
+                }
+              }
+            }
+          }
+        }
         """
         
-        result = self.graphql_query(query)
-        
-        if 'data' not in result:
-            return None, None
-            
-        fields = result['data']['node']['fields']['nodes']
+        fields = self._cached(
+            f"project_fields:{project_id}",
+            lambda: self._graphql_nodes(query, {'project': project_id}, 'fields')
+        )
         
-        for field in fields:
+        for field in fields or []:
             if field.get('name') == 'Status' and 'options' in field:
                 field_id = field['id']
                 for option in field['options']:
@@ -134,64 +524,130 @@ class GitHubIssueCreator:
         """Add an issue to the project and set it to Backlog"""
         if not self.project_id:
             return False
-            
-        # First, add the issue to the project
-        mutation = f"""
-        mutation {{
-          addProjectV2ItemById(input: {{
-            projectId: "{self.project_id}"
-            contentId: "{issue_id}"
-          }}) {{
-            item {{
-              id
-            }}
-          }}
-        }}
-        """
-        
-        result = self.graphql_query(mutation)
         
-        if 'data' not in result or 'addProjectV2ItemById' not in result['data']:
-            print(f"Failed to add issue to project")
+        result = self.add_issues_to_project([issue_id])[issue_id]
+        if result['error'] and not result['item_id']:
+            print(f"Failed to add issue to project: {result['error']}")
             return False
-            
-        item_id = result['data']['addProjectV2ItemById']['item']['id']
+        if result['backlog']:
+            print(f"   ✅ Added to Backlog")
+        elif self.project_field_id and self.backlog_option_id:
+            print(f"   ⚠️  Added to project but couldn't set to Backlog")
+        return True
+    
+    def add_issues_to_project(self, issue_ids: List[str]) -> Dict[str, Dict]:
+        """Add issues to the project and set them to Backlog, many per request.
+
+        Each request packs up to `project_batch_size` aliased mutations: one
+        request adds a chunk of issues, a second sets their Status. Returns,
+        per issue node ID, the project item ID (None if it wasn't added),
+        whether it reached Backlog, and the first error reported for it.
+        """
+        results = {
+            issue_id: {'item_id': None, 'backlog': False, 'error': None}
+            for issue_id in issue_ids
+        }
+        if not self.project_id:
+            for result in results.values():
+                result['error'] = 'No project selected'
+            return results
         
-        # Then, set it to Backlog status
-        if self.project_field_id and self.backlog_option_id:
-            update_mutation = f"""
-            mutation {{
-              updateProjectV2ItemFieldValue(input: {{
-                projectId: "{self.project_id}"
-                itemId: "{item_id}"
-                fieldId: "{self.project_field_id}"
-                value: {{
-                  singleSelectOptionId: "{self.backlog_option_id}"
-                }}
-              }}) {{
-                projectV2Item {{
-                  id
-                }}
-              }}
-            }}
-            """
+        size = max(1, self.project_batch_size)
+        for start in range(0, len(issue_ids), size):
+            chunk = issue_ids[start:start + size]
             
-            update_result = self.graphql_query(update_mutation)
+            # Add the issues to the project
+            fields = [
+                f"add{i}: addProjectV2ItemById(input: {{projectId: $project, contentId: $content{i}}}) {{ item {{ id }} }}"
+                for i in range(len(chunk))
+            ]
+            params = ''.join(f", $content{i}: ID!" for i in range(len(chunk)))
+            variables = {'project': self.project_id}
+            variables.update({f"content{i}": issue_id for i, issue_id in enumerate(chunk)})
+            data, errors = self._graphql_mutations(
+                f"mutation($project: ID!{params}) {{\n  " + '\n  '.join(fields) + "\n}",
+                variables,
+                'add',
+                list(range(len(chunk)))
+            )
+            items = {}
+            for i, issue_id in enumerate(chunk):
+                added = data.get(f"add{i}")
+                if added and added.get('item'):
+                    items[i] = results[issue_id]['item_id'] = added['item']['id']
+                else:
+                    results[issue_id]['error'] = errors.get(i, 'Not added to project')
             
-            if 'data' in update_result:
-                print(f"   ✅ Added to Backlog")
-                return True
+            # Then, set them to Backlog status
+            if not (items and self.project_field_id and self.backlog_option_id):
+                continue
+            fields = [
+                f"set{i}: updateProjectV2ItemFieldValue(input: {{projectId: $project, itemId: $item{i}, "
+                f"fieldId: $field, value: {{singleSelectOptionId: $option}}}}) {{ projectV2Item {{ id }} }}"
+                for i in items
+            ]
+            params = ''.join(f", $item{i}: ID!" for i in items)
+            variables = {
+                'project': self.project_id,
+                'field': self.project_field_id,
+                'option': self.backlog_option_id,
+            }
+            variables.update({f"item{i}": item_id for i, item_id in items.items()})
+            data, errors = self._graphql_mutations(
+                f"mutation($project: ID!, $field: ID!, $option: String!{params}) {{\n  "
+                + '\n  '.join(fields) + "\n}",
+                variables,
+                'set',
+                list(items)
+            )
+            for i in items:
+                issue_id = chunk[i]
+                if data.get(f"set{i}"):
+                    results[issue_id]['backlog'] = True
+                else:
+                    results[issue_id]['error'] = errors.get(i, 'Status not set to Backlog')
+        
+        return results
+    
+    def _graphql_mutations(self, mutation: str, variables: Dict, prefix: str,
+                           indices: List[int]) -> Tuple[Dict, Dict[int, str]]:
+        """Run a document of mutations aliased `<prefix><index>` for each of `indices`.
+
+        Returns the response data and the error messages keyed by alias index;
+        errors without an alias in their path (or a failed request) apply to
+        every alias.
+        """
+        result = self.graphql_query(mutation, variables)
+        if not result:
+            return {}, {i: 'GraphQL request failed' for i in indices}
+        
+        errors: Dict[int, str] = {}
+        for error in result.get('errors', []):
+            message = error.get('message', 'Unknown error')
+            alias = (error.get('path') or [''])[0]
+            if isinstance(alias, str) and alias.startswith(prefix) and alias[len(prefix):].isdigit():
+                errors.setdefault(int(alias[len(prefix):]), message)
             else:
-                print(f"   ⚠️  Added to project but couldn't set to Backlog")
-                return True
-                
-        return True
+                for i in indices:
+                    errors.setdefault(i, message)
+        return result.get('data') or {}, errors
     
     def create_issue(self, issue_data: Dict, add_to_project: bool = True) -> bool:
         """Create a single issue on GitHub and optionally add to project"""
+        issue = self._create_issue(issue_data)
+        if issue is None:
+            return False
+        
+        # Add to project board if requested
+        if add_to_project and self.project_id:
+            self.add_issue_to_project(issue['node_id'])
+        return True
+    
+    def _create_issue(self, issue_data: Dict) -> Optional[Dict]:
+        """Create a single issue on GitHub and return it, or None on failure"""
         url = f"{self.base_url}/issues"
         
-        # Map milestone name to number
+        # Map milestone name to number (cached for the run)
         milestones = self.get_milestones()
         milestone_number = None
         
@@ -202,6 +658,15 @@ class GitHubIssueCreator:
             else:
                 print(f"Warning: Milestone '{milestone_name}' not found")
         
+        labels = self.get_labels()
+        new_labels = [label for label in issue_data.get('labels', []) if label not in labels]
+        if new_labels:
+            print(f"   Note: GitHub will create new label(s): {', '.join(new_labels)}")
+            # GitHub creates them with the issue; remember them instead of refetching
+            with self._metadata_lock:
+                for label in new_labels:
+                    labels.setdefault(label, None)
+        
         # Prepare issue payload
         payload = {
             "title": issue_data['title'],
@@ -216,31 +681,61 @@ class GitHubIssueCreator:
             payload['assignees'] = issue_data['assignees']
         
         # Create the issue
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = self._request('POST', url, json=payload)
         
-        if response.status_code == 201:
+        if response is not None and response.status_code == 201:
             issue = response.json()
             print(f"✅ Created issue #{issue['number']}: {issue['title']}")
-            
-            # Add to project board if requested
-            if add_to_project and self.project_id:
-                self.add_issue_to_project(issue['node_id'])
-                
-            return True
+            return issue
         else:
             print(f"❌ Failed to create issue: {issue_data['title']}")
-            print(f"   Status: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
+            if response is not None:
+                print(f"   Status: {response.status_code}")
+                print(f"   Response: {response.text}")
+            return None
     
-    def create_issues_batch(self, issues: List[Dict], delay: float = 1.0, 
-                           project_name: Optional[str] = None) -> Dict:
-        """Create multiple issues with rate limiting and optional project board integration"""
+    def create_issues_batch(self, issues: Iterable[Dict], delay: float = 1.0, 
+                           project_name: Optional[str] = None, max_workers: int = 4,
+                           journal: Optional[IssueJournal] = None) -> Dict:
+        """Create multiple issues concurrently with optional project board integration.
+
+        Up to `max_workers` issues are in flight at once; the shared rate limiter
+        keeps content-creating requests `delay` seconds apart and backs off on
+        rate limit responses. With a project board, the created issues are then
+        added to it `project_batch_size` at a time.
+
+        With a `journal` the import is resumable: issues it records as created
+        are skipped instead of created again. An issue a previous run left
+        pending (it may have been posted just before that run died) is adopted
+        if the repository has an issue with its title, fetched in one paginated
+        pass. Issues the journal has never seen are always created, even if an
+        older issue shares their title.
+
+        `issues` may be a lazy iterator (see `read_issues`); it is consumed as
+        workers free up, so only a few issues are held in memory at a time. If
+        it raises ValueError (bad input), no further issues are started, the
+        ones already under way finish, and the error is kept in
+        `results['input_error']`. An issue whose creation raises is counted
+        as failed.
+        """
         results = {
             'created': 0,
+            'skipped': 0,
             'failed': 0,
-            'total': len(issues)
+            'total': 0
         }
+        # Streamed input has no length up front
+        count = f"/{len(issues)}" if hasattr(issues, '__len__') else ''
+        self.rate_limiter.min_interval = delay
+        self.prefetch_metadata()
+        
+        existing = {}
+        if journal is not None:
+            counts = journal.counts()
+            if counts.get('pending'):
+                existing = self.get_existing_issues()
+            print(f"📒 Journal {journal.path}: {counts or 'empty'}, "
+                  f"{len(existing)} issues already in the repository")
         
         # Set up project board integration if requested
         if project_name:
@@ -254,41 +749,225 @@ class GitHubIssueCreator:
             else:
                 print(f"⚠️  Warning: Project '{project_name}' not found. Issues will be created without project assignment.")
         
-        print(f"\n🚀 Creating {len(issues)} issues on GitHub...\n")
+        print(f"\n🚀 Creating issues on GitHub ({max_workers} at a time)...\n")
         
-        for i, issue in enumerate(issues, 1):
-            print(f"Processing {i}/{len(issues)}: {issue['title']}")
-            
-            if self.create_issue(issue, add_to_project=bool(project_name)):
-                results['created'] += 1
-            else:
-                results['failed'] += 1
+        # With a project, issues are added in batches of aliased mutations once created
+        batch_project = bool(self.project_id) and self.project_batch_size > 1
+        
+        def resume(key: str, issue_data: Dict) -> Optional[Dict]:
+            """The issue left by an earlier run, if it got as far as GitHub"""
+            entry = journal.get(key)
+            if entry is None or entry['state'] != 'pending':
+                return entry
+            found = existing.get(issue_data['title'])
+            if found is None:
+                return None
+            # Posted by the interrupted run before it could record the number: adopt it
+            journal.record(key, issue_data['title'], 'created', found['number'], found['node_id'])
+            return journal.get(key)
+        
+        def create(numbered: Tuple[int, Dict]) -> Tuple[str, Optional[Dict]]:
+            try:
+                return create_one(*numbered)
+            except Exception as e:
+                # e.g. an unreadable API response; one issue failing doesn't stop the batch
+                print(f"❌ Failed to create issue {numbered[0]}{count}: {numbered[1].get('title')} ({e!r})")
+                return 'failed', None
+        
+        def create_one(i: int, issue_data: Dict) -> Tuple[str, Optional[Dict]]:
+            key = issue_key(issue_data)
+            if journal is not None:
+                entry = resume(key, issue_data)
+                if entry is not None:
+                    print(f"⏭️  Skipping {i}{count}: #{entry['number']} {issue_data['title']} already exists")
+                    issue = {'number': entry['number'], 'node_id': entry['node_id'], 'title': issue_data['title'],
+                             'key': key, 'added': entry['state'] == 'added'}
+                    if self.project_id and not batch_project and not issue['added']:
+                        if self.add_issue_to_project(issue['node_id']):
+                            journal.mark_added([key])
+                    return 'skipped', issue
+                journal.record(key, issue_data['title'], 'pending')
             
-            # Rate limiting to avoid hitting API limits
-            if i < len(issues):
-                time.sleep(delay)
+            print(f"Processing {i}{count}: {issue_data['title']}")
+            issue = self._create_issue(issue_data)
+            if issue is None:
+                return 'failed', None
+            if journal is not None:
+                journal.record(key, issue_data['title'], 'created', issue['number'], issue['node_id'])
+            if self.project_id and not batch_project:
+                if self.add_issue_to_project(issue['node_id']) and journal is not None:
+                    journal.mark_added([key])
+            return 'created', {**issue, 'key': key}
+        
+        unplaced = []
+        
+        def collect(outcome: str, issue: Optional[Dict]) -> None:
+            results[outcome] += 1
+            if issue is not None and not issue.get('added'):
+                unplaced.append(issue)
+        
+        # Keep a couple of issues queued per worker and read the next only as one finishes
+        workers = max(1, max_workers)
+        in_flight = deque()
+        numbered_issues = enumerate(issues, 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                # Only errors from reading the input stop the batch
+                try:
+                    numbered = next(numbered_issues)
+                except StopIteration:
+                    break
+                except ValueError as e:
+                    results['input_error'] = str(e)
+                    print(f"❌ {e}; finishing the {len(in_flight)} issues already started")
+                    break
+                results['total'] += 1
+                in_flight.append(executor.submit(create, numbered))
+                if len(in_flight) >= 2 * workers:
+                    collect(*in_flight.popleft().result())
+            while in_flight:
+                collect(*in_flight.popleft().result())
+        
+        if batch_project and unplaced:
+            print(f"\n📌 Adding {len(unplaced)} issues to the project board...")
+            project_results = self.add_issues_to_project([issue['node_id'] for issue in unplaced])
+            results['project_failed'] = 0
+            added = []
+            for issue in unplaced:
+                result = project_results[issue['node_id']]
+                if result['error']:
+                    results['project_failed'] += 1
+                    print(f"   ⚠️  #{issue['number']} {issue['title']}: {result['error']}")
+                if result['item_id']:
+                    added.append(issue)
+            if journal is not None:
+                journal.mark_added([issue['key'] for issue in added])
+            print(f"   ✅ {len(unplaced) - results['project_failed']} issues added to Backlog")
         
         return results
 
+REQUIRED_FIELDS = ('title', 'body')
+
+# Insignificant whitespace between JSON values
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# A value cut off by the end of the buffer fails to decode within this many
+# characters of it (e.g. a partial "-Infinity" or \uXXXX escape), or as an
+# unterminated string; errors anywhere else are real
+TRUNCATION_WINDOW = 10
+
+def validate_issue(issue, index: int) -> Dict:
+    """Return the issue if it has the required structure, else raise ValueError"""
+    if not isinstance(issue, dict):
+        raise ValueError(f"Issue {index} is not a JSON object")
+    for field in REQUIRED_FIELDS:
+        if field not in issue:
+            raise ValueError(f"Issue {index} missing required field: {field}")
+    return issue
+
 def validate_issues_json(issues_data: List[Dict]) -> bool:
     """Validate the structure of issues JSON"""
-    required_fields = ['title', 'body']
-    
-    for i, issue in enumerate(issues_data):
-        for field in required_fields:
-            if field not in issue:
-                print(f"Error: Issue {i+1} missing required field: {field}")
-                return False
-                
+    try:
+        for i, issue in enumerate(issues_data, 1):
+            validate_issue(issue, i)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return False
     return True
 
+def iter_json_values(f: IO[str], chunk_size: int = 1 << 16) -> Iterator:
+    """Incrementally decode a JSON array, or NDJSON / concatenated JSON values.
+
+    The input is read `chunk_size` characters at a time and each value is
+    yielded as soon as it is complete, so memory holds about one value no
+    matter how large the file is. A top-level array yields its elements.
+    Raises json.JSONDecodeError (a ValueError) on malformed input, as soon as
+    the chunk holding the error has been read, and on input holding no JSON
+    value at all.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = '', 0, False
+    in_array = None
+    expect = 'value'  # inside an array: 'value', 'value_or_end', 'comma_or_end' or 'done'
+
+    while True:
+        pos = WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if eof:
+                break
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        char = buffer[pos]
+        if in_array is None:
+            in_array = char == '['
+            if in_array:
+                pos += 1
+                expect = 'value_or_end'
+                continue
+        if in_array:
+            if expect == 'done':
+                raise json.JSONDecodeError("Extra data", buffer, pos)
+            if char == ']' and expect != 'value':
+                pos += 1
+                expect = 'done'
+                continue
+            if expect == 'comma_or_end':
+                if char != ',':
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                pos += 1
+                expect = 'value'
+                continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            truncated = (e.pos >= len(buffer) - TRUNCATION_WINDOW
+                         or e.msg.startswith('Unterminated string'))
+            if eof or not truncated:
+                raise
+            # A value cut off at the end of the buffer: read more
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        if end == len(buffer) and not eof and not isinstance(value, (dict, list, str)):
+            # A number or literal at the end of the buffer may continue in the next chunk
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        pos = end
+        if in_array:
+            expect = 'comma_or_end'
+        yield value
+
+    if in_array is None:
+        # Empty or whitespace-only input, as json.load() would refuse it
+        raise json.JSONDecodeError("Expecting value", buffer, pos)
+    if in_array and expect != 'done':
+        raise json.JSONDecodeError("Unterminated array", buffer, pos)
+
+def read_issues(path: str, chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    """Stream validated issues from a JSON array or NDJSON file.
+
+    Issues are parsed and validated one at a time as the caller consumes
+    them, so creation can start before the file has been read. Raises
+    ValueError for malformed JSON or an issue missing required fields.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for i, issue in enumerate(iter_json_values(f, chunk_size), 1):
+            yield validate_issue(issue, i)
+
 def main():
     parser = argparse.ArgumentParser(
         description='Create GitHub issues from LUMIN.AI PRD requirements with project board integration'
     )
     parser.add_argument(
         'json_file',
-        help='Path to JSON file containing issues data'
+        help='Path to the issues file: a JSON array of issues, or NDJSON with one issue per line'
     )
     parser.add_argument(
         '--token',
@@ -319,7 +998,41 @@ def main():
         '--delay',
         type=float,
         default=1.0,
-        help='Delay between issue creation in seconds (default: 1.0)'
+        help='Minimum delay between content-creating requests in seconds (default: 1.0)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Issues to create concurrently (default: 4)'
+    )
+    parser.add_argument(
+        '--project-batch-size',
+        type=int,
+        default=50,
+        help='Issues added to the project board per GraphQL request; 1 adds each '
+             'issue right after creating it (default: 50)'
+    )
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=10,
+        help='Keep-alive connections kept open to the API (default: 10)'
+    )
+    parser.add_argument(
+        '--api-url',
+        default='https://api.github.com',
+        help='GitHub API base URL, e.g. for GitHub Enterprise (default: https://api.github.com)'
+    )
+    parser.add_argument(
+        '--journal',
+        help='Journal file recording import progress so an interrupted run can be '
+             'resumed without duplicates (default: .logs/gh-issues-<owner>-<repo>.db)'
+    )
+    parser.add_argument(
+        '--no-journal',
+        action='store_true',
+        help='Create every issue without consulting a journal or existing issues'
     )
     parser.add_argument(
         '--dry-run',
@@ -329,41 +1042,36 @@ def main():
     
     args = parser.parse_args()
     
-    # Load issues from JSON file
-    try:
-        with open(args.json_file, 'r') as f:
-            issues_data = json.load(f)
-    except FileNotFoundError:
+    # Issues are streamed from the file and validated as they are read
+    if not os.path.isfile(args.json_file):
         print(f"Error: File '{args.json_file}' not found")
         sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in file - {e}")
-        sys.exit(1)
-    
-    # Validate issues structure
-    if not validate_issues_json(issues_data):
-        sys.exit(1)
-    
-    print(f"\n📊 Loaded {len(issues_data)} issues from {args.json_file}")
+    issues = read_issues(args.json_file)
     
     # Dry run - just preview
     if args.dry_run:
         print("\n🔍 DRY RUN - Issues to be created:\n")
-        for i, issue in enumerate(issues_data, 1):
-            print(f"{i}. {issue['title']}")
-            print(f"   Labels: {', '.join(issue.get('labels', []))}")
-            print(f"   Milestone: {issue.get('milestone', 'None')}")
-            print()
+        try:
+            for i, issue in enumerate(issues, 1):
+                print(f"{i}. {issue['title']}")
+                print(f"   Labels: {', '.join(issue.get('labels', []))}")
+                print(f"   Milestone: {issue.get('milestone', 'None')}")
+                print()
+        except ValueError as e:
+            print(f"Error: Invalid issues file - {e}")
+            sys.exit(1)
         return
     
     # Create GitHub client
-    creator = GitHubIssueCreator(args.token, args.owner, args.repo)
+    creator = GitHubIssueCreator(args.token, args.owner, args.repo, api_url=args.api_url,
+                                 project_batch_size=args.project_batch_size,
+                                 pool_size=max(args.pool_size, args.workers))
     
     # Determine if we should use project board
     project_name = None if args.no_project else args.project
     
     # Confirm before proceeding
-    print(f"\n⚠️  This will create {len(issues_data)} issues in {args.owner}/{args.repo}")
+    print(f"\n⚠️  This will create the issues in {args.json_file} in {args.owner}/{args.repo}")
     if project_name:
         print(f"   Issues will be added to project: {project_name}")
     confirm = input("Continue? (y/N): ")
@@ -373,7 +1081,14 @@ def main():
         return
     
     # Create issues
-    results = creator.create_issues_batch(issues_data, args.delay, project_name)
+    journal = None
+    if not args.no_journal:
+        journal = IssueJournal(args.journal or os.path.join('.logs', f"gh-issues-{args.owner}-{args.repo}.db"))
+    try:
+        results = creator.create_issues_batch(issues, args.delay, project_name, args.workers, journal)
+    finally:
+        if journal is not None:
+            journal.close()
     
     # Summary
     print("\n" + "="*50)
@@ -381,8 +1096,26 @@ def main():
     print("="*50)
     print(f"Total issues: {results['total']}")
     print(f"✅ Created: {results['created']}")
+    if results['skipped']:
+        print(f"⏭️  Already created: {results['skipped']}")
     print(f"❌ Failed: {results['failed']}")
+    if results.get('project_failed'):
+        print(f"⚠️  Not fully added to the project board: {results['project_failed']}")
     
+    http = creator.stats.summary(creator.adapter)
+    if http['requests']:
+        line = (f"📡 {http['requests']} API requests over {http['connections']} connections "
+                f"({http['reuse_rate']:.0%} reused)")
+        # Latency is only known for requests that got a response
+        if 'latency_p50_ms' in http:
+            line += f", latency p50 {http['latency_p50_ms']:.0f}ms p95 {http['latency_p95_ms']:.0f}ms"
+        print(line)
+    
+    if results.get('input_error'):
+        print(f"\n❌ Stopped at invalid input: {results['input_error']}")
+        if journal is not None:
+            print("   Fix the file and rerun; issues already created are skipped.")
+        sys.exit(1)
     if results['failed'] == 0:
         print("\n🎉 All issues created successfully!")
     else:
@@ -411,7 +1144,9 @@ Usage Instructions:
 
 4. Optional parameters:
    --dry-run              Preview without creating
-   --delay 2.0            Set delay between issues (default 1 second)
+   --delay 2.0            Set delay between content-creating requests (default 1 second)
+   --workers 8            Create up to 8 issues at a time (default 4)
+   --api-url URL          Use a different API endpoint (e.g. GitHub Enterprise)
    --owner uelkerd        Change repo owner
    --repo lumin-ai        Change repo name
    --project "My Board"   Use different project board
@@ -5,13 +5,27 @@ This script checks if Git LFS is properly configured and working by:
 1. Checking if .gitattributes exists and contains LFS tracking patterns
 2. Checking if any LFS-tracked files exist in the repository
 3. Verifying that these files are properly tracked by Git LFS
+
+The git commands the checks need are independent, so they are started
+together up front and their results are shared through a memoizing cache:
+each distinct command runs once per invocation, however many checks use it.
 """
 
+import argparse
+import contextlib
+import io
+import json
 import subprocess
 import sys
+import threading
+import time
 from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+SAMPLE_FILE = Path("data/examples/sample_data.csv")
 
 
 def run_git_command(args: Sequence[str]) -> Optional[str]:
@@ -46,7 +60,80 @@ def run_git_command(args: Sequence[str]) -> Optional[str]:
         return None
 
 
-def check_gitattributes() -> bool:
+class GitCommandCache:
+    """Memoized git command results shared by all checks.
+
+    The first request for a command runs it; concurrent and later requests
+    for the same arguments wait for and reuse that result. Commands can be
+    started ahead of time on a thread pool with ``prefetch``.
+    """
+
+    def __init__(
+        self,
+        runner: Optional[Callable[[Sequence[str]], Optional[str]]] = None,
+        max_workers: int = 4,
+    ) -> None:
+        self.runner = runner or run_git_command
+        self.max_workers = max_workers
+        self.timings: Dict[Tuple[str, ...], float] = {}
+        self.hits: Dict[Tuple[str, ...], int] = {}
+        self._results: Dict[Tuple[str, ...], "Future[Optional[str]]"] = {}
+        self._lock = threading.Lock()
+
+    def run(self, args: Sequence[str]) -> Optional[str]:
+        """Return the output of ``git <args>``, running it at most once.
+
+        Args:
+            args: Git command arguments (without 'git' prefix)
+
+        Returns:
+            Command output as string or None if error
+        """
+        key = tuple(args)
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                future = self._results[key] = Future()
+            else:
+                self.hits[key] = self.hits.get(key, 0) + 1
+        if owner:
+            start = time.perf_counter()
+            try:
+                result = self.runner(key)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                self.timings[key] = time.perf_counter() - start
+            future.set_result(result)
+        return future.result()
+
+    def prefetch(self, commands: Sequence[Sequence[str]]) -> None:
+        """Run independent commands concurrently and cache their results.
+
+        Args:
+            commands: Argument lists of the commands to start
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(self.run, commands))
+
+    def report(self) -> List[Dict[str, object]]:
+        """Per-command timings and cache hits, slowest first."""
+        return [
+            {"command": "git " + " ".join(key), "seconds": round(seconds, 4),
+             "cache_hits": self.hits.get(key, 0)}
+            for key, seconds in sorted(self.timings.items(), key=lambda item: -item[1])
+        ]
+
+
+# Commands run by the checks below
+LFS_VERSION = ("lfs", "version")
+LFS_LS_FILES = ("lfs", "ls-files")
+SAMPLE_LS_FILES = ("ls-files", str(SAMPLE_FILE))
+
+
+def check_gitattributes(git: GitCommandCache) -> bool:
     """Check if .gitattributes exists and contains LFS patterns."""
     gitattributes_path = Path(".gitattributes")
 
@@ -70,9 +157,9 @@ def check_gitattributes() -> bool:
     return True
 
 
-def check_git_lfs_installed() -> bool:
+def check_git_lfs_installed(git: GitCommandCache) -> bool:
     """Check if Git LFS is installed."""
-    result = run_git_command(["lfs", "version"])
+    result = git.run(LFS_VERSION)
     if result is None:
         print("❌ Git LFS is not installed!")
         return False
@@ -81,9 +168,9 @@ def check_git_lfs_installed() -> bool:
     return True
 
 
-def check_lfs_files() -> bool:
+def check_lfs_files(git: GitCommandCache) -> bool:
     """Check if any LFS-tracked files exist in the repository."""
-    result = run_git_command(["lfs", "ls-files"])
+    result = git.run(LFS_LS_FILES)
     if result is None or result == "":
         print("i No LFS-tracked files found in the repository yet")
         return True
@@ -102,21 +189,21 @@ def check_lfs_files() -> bool:
     return True
 
 
-def check_sample_file() -> bool:
+def check_sample_file(git: GitCommandCache) -> bool:
     """Check if our sample CSV file is properly tracked by Git LFS."""
-    sample_file = Path("data/examples/sample_data.csv")
+    sample_file = SAMPLE_FILE
     if not sample_file.exists():
         print("i Sample CSV file not found, skipping check")
         return True
 
     # Check if the file is tracked by Git
-    result = run_git_command(["ls-files", str(sample_file)])
+    result = git.run(SAMPLE_LS_FILES)
     if result is None or result == "":
         print("i Sample CSV file is not yet tracked by Git, skipping check")
         return True
 
-    # Check if the file is tracked by Git LFS - safer approach without grep
-    lfs_files_output = run_git_command(["lfs", "ls-files"])
+    # Check if the file is tracked by Git LFS - reuses check_lfs_files' listing
+    lfs_files_output = git.run(LFS_LS_FILES)
     if not lfs_files_output or str(sample_file) not in lfs_files_output:
         print(f"❌ Sample file {sample_file} is not tracked by Git LFS!")
         print('   Run \'git lfs track "*.csv"\' and re-add the file')
@@ -126,14 +213,74 @@ def check_sample_file() -> bool:
     return True
 
 
-def main() -> int:
+CHECKS = [check_git_lfs_installed, check_gitattributes, check_lfs_files, check_sample_file]
+
+
+def run_checks(git: GitCommandCache, quiet: bool = False) -> Dict[str, object]:
+    """Run all checks and collect a report.
+
+    The git commands are prefetched concurrently, then the checks run in
+    order against the cache so their output stays readable. Like before,
+    the checks stop at the first failure.
+
+    Args:
+        git: Command cache shared by the checks
+        quiet: Capture all output in the report instead of printing it
+
+    Returns:
+        Report with the overall result, per-check results and timings, and
+        per-command timings
+    """
+    start = time.perf_counter()
+    errors = io.StringIO()
+    # Prefetch threads print through the same (redirected) sys.stdout
+    with contextlib.redirect_stdout(errors) if quiet else contextlib.nullcontext():
+        git.prefetch([LFS_VERSION, LFS_LS_FILES, SAMPLE_LS_FILES])
+    prefetch_seconds = time.perf_counter() - start
+
+    checks = []
+    for check in CHECKS:
+        check_start = time.perf_counter()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+            passed = check(git)
+        checks.append({
+            "name": check.__name__,
+            "passed": passed,
+            "seconds": round(time.perf_counter() - check_start, 4),
+            "output": output.getvalue().strip().splitlines(),
+        })
+        if not passed:
+            break
+
+    return {
+        "passed": all(check["passed"] for check in checks),
+        "errors": errors.getvalue().strip().splitlines(),
+        "checks": checks,
+        "commands": git.report(),
+        "prefetch_seconds": round(prefetch_seconds, 4),
+        "total_seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
     """Run all checks and report status."""
-    print("🔍 Verifying Git LFS setup for LUMIN.AI project...\n")
+    parser = argparse.ArgumentParser(description="Verify Git LFS setup for LUMIN.AI project")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a JSON report with per-check results and timings instead of text",
+    )
+    args = parser.parse_args(argv)
+
+    if args.json:
+        report = run_checks(GitCommandCache(), quiet=True)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0 if report["passed"] else 1
 
-    checks = [check_git_lfs_installed, check_gitattributes,
-              check_lfs_files, check_sample_file]
+    print("🔍 Verifying Git LFS setup for LUMIN.AI project...\n")
 
-    all_passed = all(check() for check in checks)
+    all_passed = run_checks(GitCommandCache())["passed"]
 
     print("\n" + "=" * 50)
     if all_passed:
@@ -38,6 +38,7 @@ extras = {
     "test": [
         "pytest==7.4.0",
         "pytest-cov==4.1.0",
+        "pytest-benchmark>=4.0.0",
     ],
 }
 
@@ -0,0 +1,154 @@
+"""Vectorized counterparts of the arithmetic in :mod:`lumin_ai.utils`.
+
+Each function accepts scalars, NumPy arrays and pandas Series, broadcasts
+its operands like a NumPy ufunc and can write into a preallocated ``out``
+array. Series keep their index and name; two Series must share an index,
+since positional arithmetic on misaligned data would silently mix rows.
+
+NumPy is an optional dependency: the module imports without it, and the
+functions raise ImportError when called.
+"""
+
+from typing import Any, Optional, Tuple
+
+
+try:
+    import numpy as np
+except ImportError:  # the core package installs without the data science extras
+    np = None  # type: ignore[assignment]
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None  # type: ignore[assignment]
+
+
+ZERO_DIVISION_POLICIES = ("raise", "nan", "mask")
+
+
+def add(a: Any, b: Any, out: Optional["np.ndarray"] = None) -> Any:
+    """Add two operands element-wise.
+
+    Args:
+        a: First operand (scalar, array or Series)
+        b: Second operand, broadcastable against a
+        out: Array to write the result into instead of allocating one
+
+    Returns:
+        a + b as an array (a Series for Series input)
+    """
+    return _apply("add", a, b, out)
+
+
+def subtract(a: Any, b: Any, out: Optional["np.ndarray"] = None) -> Any:
+    """Subtract b from a element-wise.
+
+    Args:
+        a: First operand (scalar, array or Series)
+        b: Second operand, broadcastable against a
+        out: Array to write the result into instead of allocating one
+
+    Returns:
+        a - b as an array (a Series for Series input)
+    """
+    return _apply("subtract", a, b, out)
+
+
+def multiply(a: Any, b: Any, out: Optional["np.ndarray"] = None) -> Any:
+    """Multiply two operands element-wise.
+
+    Args:
+        a: First operand (scalar, array or Series)
+        b: Second operand, broadcastable against a
+        out: Array to write the result into instead of allocating one
+
+    Returns:
+        a * b as an array (a Series for Series input)
+    """
+    return _apply("multiply", a, b, out)
+
+
+def divide(
+    a: Any, b: Any, out: Optional["np.ndarray"] = None, zero_division: str = "raise"
+) -> Any:
+    """Divide a by b element-wise.
+
+    Args:
+        a: Numerator (scalar, array or Series)
+        b: Denominator, broadcastable against a
+        out: Float array to write the result into instead of allocating one
+        zero_division: What to do where b is zero: ``"raise"`` a
+            ZeroDivisionError before computing anything, return ``"nan"`` in
+            those positions, or ``"mask"`` them in a ``numpy.ma.MaskedArray``
+            (missing values for Series input)
+
+    Returns:
+        a / b as an array (a Series for Series input). With ``"mask"`` and
+        ``out`` the masked array is a view of ``out``, whose masked positions
+        hold NaN.
+
+    Raises:
+        ZeroDivisionError: If b has a zero and zero_division is "raise"
+        ValueError: If zero_division is not a known policy
+    """
+    if zero_division not in ZERO_DIVISION_POLICIES:
+        raise ValueError(
+            f"zero_division must be one of {ZERO_DIVISION_POLICIES}, got {zero_division!r}"
+        )
+    _require_numpy()
+    (a_values, b_values), index, name = _unwrap(a, b)
+
+    zeros = np.equal(b_values, 0)
+    has_zeros = bool(np.any(zeros))
+    if has_zeros and zero_division == "raise":
+        raise ZeroDivisionError("Cannot divide by zero")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.true_divide(a_values, b_values, out=out)
+    if has_zeros:
+        if zero_division == "nan" and out is None:
+            # [()] unwraps the 0-d array np.where gives for scalar operands
+            result = np.where(zeros, np.nan, result)[()]
+        elif zero_division == "nan":
+            np.copyto(out, np.nan, where=zeros)
+        else:
+            mask = np.broadcast_to(zeros, np.shape(result))
+            if out is not None:
+                np.copyto(out, np.nan, where=mask)
+            # broadcast_to gives a read-only view; the result's mask must be writable
+            result = np.ma.masked_array(result, mask=mask.copy())
+    return _wrap(result, index, name)
+
+
+def _apply(ufunc_name: str, a: Any, b: Any, out: Optional["np.ndarray"]) -> Any:
+    _require_numpy()
+    (a_values, b_values), index, name = _unwrap(a, b)
+    return _wrap(getattr(np, ufunc_name)(a_values, b_values, out=out), index, name)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("lumin_ai.array_ops requires numpy; install the 'data' extra")
+
+
+def _unwrap(*operands: Any) -> Tuple[Tuple[Any, ...], Any, Any]:
+    """Replace Series operands by their values, returning the shared index and name."""
+    index = name = None
+    values = []
+    for operand in operands:
+        if pd is not None and isinstance(operand, pd.Series):
+            if index is None:
+                index, name = operand.index, operand.name
+            elif not operand.index.equals(index):
+                raise ValueError("Series operands must share the same index; align them first")
+            operand = operand.to_numpy()
+        values.append(operand)
+    return tuple(values), index, name
+
+
+def _wrap(result: Any, index: Any, name: Any) -> Any:
+    if index is None:
+        return result
+    if isinstance(result, np.ma.MaskedArray):
+        result = result.filled(np.nan)
+    return pd.Series(result, index=index, name=name, copy=False)
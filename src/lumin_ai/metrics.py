@@ -0,0 +1,387 @@
+"""Runtime metrics for the LUMIN.AI pipeline and API.
+
+Counters and histograms aggregate per thread, so recording a value never
+takes a lock and is cheap enough for hot paths. Shards are merged when the
+registry is rendered, in the OpenMetrics text format when served over HTTP or
+in the Prometheus 0.0.4 text format the node_exporter textfile collector
+reads. A thread's shard is
+folded into a shared one when the thread exits, so short-lived threads don't
+accumulate shards.
+"""
+
+import bisect
+import math
+import os
+import tempfile
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Route label for requests that matched no route; raw paths would give unbounded cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+LabelValues = Tuple[str, ...]
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, "_Metric"] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric") -> None:
+        """Add a metric to the registry.
+
+        Args:
+            metric: Counter or histogram to expose
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+
+    def render(self, openmetrics: bool = True) -> str:
+        """Render all metrics in a text exposition format.
+
+        Args:
+            openmetrics: Use the OpenMetrics format; otherwise the Prometheus
+                0.0.4 text format, where a counter family is named after its
+                ``_total`` sample and there is no ``# EOF`` marker
+
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = []
+        for metric in metrics:
+            if openmetrics:
+                lines.append(f"# TYPE {metric.name} {metric.type_name}")
+                lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            else:
+                name = metric.name + "_total" if isinstance(metric, Counter) else metric.name
+                lines.append(f"# HELP {name} {_escape(metric.documentation, quotes=False)}")
+                lines.append(f"# TYPE {name} {metric.type_name}")
+            lines.extend(metric.samples())
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Atomically write the metrics in the 0.0.4 format for the textfile collector.
+
+        Args:
+            path: Destination ``.prom`` file
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render(openmetrics=False))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def start_http_server(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve the metrics on ``/metrics`` from a daemon thread.
+
+        Args:
+            port: Port to listen on (0 picks a free port)
+            host: Interface to bind
+
+        Returns:
+            The running server; call ``shutdown()`` to stop it
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+        thread.start()
+        return server
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Metric:
+    """Base class holding per-thread value shards."""
+
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional[MetricsRegistry] = REGISTRY,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Dict[LabelValues, Any]] = []
+        # Values of threads that have exited
+        self._retired: Dict[LabelValues, Any] = {}
+        self._shards_lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _shard(self) -> Dict[LabelValues, Any]:
+        """Return the calling thread's shard, creating it on first use."""
+        try:
+            return self._local.values  # type: ignore[no-any-return]
+        except AttributeError:
+            values: Dict[LabelValues, Any] = {}
+            with self._shards_lock:
+                self._shards.append(values)
+            self._local.values = values
+            # Thread-local data is released when the thread exits, which retires the shard
+            owner = _ShardOwner()
+            self._local.owner = owner
+            weakref.finalize(owner, self._retire, values)
+            return values
+
+    def _retire(self, values: Dict[LabelValues, Any]) -> None:
+        """Fold an exited thread's shard into the retired values."""
+        with self._shards_lock:
+            self._shards = [shard for shard in self._shards if shard is not values]
+            for key, value in values.items():
+                current = self._retired.get(key)
+                self._retired[key] = value if current is None else self._merge(current, value)
+
+    def _merge(self, a: Any, b: Any) -> Any:
+        raise NotImplementedError
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} is missing label {e}") from None
+
+    def _snapshots(self) -> Iterator[List[Tuple[LabelValues, Any]]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+            retired = list(self._retired.items())
+        yield retired
+        for shard in shards:
+            # list() over dict items runs without releasing the GIL
+            yield list(shard.items())
+
+    def _format_labels(self, key: LabelValues, extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def _merge(self, a: float, b: float) -> float:
+        return a + b
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Value for every label name of the counter
+
+        Raises:
+            ValueError: If amount is negative or labels don't match
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        key = self._key(labels) if labels or self.labelnames else ()
+        shard = self._shard()
+        shard[key] = shard.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current total across all threads."""
+        key = self._key(labels) if labels or self.labelnames else ()
+        return sum(value for snapshot in self._snapshots() for k, value in snapshot if k == key)
+
+    def samples(self) -> List[str]:
+        totals: Dict[LabelValues, float] = {}
+        for snapshot in self._snapshots():
+            for key, value in snapshot:
+                totals[key] = totals.get(key, 0.0) + value
+        return [
+            f"{self.name}_total{self._format_labels(key)} {_format_value(value)}"
+            for key, value in sorted(totals.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: Optional[MetricsRegistry] = REGISTRY,
+    ) -> None:
+        if list(buckets) != sorted(buckets):
+            raise ValueError("Histogram buckets must be sorted")
+        self.buckets = tuple(float(b) for b in buckets if not math.isinf(b))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _merge(self, a: List[float], b: List[float]) -> List[float]:
+        return [x + y for x, y in zip(a, b)]
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value (e.g. a duration in seconds)
+            **labels: Value for every label name of the histogram
+        """
+        key = self._key(labels) if labels or self.labelnames else ()
+        shard = self._shard()
+        state = shard.get(key)
+        if state is None:
+            # Per-bucket (non-cumulative) counts, then the +Inf bucket, sum and count
+            state = shard[key] = [0.0] * (len(self.buckets) + 3)
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall time of the enclosed block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> List[str]:
+        merged: Dict[LabelValues, List[float]] = {}
+        for snapshot in self._snapshots():
+            for key, state in snapshot:
+                target = merged.setdefault(key, [0.0] * len(state))
+                for i, value in enumerate(state):
+                    target[i] += value
+
+        lines = []
+        for key, state in sorted(merged.items()):
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), state):
+                cumulative += count
+                le = 'le="+Inf"' if math.isinf(bound) else f'le="{bound!r}"'
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(key, le)} {_format_value(cumulative)}"
+                )
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {_format_value(state[-1])}")
+        return lines
+
+
+class _ShardOwner:
+    """Per-thread sentinel whose collection signals that its thread exited."""
+
+    __slots__ = ("__weakref__",)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency in ``API_REQUEST_DURATION``.
+
+    Requests are labelled with the route template the router matched (e.g.
+    ``/trust-metrics/{group}``), or ``unmatched``, never the raw path.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope.get("type") != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": "500"}
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            if message.get("type") == "http.response.start":
+                status["code"] = str(message.get("status", 500))
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            API_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                method=scope.get("method", ""),
+                route=_route_template(scope),
+                status=status["code"],
+            )
+
+
+def _route_template(scope: Dict[str, Any]) -> str:
+    # Starlette/FastAPI routers store the matched route in the (shared) scope
+    path = getattr(scope.get("route"), "path", None)
+    return path if isinstance(path, str) and path else UNMATCHED_ROUTE
+
+
+def _escape(value: str, quotes: bool = True) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    # 0.0.4 HELP text leaves double quotes as they are
+    return value.replace('"', '\\"') if quotes else value
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# Pipeline and API metrics
+ROWS_LOADED = Counter(
+    "lumin_pipeline_rows_loaded", "Survey rows loaded by the data pipeline", ["wave"]
+)
+STAGE_DURATION = Histogram(
+    "lumin_pipeline_stage_duration_seconds", "Wall time of data pipeline stages", ["stage"]
+)
+API_REQUEST_DURATION = Histogram(
+    "lumin_api_request_duration_seconds",
+    "Latency of API requests",
+    ["method", "route", "status"],
+)
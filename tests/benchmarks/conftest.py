@@ -0,0 +1,82 @@
+"""Fixtures for the data pipeline benchmark suite.
+
+Benchmarks are skipped in regular test runs and only execute when pytest is
+invoked with ``--benchmark-only`` (see the Testing section of the README).
+"""
+
+# Third-party imports
+import pytest
+
+
+BENCHMARK_DIR = "benchmarks"
+
+# Number of survey responses per benchmark dataset
+SCALES = [1_000, 10_000, 100_000]
+
+# Number of distinct demographic groups in the synthetic data
+GROUP_COUNTS = [4, 32]
+
+REGIONS = [
+    "Wien",
+    "Niederösterreich",
+    "Oberösterreich",
+    "Salzburg",
+    "Tirol",
+    "Vorarlberg",
+    "Kärnten",
+    "Steiermark",
+    "Burgenland",
+]
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """Skip benchmarks unless the run was started with --benchmark-only."""
+    if config.getoption("benchmark_only", default=False):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="benchmarks only run with --benchmark-only")
+    for item in items:
+        if BENCHMARK_DIR in item.path.parts:
+            item.add_marker(skip_benchmark)
+
+
+def _build_survey_frame(n_rows: int, n_groups: int, seed: int = 42):
+    """Build a raw Democracy Radar style survey frame with realistic gaps."""
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "v1_trust_government": rng.normal(5, 1.5, n_rows).clip(0, 10),
+            "v2_trust_parliament": rng.normal(4.5, 1.3, n_rows).clip(0, 10),
+            "v3_trust_courts": rng.normal(6, 1.2, n_rows).clip(0, 10),
+            "v4_transparency_perception": rng.normal(5.5, 1.4, n_rows).clip(0, 10),
+            "v5_participation_frequency": rng.normal(4.8, 1.6, n_rows).clip(0, 10),
+            "demo_age": rng.integers(0, n_groups, n_rows).astype(str),
+            "demo_region": rng.choice(REGIONS, n_rows),
+        }
+    )
+
+    # Knock out ~5% of the trust answers so median imputation has work to do
+    missing = rng.random(n_rows) < 0.05
+    df.loc[missing, "v1_trust_government"] = np.nan
+    return df
+
+
+@pytest.fixture
+def make_survey_frame():
+    """Factory for synthetic raw survey frames of a given size and group count."""
+    return _build_survey_frame
+
+
+@pytest.fixture(params=SCALES, ids=lambda n: f"rows={n}")
+def n_rows(request) -> int:
+    """Dataset size for the current benchmark."""
+    return request.param
+
+
+@pytest.fixture(params=GROUP_COUNTS, ids=lambda n: f"groups={n}")
+def n_groups(request) -> int:
+    """Demographic group count for the current benchmark."""
+    return request.param
@@ -0,0 +1,65 @@
+"""Benchmarks for lumin_ai.array_ops against scalar loops over lumin_ai.utils."""
+
+# Third-party imports
+import pytest
+
+# Project imports
+from lumin_ai import array_ops, utils
+
+
+SIZES = [1_000, 100_000]
+
+
+@pytest.fixture(params=SIZES, ids=lambda n: f"size={n}")
+def operands(request):
+    """Metric-like numerators and strictly positive denominators."""
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(42)
+    return rng.normal(5, 1.5, request.param), rng.uniform(1, 10, request.param)
+
+
+def test_divide_scalar_loop(benchmark, operands) -> None:
+    """Baseline: utils.divide called once per element."""
+    a, b = operands
+    values_a, values_b = a.tolist(), b.tolist()
+
+    benchmark.group = f"divide[size={len(a)}]"
+    result = benchmark(lambda: [utils.divide(x, y) for x, y in zip(values_a, values_b)])
+
+    assert len(result) == len(a)
+
+
+def test_divide_vectorized(benchmark, operands) -> None:
+    """array_ops.divide over the whole array, writing into a reused buffer."""
+    np = pytest.importorskip("numpy")
+    a, b = operands
+    out = np.empty_like(a)
+
+    benchmark.group = f"divide[size={len(a)}]"
+    result = benchmark(array_ops.divide, a, b, out=out)
+
+    np.testing.assert_allclose(result, a / b)
+
+
+@pytest.mark.parametrize("policy", ["nan", "mask"])
+def test_divide_zero_policy(benchmark, operands, policy) -> None:
+    """Cost of the NaN and mask policies when some denominators are zero."""
+    a, b = operands
+    b = b.copy()
+    b[::100] = 0.0
+
+    benchmark.group = f"divide[size={len(a)}]"
+    result = benchmark(array_ops.divide, a, b, zero_division=policy)
+
+    assert len(result) == len(a)
+
+
+def test_multiply_series(benchmark, operands) -> None:
+    """array_ops.multiply on pandas Series, which keep their index."""
+    pd = pytest.importorskip("pandas")
+    a, b = (pd.Series(values) for values in operands)
+
+    benchmark.group = f"multiply_series[size={len(a)}]"
+    result = benchmark(array_ops.multiply, a, b)
+
+    assert result.index.equals(a.index)
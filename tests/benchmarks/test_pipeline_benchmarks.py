@@ -0,0 +1,104 @@
+"""Benchmarks for the DemocracyRadarProcessor hot paths."""
+
+# Third-party imports
+import pytest
+
+
+WAVES = 3
+
+
+@pytest.fixture
+def processor(setup_pipeline, tmp_path):
+    """A processor rooted in an isolated data directory."""
+    return setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+
+
+def test_load_democracy_radar_data(benchmark, processor, make_survey_frame, n_rows) -> None:
+    """Benchmark loading and concatenating all waves from disk."""
+    processor.raw_dir.mkdir(parents=True)
+    for wave in range(1, WAVES + 1):
+        make_survey_frame(n_rows // WAVES, 8, seed=wave).to_csv(
+            processor.raw_dir / f"wave-{wave}.csv", index=False
+        )
+
+    benchmark.group = "load_democracy_radar_data"
+    benchmark.extra_info["rows"] = n_rows
+    df = benchmark(processor.load_democracy_radar_data)
+
+    assert len(df) == (n_rows // WAVES) * WAVES
+
+
+def test_standardize_data(benchmark, processor, make_survey_frame, n_rows) -> None:
+    """Benchmark column renaming, region mapping and median imputation."""
+    raw = make_survey_frame(n_rows, 8)
+
+    benchmark.group = "standardize_data"
+    benchmark.extra_info["rows"] = n_rows
+    df = benchmark(processor.standardize_data, raw)
+
+    assert df["trust_government"].notna().all()
+
+
+def test_calculate_trust_metrics(benchmark, processor, make_survey_frame, n_rows, n_groups) -> None:
+    """Benchmark trust metric aggregation across demographic groups."""
+    df = processor.standardize_data(make_survey_frame(n_rows, n_groups))
+
+    benchmark.group = f"calculate_trust_metrics[groups={n_groups}]"
+    benchmark.extra_info.update({"rows": n_rows, "groups": n_groups})
+    metrics = benchmark(processor.calculate_trust_metrics, df)
+
+    assert len(metrics) == n_groups + 1
+
+
+def test_calculate_confidence_interval(benchmark, processor, make_survey_frame, n_rows) -> None:
+    """Benchmark the t-distribution confidence interval."""
+    series = processor.standardize_data(make_survey_frame(n_rows, 8))["trust_courts"]
+
+    benchmark.group = "_calculate_confidence_interval"
+    benchmark.extra_info["rows"] = n_rows
+    lower, upper = benchmark(processor._calculate_confidence_interval, series)
+
+    assert lower <= series.mean() <= upper
+
+
+@pytest.mark.parametrize("groups", [4, 32, 256], ids=lambda n: f"groups={n}")
+def test_export_for_api(benchmark, processor, make_survey_frame, tmp_path, groups) -> None:
+    """Benchmark serializing trust metrics to the API JSON format."""
+    df = processor.standardize_data(make_survey_frame(10_000, groups))
+    metrics = processor.calculate_trust_metrics(df)
+    output_file = tmp_path / "trust_metrics_api.json"
+
+    benchmark.group = "export_for_api"
+    benchmark.extra_info["groups"] = groups
+    api_data = benchmark(processor.export_for_api, metrics, output_file)
+
+    assert api_data["metadata"]["total_groups"] == groups + 1
+
+
+def test_calculate_trust_time_series(benchmark, processor, make_survey_frame, n_rows, n_groups) -> None:
+    """Benchmark the per-wave, per-group trust series with windows and deltas."""
+    df = processor.standardize_data(make_survey_frame(n_rows, n_groups))
+    df["wave"] = [i % 10 + 1 for i in range(n_rows)]
+
+    benchmark.group = f"calculate_trust_time_series[groups={n_groups}]"
+    benchmark.extra_info.update({"rows": n_rows, "groups": n_groups})
+    series = benchmark(processor.calculate_trust_time_series, df, windows=(3, 5))
+
+    # Small samples leave some (group, wave) cells empty
+    assert series.index.get_level_values("group").nunique() == n_groups + 1
+    assert len(series) <= (n_groups + 1) * 10
+
+
+@pytest.mark.parametrize("chunk_size", [None, 10_000], ids=["single-pass", "chunked"])
+def test_calculate_reliability(benchmark, processor, make_survey_frame, n_rows, n_groups, chunk_size) -> None:
+    """Benchmark Cronbach's alpha for every group and wave from Gram-matrix accumulators."""
+    df = processor.standardize_data(make_survey_frame(n_rows, n_groups))
+    df["wave"] = [i % 10 + 1 for i in range(n_rows)]
+
+    benchmark.group = f"calculate_reliability[groups={n_groups}]"
+    benchmark.extra_info.update({"rows": n_rows, "groups": n_groups, "chunk_size": chunk_size})
+    reliability = benchmark(
+        processor.calculate_reliability, df, by_wave=True, chunk_size=chunk_size
+    )
+
+    assert reliability.index.get_level_values("group").nunique() == n_groups + 1
@@ -0,0 +1,51 @@
+"""Shared fixtures for the LUMIN.AI test suite."""
+
+# Standard library imports
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+# Third-party imports
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_module_from_path(name: str, relative_path: str) -> ModuleType:
+    """Import a standalone script (e.g. one with a hyphenated filename) as a module."""
+    spec = importlib.util.spec_from_file_location(name, REPO_ROOT / relative_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def setup_pipeline() -> ModuleType:
+    """The data science pipeline module from data-science/setup_pipeline.py."""
+    pytest.importorskip("pandas")
+    pytest.importorskip("scipy")
+    return load_module_from_path("setup_pipeline", "data-science/setup_pipeline.py")
+
+
+@pytest.fixture(scope="session")
+def monitor_module() -> ModuleType:
+    """The container performance monitor from scripts/container-performance-monitor.py."""
+    return load_module_from_path(
+        "container_performance_monitor", "scripts/container-performance-monitor.py"
+    )
+
+
+@pytest.fixture(scope="session")
+def issue_creator_module() -> ModuleType:
+    """The GitHub issue creator from scripts/gh-issue-creator.py."""
+    return load_module_from_path("gh_issue_creator", "scripts/gh-issue-creator.py")
+
+
+@pytest.fixture(scope="session")
+def verify_lfs_module() -> ModuleType:
+    """The Git LFS verification script from scripts/verify_git_lfs.py."""
+    return load_module_from_path("verify_git_lfs", "scripts/verify_git_lfs.py")
@@ -0,0 +1,99 @@
+"""Tests for the array_ops module."""
+
+# Third-party imports
+import pytest
+
+
+np = pytest.importorskip("numpy")
+
+# Project imports
+from lumin_ai import array_ops  # noqa: E402
+
+
+def test_elementwise_operations_broadcast() -> None:
+    """Arrays broadcast against scalars and against each other like ufuncs."""
+    column = np.array([[1.0], [2.0], [3.0]])
+    row = np.array([10.0, 20.0])
+
+    np.testing.assert_array_equal(array_ops.add(column, row), column + row)
+    np.testing.assert_array_equal(array_ops.subtract(row, 1), [9.0, 19.0])
+    np.testing.assert_array_equal(array_ops.multiply(column, 2), [[2.0], [4.0], [6.0]])
+    np.testing.assert_array_equal(array_ops.divide(row, column), row / column)
+    assert array_ops.add(2, 3) == 5
+
+
+def test_out_buffer_is_reused() -> None:
+    """Results are written into the given buffer instead of a new array."""
+    a = np.arange(5, dtype=float)
+    out = np.empty(5)
+
+    result = array_ops.multiply(a, a, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, a * a)
+
+    result = array_ops.divide(a, 2.0, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, a / 2)
+
+
+def test_zero_division_raise_checks_before_writing() -> None:
+    """The default policy raises like utils.divide and leaves out untouched."""
+    out = np.full(3, 7.0)
+    with pytest.raises(ZeroDivisionError, match="Cannot divide by zero"):
+        array_ops.divide(np.ones(3), np.array([1.0, 0.0, 2.0]), out=out)
+    np.testing.assert_array_equal(out, 7.0)
+
+    with pytest.raises(ZeroDivisionError):
+        array_ops.divide(1, 0)
+
+
+def test_zero_division_nan_and_mask() -> None:
+    """Zero denominators become NaN or masked entries, broadcast to the result shape."""
+    a = np.array([[1.0, 2.0], [3.0, 4.0]])
+    b = np.array([0.0, 2.0])
+
+    np.testing.assert_array_equal(
+        array_ops.divide(a, b, zero_division="nan"), [[np.nan, 1.0], [np.nan, 2.0]]
+    )
+    masked = array_ops.divide(a, b, zero_division="mask")
+    assert isinstance(masked, np.ma.MaskedArray)
+    np.testing.assert_array_equal(masked.mask, [[True, False], [True, False]])
+    assert masked.sum() == 3.0
+
+    # The masked result is writable, data and mask alike
+    masked = array_ops.divide(np.array([1.0, 2.0]), np.array([0.0, 2.0]), zero_division="mask")
+    masked[0] = 5.0
+    masked.mask[1] = True
+    assert masked.data[0] == 5.0 and masked.mask.tolist() == [False, True]
+    broadcast = array_ops.divide(a, b, zero_division="mask")
+    broadcast.mask[0, 1] = True
+    assert broadcast.mask.sum() == 3
+
+    scalar = array_ops.divide(1, 0, zero_division="nan")
+    assert np.ndim(scalar) == 0 and np.isnan(scalar)
+    assert array_ops.divide(1.0, np.array([0.0]), zero_division="nan").shape == (1,)
+
+    out = np.empty((2, 2))
+    masked = array_ops.divide(a, b, out=out, zero_division="mask")
+    assert np.shares_memory(masked, out)
+    np.testing.assert_array_equal(out, [[np.nan, 1.0], [np.nan, 2.0]])
+
+    with pytest.raises(ValueError, match="zero_division"):
+        array_ops.divide(a, b, zero_division="ignore")
+
+
+def test_series_keep_index_and_require_alignment() -> None:
+    """Series in, Series out; differently indexed Series are rejected."""
+    pd = pytest.importorskip("pandas")
+    trust = pd.Series([4.0, 6.0, 8.0], index=["a", "b", "c"], name="trust")
+    counts = pd.Series([2.0, 0.0, 4.0], index=["a", "b", "c"])
+
+    total = array_ops.add(trust, np.ones(3))
+    assert isinstance(total, pd.Series)
+    assert list(total.index) == ["a", "b", "c"] and total.name == "trust"
+
+    ratio = array_ops.divide(trust, counts, zero_division="mask")
+    assert ratio.tolist()[0] == 2.0 and np.isnan(ratio["b"]) and ratio["c"] == 2.0
+
+    with pytest.raises(ValueError, match="same index"):
+        array_ops.add(trust, counts.reset_index(drop=True))
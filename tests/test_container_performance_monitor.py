@@ -0,0 +1,1052 @@
+"""Tests for scripts/container-performance-monitor.py."""
+
+# Standard library imports
+import asyncio
+import csv
+import http.client
+import io
+import json
+import logging
+import random
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+
+MB = 1024 * 1024
+
+
+def docker_stats(cpu_total: int, system_total: int) -> dict:
+    """A Docker Engine API stats object with two CPUs and fixed memory/IO."""
+    return {
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": cpu_total},
+            "system_cpu_usage": system_total,
+            "online_cpus": 2,
+        },
+        "precpu_stats": {
+            "cpu_usage": {"total_usage": cpu_total - 200},
+            "system_cpu_usage": system_total - 1000,
+        },
+        "memory_stats": {"usage": 200 * MB, "limit": 1000 * MB, "stats": {"cache": 50 * MB}},
+        "networks": {"eth0": {"rx_bytes": 3 * MB, "tx_bytes": MB}},
+        "blkio_stats": {
+            "io_service_bytes_recursive": [
+                {"op": "Read", "value": 4 * MB},
+                {"op": "Write", "value": 2 * MB},
+            ]
+        },
+        "pids_stats": {"current": 7},
+    }
+
+
+class FakeDockerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Minimal Docker Engine API on a Unix socket: stats streams and inspect."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str):
+        self.requests = []
+        # Stats streams stay open, like Docker's, until this is set
+        self.close_streams = threading.Event()
+        super().__init__(socket_path, FakeDockerHandler)
+
+
+class FakeDockerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self) -> str:
+        return "docker.sock"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.server.requests.append(self.path)
+        name = self.path.split("/")[2]
+        if "/stats" in self.path:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(2):
+                chunk = (json.dumps(docker_stats(1000 * (i + 1), 10000 * (i + 1))) + "\n").encode()
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.flush()
+            self.server.close_streams.wait(10)
+            try:
+                self.wfile.write(b"0\r\n\r\n")
+            except OSError:
+                pass  # the client already hung up
+        elif self.path.endswith("/json") and name != "missing":
+            body = json.dumps(
+                {"State": {"Status": "running", "StartedAt": "2024-01-01T00:00:00.123456789Z"}}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+
+@pytest.fixture
+def docker_socket(tmp_path):
+    """Path of a running fake Docker Engine API socket."""
+    socket_path = str(tmp_path / "docker.sock")
+    server = FakeDockerServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, socket_path
+    server.close_streams.set()
+    server.shutdown()
+    server.server_close()
+
+
+def wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_metrics_from_docker_stats(monitor_module) -> None:
+    """Engine API stats are converted the way `docker stats` reports them."""
+    metrics = monitor_module.metrics_from_docker_stats(
+        "db", docker_stats(5000, 50000), "running", ""
+    )
+
+    assert metrics.cpu_percent == pytest.approx(40.0)
+    assert metrics.memory_usage_mb == pytest.approx(150.0)
+    assert metrics.memory_percent == pytest.approx(15.0)
+    assert metrics.memory_limit_mb == pytest.approx(1000.0)
+    assert (metrics.network_rx_mb, metrics.network_tx_mb) == (3.0, 1.0)
+    assert (metrics.block_read_mb, metrics.block_write_mb) == (4.0, 2.0)
+    assert metrics.pids == 7
+    assert metrics.uptime_seconds == 0
+
+
+def test_stream_collector_reads_latest_sample(monitor_module, docker_socket) -> None:
+    """The collector streams stats per container and caches inspect data."""
+    server, socket_path = docker_socket
+    collector = monitor_module.DockerStatsStreamCollector(
+        ["app", "db"], socket_path=socket_path, reconnect_delay=60
+    )
+    collector.start()
+    try:
+        wait_for(lambda: len(collector._latest) == 2)
+        first = collector.collect("app")
+        second = collector.collect("app")
+    finally:
+        collector.stop()
+
+    assert first.status == second.status == "running"
+    assert first.uptime_seconds > 0
+    assert first.cpu_percent == pytest.approx(40.0)
+    assert server.requests.count("/containers/app/json") == 1
+    assert collector.collect("unknown") is None
+
+
+def test_stream_collector_drops_closed_and_stale_samples(
+    monitor_module, docker_socket, tmp_path, monkeypatch
+) -> None:
+    """Samples of closed streams and stale samples fall back to polling."""
+    server, socket_path = docker_socket
+    server.close_streams.set()
+    collector = monitor_module.DockerStatsStreamCollector(
+        ["app"], socket_path=socket_path, reconnect_delay=60
+    )
+    collector.start()
+    try:
+        wait_for(
+            lambda: "/containers/app/stats?stream=1" in server.requests
+            and "app" not in collector._connections
+        )
+        closed = collector.collect("app")
+        collector._latest["db"] = (time.monotonic() - 10, docker_stats(1000, 10000))
+        stale = collector.collect("db")
+
+        monitor = monitor_module.ContainerPerformanceMonitor(
+            ["app"], log_dir=str(tmp_path), collector=collector
+        )
+        polled = make_metrics(monitor_module, "app", 0)
+        monkeypatch.setattr(monitor, "get_container_stats", lambda name: polled)
+        fallback = monitor.collect_metrics("app")
+    finally:
+        collector.stop()
+
+    assert closed is None
+    assert stale is None
+    assert "app" not in collector._latest
+    assert fallback is polled
+
+
+def test_unreachable_socket_backs_off_and_logs_once(monitor_module, tmp_path, caplog) -> None:
+    """A missing Docker socket is retried with growing delays and one warning."""
+    collector = monitor_module.DockerStatsStreamCollector(
+        ["app"], socket_path=str(tmp_path / "missing.sock"),
+        reconnect_delay=0.01, max_reconnect_delay=0.08,
+    )
+    with caplog.at_level(logging.DEBUG):
+        collector.start()
+        time.sleep(0.5)
+        collector.stop()
+
+    retries = [r for r in caplog.records if "Stats stream for app" in r.getMessage()]
+    assert [r.levelno for r in retries].count(logging.WARNING) == 1
+    # 0.01 + 0.02 + 0.04 + 0.08 + 0.08... instead of one attempt per 0.01s
+    assert 3 <= len(retries) <= 10
+
+
+def test_docker_socket_from_env(monitor_module, monkeypatch) -> None:
+    """DOCKER_HOST picks the socket; TCP daemons have none."""
+    monkeypatch.delenv("DOCKER_HOST", raising=False)
+    assert monitor_module.docker_socket_from_env() == "/var/run/docker.sock"
+    monkeypatch.setenv("DOCKER_HOST", "unix:///run/user/1000/docker.sock")
+    assert monitor_module.docker_socket_from_env() == "/run/user/1000/docker.sock"
+    monkeypatch.setenv("DOCKER_HOST", "tcp://10.0.0.5:2376")
+    assert monitor_module.docker_socket_from_env() is None
+
+
+def test_stream_collector_inspect_failure(monitor_module, docker_socket) -> None:
+    """A failed inspect reports the container status as unknown."""
+    _, socket_path = docker_socket
+    collector = monitor_module.DockerStatsStreamCollector(["missing"], socket_path=socket_path)
+    collector._latest["missing"] = (time.monotonic(), docker_stats(1000, 10000))
+
+    metrics = collector.collect("missing")
+
+    assert metrics.status == "unknown"
+    assert metrics.uptime_seconds == 0
+
+
+class SlowCollector:
+    """Collector stub that takes a fixed time per container and records call times."""
+
+    def __init__(self, module, delay: float, stuck=()):
+        self.module = module
+        self.delay = delay
+        self.stuck = set(stuck)
+        self.calls = []
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def collect(self, container_name: str):
+        self.calls.append((container_name, time.monotonic()))
+        time.sleep(1 if container_name in self.stuck else self.delay)
+        return self.module.metrics_from_docker_stats(
+            container_name, docker_stats(1000, 10000), "running", ""
+        )
+
+
+@pytest.fixture
+def quiet_monitor(monitor_module, tmp_path):
+    """Factory for monitors that don't redraw the terminal."""
+
+    def make(containers, collector):
+        monitor = monitor_module.ContainerPerformanceMonitor(
+            containers, log_dir=str(tmp_path), collector=collector
+        )
+        monitor.display_real_time_metrics = lambda metrics: None
+        return monitor
+
+    return make
+
+
+def test_sampling_loop_is_concurrent_and_drift_free(monitor_module, quiet_monitor) -> None:
+    """50 containers at 50ms each still hold a 0.2s interval anchored to the start."""
+    containers = [f"c{i}" for i in range(50)]
+    collector = SlowCollector(monitor_module, delay=0.05)
+    monitor = quiet_monitor(containers, collector)
+
+    start = time.monotonic()
+    ticks = asyncio.run(monitor._sampling_loop(duration=1.0, interval=0.2, sample_timeout=1.0))
+
+    assert ticks == 5
+    assert len(monitor.metrics_history) == 250
+    first_calls = sorted(t for name, t in collector.calls if name == "c0")
+    for n, called_at in enumerate(first_calls):
+        assert called_at - start == pytest.approx(n * 0.2, abs=0.08)
+
+
+def test_sampling_loop_times_out_stuck_containers(monitor_module, quiet_monitor) -> None:
+    """A container that hangs is dropped from the tick instead of stalling it."""
+    collector = SlowCollector(monitor_module, delay=0.0, stuck=["hung"])
+    monitor = quiet_monitor(["ok", "hung"], collector)
+
+    asyncio.run(monitor._sampling_loop(duration=0.3, interval=0.3, sample_timeout=0.1))
+
+    assert [m.container_name for m in monitor.metrics_history] == ["ok"]
+
+
+def test_sampling_loop_skips_containers_still_collecting(monitor_module, quiet_monitor) -> None:
+    """A hung collection is not started again while its worker is still busy."""
+    collector = SlowCollector(monitor_module, delay=0.0, stuck=["hung"])
+    monitor = quiet_monitor(["ok", "hung"], collector)
+
+    ticks = asyncio.run(monitor._sampling_loop(duration=0.6, interval=0.15, sample_timeout=0.05))
+
+    assert ticks == 4
+    assert [name for name, _ in collector.calls].count("hung") == 1
+    assert [name for name, _ in collector.calls].count("ok") == 4
+
+
+def make_metrics(module, name: str, second: int, cpu: float = 10.0, memory: float = 20.0):
+    """A ContainerMetrics sample at a fixed second on 2024-01-01."""
+    return module.ContainerMetrics(
+        timestamp=f"2024-01-01T00:{second // 60:02d}:{second % 60:02d}.000001",
+        container_name=name,
+        cpu_percent=cpu,
+        memory_usage_mb=100.0,
+        memory_percent=memory,
+        memory_limit_mb=500.0,
+        network_rx_mb=1.0,
+        network_tx_mb=2.0,
+        block_read_mb=3.0,
+        block_write_mb=4.0,
+        pids=5,
+        status="running",
+        uptime_seconds=second,
+    )
+
+
+def test_ring_buffer_wraps_around(monitor_module) -> None:
+    """Once full, the buffer keeps only the newest values in order."""
+    buffer = monitor_module.RingBuffer(3)
+    for value in range(5):
+        buffer.append(value)
+
+    assert len(buffer) == 3
+    assert buffer.to_array().tolist() == [2.0, 3.0, 4.0]
+    assert buffer.latest() == 4.0
+    with pytest.raises(ValueError):
+        monitor_module.RingBuffer(0)
+
+
+def test_ring_buffer_tail(monitor_module) -> None:
+    """``tail`` returns the newest values in order, across the wrap point."""
+    buffer = monitor_module.RingBuffer(4)
+    for value in range(3):
+        buffer.append(value)
+    assert buffer.tail(5).tolist() == [0.0, 1.0, 2.0]
+
+    for value in range(3, 7):
+        buffer.append(value)
+    assert buffer.tail(3).tolist() == [4.0, 5.0, 6.0]
+    assert buffer.tail(0).tolist() == []
+
+
+def test_metric_history_is_bounded_and_ordered(monitor_module) -> None:
+    """History keeps capacity samples per container and iterates chronologically."""
+    history = monitor_module.MetricHistory(capacity=4)
+    for second in range(10):
+        history.append(make_metrics(monitor_module, "app", second, cpu=second))
+        history.append(make_metrics(monitor_module, "db", second, cpu=100 - second))
+
+    assert history.total_samples == 20
+    assert len(history) == 8
+    assert history.column("app", "cpu_percent").tolist() == [6.0, 7.0, 8.0, 9.0]
+    records = list(history)
+    assert [m.timestamp for m in records] == sorted(m.timestamp for m in records)
+    assert (records[-1].container_name, records[-1].cpu_percent) == ("db", 91.0)
+    assert records[-1].timestamp == make_metrics(monitor_module, "db", 9).timestamp
+
+
+def test_alert_history_is_bounded(monitor_module, tmp_path) -> None:
+    """Alerts are kept in a bounded deque while the total keeps counting."""
+    monitor = monitor_module.ContainerPerformanceMonitor(
+        ["app"], log_dir=str(tmp_path), history_size=2, alert_history_size=3
+    )
+    monitor.thresholds["alert_cooldown"] = 0.0
+    for second in range(5):
+        monitor.record_metrics(make_metrics(monitor_module, "app", second, cpu=95.0))
+
+    assert len(monitor.alerts_history) == 3
+    assert monitor.alerts_generated == 5
+    assert not hasattr(monitor.alerts_history[0], "__dict__")
+
+    monitor.export_metrics_to_csv("metrics.csv")
+    assert len((tmp_path / "metrics.csv").read_text().splitlines()) == 3
+
+
+def test_streaming_stats_match_batch_statistics(monitor_module) -> None:
+    """Welford moments are exact and P² percentiles land close to the true values."""
+    import random
+    import statistics
+
+    rng = random.Random(7)
+    values = [rng.gauss(50, 10) for _ in range(5000)]
+    stats = monitor_module.StreamingStats()
+    for value in values:
+        stats.update(value)
+
+    summary = stats.summary()
+    ordered = sorted(values)
+    assert summary["average"] == pytest.approx(statistics.mean(values))
+    assert summary["stddev"] == pytest.approx(statistics.stdev(values))
+    assert (summary["min"], summary["max"]) == (ordered[0], ordered[-1])
+    assert summary["p50"] == pytest.approx(ordered[2500], abs=1.0)
+    assert summary["p95"] == pytest.approx(ordered[4750], abs=1.0)
+    assert summary["p99"] == pytest.approx(ordered[4950], abs=1.5)
+
+
+def test_streaming_stats_small_samples(monitor_module) -> None:
+    """With fewer than five samples percentiles come from the sorted values."""
+    stats = monitor_module.StreamingStats()
+    assert stats.summary() == {}
+    for value in (3.0, 1.0, 2.0):
+        stats.update(value)
+
+    assert stats.summary()["p50"] == 2.0
+    assert stats.summary()["p99"] == 3.0
+
+
+def test_report_uses_ingest_time_aggregates(monitor_module, tmp_path) -> None:
+    """The report reflects every sample and alert even after history wrapped."""
+    monitor = monitor_module.ContainerPerformanceMonitor(
+        ["app", "db"], log_dir=str(tmp_path), history_size=2
+    )
+    monitor.thresholds["alert_cooldown"] = 0.0
+    for second in range(10):
+        monitor.record_metrics(make_metrics(monitor_module, "app", second, cpu=second * 10))
+    monitor.first_sample_at, monitor.last_sample_at = 100.0, 190.0
+
+    report = monitor.generate_performance_report()
+
+    app = report["container_statistics"]["app"]
+    assert app["samples"] == 10
+    assert app["cpu"]["average"] == pytest.approx(45.0)
+    assert (app["cpu"]["min"], app["cpu"]["max"]) == (0.0, 90.0)
+    assert app["alerts_count"] == 3
+    assert "db" not in report["container_statistics"]
+    assert report["monitoring_duration_minutes"] == pytest.approx(1.5)
+
+
+def test_io_rates_from_consecutive_samples(monitor_module, tmp_path) -> None:
+    """Rates use the monotonic gap between samples and ignore counter resets."""
+    monitor = monitor_module.ContainerPerformanceMonitor(["db"], log_dir=str(tmp_path))
+    first = make_metrics(monitor_module, "db", 0)
+    second = make_metrics(monitor_module, "db", 2)
+    second.sampled_at = first.sampled_at + 2.0
+    second.network_rx_mb, second.block_write_mb = 11.0, 0.0
+
+    monitor.record_metrics(first)
+    monitor.record_metrics(second)
+
+    assert first.network_rx_rate_mb_s == 0.0
+    assert second.network_rx_rate_mb_s == pytest.approx(5.0)
+    assert second.network_tx_rate_mb_s == 0.0
+    assert second.block_write_rate_mb_s == 0.0
+
+
+def test_throughput_alarm_hysteresis(monitor_module) -> None:
+    """The alarm needs a sustained breach and clears only well below threshold."""
+    alarm = monitor_module.ThroughputAlarm(threshold=100, min_duration=10, clear_ratio=0.8)
+
+    assert alarm.update(150, now=0) is None
+    assert alarm.update(50, now=5) is None  # dip resets the sustain timer
+    assert alarm.update(150, now=6) is None
+    assert alarm.update(150, now=15) is None
+    assert alarm.update(120, now=16) == "raise"
+    assert alarm.update(90, now=20) is None  # below threshold but above the clear level
+    assert alarm.update(150, now=21) is None
+    assert alarm.update(70, now=22) == "clear"
+
+
+def test_sustained_disk_io_raises_one_alert(monitor_module, tmp_path) -> None:
+    """Block I/O above the MB/s threshold for the minimum duration alerts once."""
+    monitor = monitor_module.ContainerPerformanceMonitor(["db"], log_dir=str(tmp_path))
+    monitor.thresholds["io_min_duration"] = 10.0
+    start = time.monotonic()
+    for second in range(0, 30, 5):
+        metrics = make_metrics(monitor_module, "db", second)
+        metrics.sampled_at = start + second
+        metrics.block_read_mb = second * 200.0  # 200MB/s
+        monitor.record_metrics(metrics)
+
+    alerts = [a for a in monitor.alerts_history if a.alert_type == "HIGH_DISK_IO"]
+    assert len(alerts) == 1
+    assert alerts[0].current_value == pytest.approx(200.0)
+
+
+KEEP_FOREVER = {"raw": None, "1m": None, "1h": None}
+
+
+def epoch(metrics) -> float:
+    """Epoch seconds of a sample's ISO timestamp."""
+    from datetime import datetime
+
+    return datetime.fromisoformat(metrics.timestamp).timestamp()
+
+
+def test_metrics_store_batches_and_queries(monitor_module, tmp_path) -> None:
+    """Samples are written in batches and readable raw and as rollups."""
+    store = monitor_module.MetricsStore(
+        str(tmp_path / "metrics.db"), batch_size=4, retention=KEEP_FOREVER
+    )
+    samples = [
+        make_metrics(monitor_module, "db", second, cpu=second) for second in range(0, 120, 10)
+    ]
+    for metrics in samples[:3]:
+        store.append(metrics)
+    assert store.connection.execute("SELECT COUNT(*) FROM samples").fetchone()[0] == 0
+    for metrics in samples[3:]:
+        store.append(metrics)
+    store.flush()
+
+    assert store.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    start, end = epoch(samples[0]), epoch(samples[-1]) + 1
+    raw = store.query_range("db", start, end)
+    assert [row["cpu_percent"] for row in raw] == [float(s) for s in range(0, 120, 10)]
+
+    minutes = store.query_range("db", start - 60, end, resolution="1m")
+    assert [bucket["cpu_percent"]["count"] for bucket in minutes] == [6, 6]
+    assert minutes[1]["cpu_percent"]["average"] == pytest.approx(85.0)
+
+    total = store.aggregate("db", "cpu_percent", start - 3600, end, resolution="1h")
+    assert total == store.aggregate("db", "cpu_percent", start, end)
+    assert (total["count"], total["min"], total["max"]) == (12, 0.0, 110.0)
+    with pytest.raises(ValueError):
+        store.aggregate("db", "cpu_percent; DROP TABLE samples", start, end)
+    store.close()
+
+
+def test_metrics_store_retention_and_persistence(monitor_module, tmp_path) -> None:
+    """Closed stores keep their data; retention prunes each resolution separately."""
+    path = str(tmp_path / "metrics.db")
+    store = monitor_module.MetricsStore(path, retention=KEEP_FOREVER)
+    sample = make_metrics(monitor_module, "db", 0)
+    store.append(sample)
+    store.close()
+
+    reopened = monitor_module.MetricsStore(path, retention={"raw": 60, "1m": None, "1h": 3600})
+    ts = epoch(sample)
+    assert len(reopened.query_range("db", ts, ts + 1)) == 1
+
+    reopened.apply_retention(now=ts + 3600 * 2)
+    assert reopened.query_range("db", ts, ts + 1) == []
+    assert len(reopened.query_range("db", ts - 60, ts + 1, resolution="1m")) == 1
+    assert reopened.query_range("db", ts - 3600, ts + 1, resolution="1h") == []
+    reopened.close()
+
+
+def test_metrics_store_writes_off_the_calling_thread(monitor_module, tmp_path) -> None:
+    """A full batch is written by the writer thread; append doesn't wait for it."""
+    store = monitor_module.MetricsStore(
+        str(tmp_path / "metrics.db"), batch_size=1, retention=KEEP_FOREVER
+    )
+    write = store._write
+    writers = []
+
+    def slow_write(rows, apply_retention) -> None:
+        writers.append(threading.current_thread().name)
+        time.sleep(0.3)
+        write(rows, apply_retention)
+
+    store._write = slow_write
+    sample = make_metrics(monitor_module, "db", 0)
+    started = time.monotonic()
+    store.append(sample)
+    assert time.monotonic() - started < 0.2
+
+    store.flush()
+    ts = epoch(sample)
+    assert len(store.query_range("db", ts, ts + 1)) == 1
+    assert writers and all(name.startswith("metrics-store") for name in writers)
+    store.close()
+
+
+@pytest.fixture
+def cgroup_tree(tmp_path):
+    """A fixture cgroup v2 directory and /proc tree for one container."""
+    cgroup = tmp_path / "cgroup"
+    proc = tmp_path / "proc"
+    (proc / "net").mkdir(parents=True)
+    (proc / "1").mkdir()
+    cgroup.mkdir()
+
+    (cgroup / "cpu.stat").write_text("usage_usec 1000000\nuser_usec 800000\nsystem_usec 200000\n")
+    (cgroup / "memory.current").write_text(f"{300 * MB}\n")
+    (cgroup / "memory.max").write_text("max\n")
+    (cgroup / "memory.stat").write_text(
+        f"anon {200 * MB}\nfile {100 * MB}\ninactive_file {100 * MB}\n"
+    )
+    (cgroup / "io.stat").write_text(
+        f"8:0 rbytes={3 * MB} wbytes={MB} rios=10 wios=5 dbytes=0 dios=0\n"
+        f"8:16 rbytes={MB} wbytes={MB} rios=1 wios=1 dbytes=0 dios=0\n"
+    )
+    (cgroup / "pids.current").write_text("12\n")
+    (proc / "net" / "dev").write_text(
+        "Inter-|   Receive                                                |  Transmit\n"
+        " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets\n"
+        f"    lo: {50 * MB} 10 0 0 0 0 0 0 {50 * MB} 10 0 0 0 0 0 0\n"
+        f"  eth0: {2 * MB} 10 0 0 0 0 0 0 {MB} 10 0 0 0 0 0 0\n"
+    )
+    (proc / "meminfo").write_text("MemTotal:        1024000 kB\nMemFree:          512000 kB\n")
+    (proc / "uptime").write_text("1000.00 4000.00\n")
+    (proc / "1" / "stat").write_text(
+        "1 (python (x)) S 0 1 1 0 -1 4194560" + " 0" * 12 + " 50000 0\n"
+    )
+    return cgroup, proc
+
+
+def test_cgroup_collector_reads_fixture_tree(monitor_module, cgroup_tree) -> None:
+    """cgroup v2 and /proc files are parsed into ContainerMetrics."""
+    cgroup, proc = cgroup_tree
+    collector = monitor_module.CgroupV2Collector({"self": (str(cgroup), str(proc))})
+    collector.start()
+    try:
+        first = collector.collect("self")
+        (cgroup / "cpu.stat").write_text("usage_usec 9000000\n")
+        second = collector.collect("self")
+    finally:
+        collector.stop()
+
+    assert first.cpu_percent == 0.0
+    assert second.cpu_percent > 0.0
+    assert first.memory_usage_mb == pytest.approx(200.0)
+    assert first.memory_limit_mb == pytest.approx(1024000 / 1024)
+    assert first.memory_percent == pytest.approx(20.0)
+    assert (first.network_rx_mb, first.network_tx_mb) == (2.0, 1.0)
+    assert (first.block_read_mb, first.block_write_mb) == (4.0, 2.0)
+    assert first.pids == 12
+    assert first.uptime_seconds == 500
+    assert collector.collect("other") is None
+
+
+def test_cgroup_collector_respects_memory_limit(monitor_module, cgroup_tree) -> None:
+    """A numeric memory.max is used as the limit and missing files read as zero."""
+    cgroup, proc = cgroup_tree
+    (cgroup / "memory.max").write_text(f"{400 * MB}\n")
+    (cgroup / "io.stat").unlink()
+    collector = monitor_module.CgroupV2Collector({"self": (str(cgroup), str(proc))})
+    collector.start()
+    try:
+        metrics = collector.collect("self")
+    finally:
+        collector.stop()
+
+    assert metrics.memory_limit_mb == pytest.approx(400.0)
+    assert metrics.memory_percent == pytest.approx(50.0)
+    assert (metrics.block_read_mb, metrics.block_write_mb) == (0.0, 0.0)
+
+
+def test_sparkline_scales_and_right_aligns(monitor_module) -> None:
+    """Values map onto block heights within [low, high] and pad to the width."""
+    assert monitor_module.sparkline([0.0, 50.0, 100.0, 250.0], 6) == "  ▁▅██"
+    assert monitor_module.sparkline(range(10), 3, low=0.0, high=9.0) == "▆▇█"
+
+
+def test_dashboard_redraws_only_changed_cells(monitor_module) -> None:
+    """Unchanged frames write nothing; a changed cell is rewritten in place."""
+    stream = io.StringIO()
+    dashboard = monitor_module.TerminalDashboard(stream)
+    frame = [[("name ", ""), ("10.0 ", "\x1b[32m")], [("footer", "")]]
+
+    dashboard.render(frame)
+    first = stream.getvalue()
+    assert "\x1b[2J" in first
+    assert "name " in first and "footer" in first
+
+    dashboard.render([list(row) for row in frame])
+    assert stream.getvalue() == first
+
+    dashboard.render([[("name ", ""), ("95.0 ", "\x1b[31m")]])
+    update = stream.getvalue()[len(first) :]
+    assert "\x1b[2J" not in update
+    assert "\x1b[1;6H\x1b[31m95.0 \x1b[0m" in update
+    assert "name" not in update
+    # The footer row disappeared, so it is cleared
+    assert "\x1b[2;1H\x1b[2K" in update
+
+    dashboard.close()
+    assert stream.getvalue().endswith("\x1b[?25h")
+
+
+def test_dashboard_clears_shortened_rows_and_invalidates(monitor_module) -> None:
+    """A shorter row clears its tail, and ``invalidate`` forces a full repaint."""
+    stream = io.StringIO()
+    dashboard = monitor_module.TerminalDashboard(stream)
+    dashboard.render([[("abc", ""), ("def", "")]])
+    size = len(stream.getvalue())
+
+    dashboard.render([[("abc", "")]])
+    assert "\x1b[1;4H\x1b[K" in stream.getvalue()[size:]
+
+    size = len(stream.getvalue())
+    dashboard.invalidate()
+    dashboard.render([[("abc", "")]])
+    assert "\x1b[2J" in stream.getvalue()[size:]
+
+
+def test_real_time_display_never_spawns_processes(monitor_module, tmp_path, monkeypatch) -> None:
+    """The dashboard is drawn with escape codes only, updating just what changed."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("display spawned a process")
+
+    monkeypatch.setattr(monitor_module.os, "system", fail)
+    monkeypatch.setattr(subprocess, "Popen", fail)
+    monitor = monitor_module.ContainerPerformanceMonitor(["api", "db"], log_dir=str(tmp_path))
+    stream = io.StringIO()
+    monitor.dashboard = monitor_module.TerminalDashboard(stream)
+
+    samples = [make_metrics(monitor_module, "api", 0), make_metrics(monitor_module, "db", 0)]
+    for metrics in samples:
+        monitor.record_metrics(metrics)
+    monitor.display_real_time_metrics(samples)
+    first = stream.getvalue()
+    assert "api" in first and "db" in first and "▂" in first
+
+    samples = [
+        make_metrics(monitor_module, "api", 1, cpu=60.0),
+        make_metrics(monitor_module, "db", 1),
+    ]
+    for metrics in samples:
+        monitor.record_metrics(metrics)
+    monitor.display_real_time_metrics(samples)
+    update = stream.getvalue()[len(first) :]
+    assert "60.0" in update
+    assert "db " not in update
+    assert "\x1b[2J" not in update
+
+
+def test_streaming_exporter_rotates_csv_by_size(monitor_module, tmp_path) -> None:
+    """Each batch lands on disk immediately and full files roll over to new parts."""
+    exporter = monitor_module.StreamingExporter(
+        monitor_module.ContainerMetrics, tmp_path, "metrics", batch_size=2, max_bytes=1
+    )
+    for second in range(5):
+        exporter.write(make_metrics(monitor_module, "api", second, cpu=float(second)))
+    assert exporter.records_written == 4
+    assert [path.name for path in exporter.files] == ["metrics-0001.csv", "metrics-0002.csv"]
+
+    exporter.close()
+    assert exporter.records_written == 5
+    rows = []
+    for path in exporter.files:
+        with open(path, newline="") as f:
+            rows.extend(csv.DictReader(f))
+    assert [float(row["cpu_percent"]) for row in rows] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert rows[0]["timestamp"] == "2024-01-01T00:00:00.000001"
+
+
+def test_streaming_exporter_ndjson_rotates_by_time(monitor_module, tmp_path) -> None:
+    """NDJSON output holds one object per line; a zero interval rotates every flush."""
+    exporter = monitor_module.StreamingExporter(
+        monitor_module.PerformanceAlert,
+        tmp_path,
+        "alerts",
+        fmt="ndjson",
+        batch_size=1,
+        rotate_interval=0.0,
+    )
+    for value in (91.0, 97.0):
+        exporter.write(
+            monitor_module.PerformanceAlert(
+                "2024-01-01T00:00:00", "api", "cpu", "cpu_percent", value, 90.0, "critical", "hot"
+            )
+        )
+    exporter.close()
+
+    assert len(exporter.files) == 2
+    records = [json.loads(path.read_text()) for path in exporter.files]
+    assert [record["current_value"] for record in records] == [91.0, 97.0]
+    assert records[0]["severity"] == "critical"
+    with pytest.raises(ValueError):
+        monitor_module.StreamingExporter(monitor_module.PerformanceAlert, tmp_path, "x", "xml")
+
+
+def test_streaming_exporter_parquet(monitor_module, tmp_path) -> None:
+    """Parquet batches are written as row groups with a schema from the dataclass."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    exporter = monitor_module.StreamingExporter(
+        monitor_module.ContainerMetrics, tmp_path, "metrics", fmt="parquet", batch_size=2
+    )
+    for second in range(3):
+        exporter.write(make_metrics(monitor_module, "api", second))
+    exporter.close()
+
+    table = pq.read_table(exporter.files[0])
+    assert table.num_rows == 3
+    assert table.column("pids").to_pylist() == [5, 5, 5]
+
+
+def test_monitor_streams_samples_and_alerts(monitor_module, tmp_path) -> None:
+    """With exporters attached, samples and alerts are written as they are recorded."""
+    metrics_exporter = monitor_module.StreamingExporter(
+        monitor_module.ContainerMetrics, tmp_path, "metrics", batch_size=1
+    )
+    alerts_exporter = monitor_module.StreamingExporter(
+        monitor_module.PerformanceAlert, tmp_path, "alerts", fmt="ndjson", batch_size=1
+    )
+    monitor = monitor_module.ContainerPerformanceMonitor(
+        ["api"],
+        log_dir=str(tmp_path),
+        metrics_exporter=metrics_exporter,
+        alerts_exporter=alerts_exporter,
+    )
+    monitor.record_metrics(make_metrics(monitor_module, "api", 0, cpu=95.0))
+
+    with open(tmp_path / "metrics.csv", newline="") as f:
+        assert [row["container_name"] for row in csv.DictReader(f)] == ["api"]
+    alert = json.loads((tmp_path / "alerts.jsonl").read_text())
+    assert alert["metric"] == "cpu_percent"
+
+
+def test_anomaly_detector_flags_spikes_after_warmup(monitor_module) -> None:
+    """A noisy but stable series stays quiet; a jump far outside it is a spike."""
+    detector = monitor_module.AnomalyDetector(warmup=10, min_std=0.5)
+    noise = [0.0, 1.0, -1.0, 0.5, -0.5]
+    results = [detector.update(40.0 + noise[i % 5], float(i)) for i in range(100)]
+    assert results == [None] * 100
+
+    assert detector.update(80.0, 100.0) == "spike"
+    assert detector.zscore > 4.0
+    assert monitor_module.AnomalyDetector(warmup=10).update(80.0, 0.0) is None
+
+
+def test_anomaly_detector_finds_slow_growth(monitor_module) -> None:
+    """Memory creeping up 12% an hour is reported as a trend, not a spike."""
+    detector = monitor_module.AnomalyDetector(warmup=10, trend_threshold=5.0)
+    kinds = set()
+    for i in range(720):  # one hour at 5s
+        kinds.add(detector.update(30.0 + 12.0 * i / 720 + (0.3 if i % 2 else -0.3), i * 5.0))
+
+    assert kinds == {None, "trend"}
+    assert detector.slope == pytest.approx(12.0, rel=0.1)
+
+
+@pytest.mark.parametrize("interval", [1.0, 60.0])
+def test_trend_window_spans_time_not_samples(monitor_module, interval) -> None:
+    """The same growth is measured at any interval; noise at 1s is not a trend."""
+    rng = random.Random(7)
+    noisy = monitor_module.AnomalyDetector(warmup=10, z_threshold=10.0, trend_threshold=5.0)
+    growing = monitor_module.AnomalyDetector(warmup=10, trend_threshold=5.0)
+    noise_kinds, growth_kinds = set(), set()
+    for i in range(int(7200 / interval)):
+        now = i * interval
+        noise_kinds.add(noisy.update(40.0 + rng.gauss(0.0, 1.0), now))
+        growth_kinds.add(growing.update(30.0 + 12.0 * now / 3600, now))
+
+    assert noise_kinds == {None}
+    assert growth_kinds == {None, "trend"}
+    assert growing.slope == pytest.approx(12.0, rel=0.05)
+
+
+def test_anomaly_alerts_are_deduplicated_with_cooldown(monitor_module, tmp_path) -> None:
+    """An ongoing anomaly alerts once; a new one within the cooldown is suppressed."""
+    monitor = monitor_module.ContainerPerformanceMonitor(["build"], log_dir=str(tmp_path))
+    monitor.thresholds.update(anomaly_warmup=5, anomaly_cooldown=100.0)
+
+    def record(second: int, cpu: float):
+        metrics = make_metrics(monitor_module, "build", second, cpu=cpu)
+        metrics.sampled_at = float(second)
+        return [a for a in monitor.record_metrics(metrics) if a.alert_type == "METRIC_ANOMALY"]
+
+    for second in range(20):
+        assert record(second, 10.0) == []
+    spike = record(20, 60.0)
+    assert [alert.metric for alert in spike] == ["cpu_percent"]
+    assert record(21, 65.0) == []  # same anomaly, still in progress
+
+    for second in range(22, 60):
+        record(second, 10.0)
+    assert record(60, 60.0) == []  # new anomaly, but within the cooldown
+    assert monitor.alerts_suppressed == 1
+    assert monitor.generate_performance_report()["total_alerts_suppressed"] == 1
+
+
+def test_threshold_alert_cooldown(monitor_module, tmp_path) -> None:
+    """A sustained threshold breach alerts once per cooldown by default."""
+    monitor = monitor_module.ContainerPerformanceMonitor(["app"], log_dir=str(tmp_path))
+    for second in range(0, 901, 10):
+        metrics = make_metrics(monitor_module, "app", second % 3600, cpu=80.0)
+        metrics.sampled_at = float(second)
+        monitor.record_metrics(metrics)
+
+    # 91 samples over 900s with the default 300s cooldown
+    assert monitor.alerts_generated == 4
+    assert monitor.alerts_suppressed == 87
+
+    # Escalating to critical is not held back by the warning's cooldown
+    metrics = make_metrics(monitor_module, "app", 0, cpu=99.0)
+    metrics.sampled_at = 901.0
+    assert [alert.severity for alert in monitor.record_metrics(metrics)] == ["CRITICAL"]
+
+    monitor.thresholds["alert_cooldown"] = 0.0
+    metrics.sampled_at += 1
+    monitor.record_metrics(metrics)
+    assert monitor.alerts_generated == 6
+
+
+AGENT_SCRIPT = """
+import importlib.util, sys, time
+spec = importlib.util.spec_from_file_location("monitor", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+agent = module.MetricsPushAgent(sys.argv[2], host=sys.argv[3], batch_size=7, flush_interval=0.05)
+agent.start()
+for i in range(20):
+    agent.write(module.ContainerMetrics(
+        "2024-01-01T00:00:00", "api", float(i), 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8, "running", 9
+    ))
+    time.sleep(0.005)
+agent.close()
+sys.exit(0 if agent.sent == 20 else 1)
+"""
+
+
+def test_agents_in_separate_processes_fan_in(monitor_module) -> None:
+    """Agent processes standing in for three hosts all reach one aggregator."""
+    aggregator = monitor_module.FanInAggregator()
+    aggregator.start()
+    try:
+        url = "http://%s:%d/ingest" % aggregator.address
+        script = Path(monitor_module.__file__)
+        agents = [
+            subprocess.Popen([sys.executable, "-c", AGENT_SCRIPT, str(script), url, f"host{i}"])
+            for i in range(3)
+        ]
+        assert [agent.wait(timeout=30) for agent in agents] == [0, 0, 0]
+    finally:
+        aggregator.stop()
+
+    samples = aggregator.drain()
+    assert len(samples) == 60
+    assert {sample.container_name for sample in samples} == {"host0/api", "host1/api", "host2/api"}
+    host0 = [sample.cpu_percent for sample in samples if sample.container_name == "host0/api"]
+    assert host0 == [float(i) for i in range(20)]
+    assert aggregator.accepted == {"host0": 20, "host1": 20, "host2": 20}
+
+
+def test_aggregator_backpressure_and_agent_retry(monitor_module) -> None:
+    """A full per-host queue answers 503; the agent keeps the batch and retries."""
+    aggregator = monitor_module.FanInAggregator(max_pending_per_host=5, retry_after=0.05)
+    aggregator.start()
+    agent = monitor_module.MetricsPushAgent(
+        "http://%s:%d/ingest" % aggregator.address, host="busy", batch_size=5, flush_interval=0.02
+    )
+    agent.start()
+    try:
+        for second in range(10):
+            agent.write(make_metrics(monitor_module, "api", second))
+        wait_for(lambda: aggregator.rejected.get("busy", 0) > 0)
+        assert len(aggregator.drain()) == 5
+
+        wait_for(lambda: agent.sent == 10)
+        assert [s.uptime_seconds for s in aggregator.drain()] == [5, 6, 7, 8, 9]
+    finally:
+        agent.close()
+        aggregator.stop()
+    assert agent.dropped == 0
+
+
+def test_agent_counts_unsent_samples_as_dropped(monitor_module) -> None:
+    """Samples still buffered when the agent closes are counted as dropped."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        url = "http://127.0.0.1:%d/ingest" % probe.getsockname()[1]
+
+    idle = monitor_module.MetricsPushAgent(url, batch_size=5)
+    for second in range(3):
+        idle.write(make_metrics(monitor_module, "api", second))
+    idle.close()
+    assert (idle.sent, idle.dropped) == (0, 3)
+
+    agent = monitor_module.MetricsPushAgent(url, batch_size=5, flush_interval=60.0, timeout=0.5)
+    agent.start()
+    for second in range(12):
+        agent.write(make_metrics(monitor_module, "api", second))
+    agent.close()
+    assert (agent.sent, agent.dropped) == (0, 12)
+
+
+def test_slow_host_does_not_stall_aggregator(monitor_module) -> None:
+    """A client stuck mid-upload doesn't block batches from other hosts."""
+    aggregator = monitor_module.FanInAggregator()
+    aggregator.start()
+    stalled = socket.create_connection(aggregator.address)
+    agent = monitor_module.MetricsPushAgent(
+        "http://%s:%d/ingest" % aggregator.address, host="fast", batch_size=1
+    )
+    agent.start()
+    try:
+        stalled.sendall(b"POST /ingest HTTP/1.1\r\nContent-Length: 1000\r\n\r\n{")
+        agent.write(make_metrics(monitor_module, "api", 0))
+        wait_for(lambda: agent.sent == 1, timeout=2.0)
+    finally:
+        stalled.close()
+        agent.close()
+        aggregator.stop()
+    assert [s.container_name for s in aggregator.drain()] == ["fast/api"]
+
+
+def test_aggregator_rejects_malformed_batches(monitor_module) -> None:
+    """Batches that don't describe ContainerMetrics are refused."""
+    aggregator = monitor_module.FanInAggregator()
+    names = monitor_module.MetricsPushAgent("http://x").fieldnames
+    row = [getattr(make_metrics(monitor_module, "api", 0), name) for name in names]
+    with pytest.raises(ValueError):
+        aggregator.offer("h", ["container_name", "bogus"], [["api", 1]])
+    with pytest.raises(ValueError):
+        aggregator.offer("h", ["container_name"], [["api", 1]])
+    with pytest.raises(ValueError):
+        aggregator.offer("h", ["container_name"], [["api"]])
+    with pytest.raises(ValueError):
+        aggregator.offer("h", names, [row, row[:2] + ["busy"] + row[3:]])
+    assert aggregator.drain() == []
+
+    # Values are converted to the field types
+    row[names.index("cpu_percent")] = "12.5"
+    row[names.index("pids")] = 3.0
+    assert aggregator.offer("h", names, [row])
+    (sample,) = aggregator.drain()
+    assert (sample.cpu_percent, sample.pids) == (12.5, 3)
+    assert isinstance(sample.pids, int)
+
+
+def test_aggregator_answers_400_to_incomplete_batches(monitor_module) -> None:
+    """An incomplete batch gets 400 and nothing is queued."""
+    aggregator = monitor_module.FanInAggregator()
+    aggregator.start()
+    try:
+        connection = http.client.HTTPConnection(*aggregator.address, timeout=5)
+        body = json.dumps({"host": "h", "fields": ["container_name"], "samples": [["api"]]})
+        connection.request("POST", "/ingest", body, {"Content-Type": "application/json"})
+        status = connection.getresponse().status
+        connection.close()
+    finally:
+        aggregator.stop()
+
+    assert status == 400
+    assert aggregator.drain() == []
+
+
+def test_monitor_ingests_aggregated_samples(monitor_module, quiet_monitor) -> None:
+    """The sampling loop records samples drained from the aggregator."""
+    aggregator = monitor_module.FanInAggregator()
+    monitor = quiet_monitor([], None)
+    monitor.aggregator = aggregator
+    sample = make_metrics(monitor_module, "api", 0, cpu=95.0)
+    names = [f for f in monitor_module.MetricsPushAgent("http://x").fieldnames]
+    assert aggregator.offer("edge", names, [[getattr(sample, name) for name in names]])
+
+    asyncio.run(monitor._sampling_loop(0.05, 0.1, 0.1))
+
+    assert monitor.metrics_history.container_names() == ["edge/api"]
+    assert monitor.alerts_history[0].container_name == "edge/api"
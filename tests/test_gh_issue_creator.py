@@ -0,0 +1,637 @@
+"""Tests for scripts/gh-issue-creator.py against a local mock GitHub API."""
+
+# Standard library imports
+import io
+import json
+import re
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Third-party imports
+import pytest
+
+
+class MockGitHub(ThreadingHTTPServer):
+    """A minimal GitHub REST/GraphQL API for one repository.
+
+    List endpoints and GraphQL connections are served ``page_size`` items
+    per page so clients must paginate.
+
+    ``responses`` holds canned ``(status, body, headers)`` replies that are
+    served immediately, in order, to issue creation requests before they
+    succeed; successful creations take ``latency`` seconds. ``get_responses``
+    does the same for GET requests.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), MockGitHubHandler)
+        self.lock = threading.Lock()
+        self.issues = []
+        self.requests = []
+        self.responses = []
+        self.get_responses = []
+        self.rate_limit = None
+        self.latency = 0.0
+        self.page_size = 2
+        self.milestones = [{"title": "MVP", "number": 1}]
+        self.labels = [{"name": "bug", "id": 10}]
+        self.projects = [{"id": "P_1", "title": "LUMIN Project Tracker"}]
+        self.mutations = []
+        self.pulls = []
+        self.unaddable = set()
+        self.fields = [
+            {"id": "F_title", "name": "Title"},
+            {
+                "id": "F_status",
+                "name": "Status",
+                "options": [{"id": "O_todo", "name": "Todo"}, {"id": "O_backlog", "name": "Backlog"}],
+            },
+        ]
+
+    @property
+    def url(self) -> str:
+        return "http://%s:%d" % self.server_address
+
+
+class MockGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self._record()
+        with self.server.lock:
+            canned = self.server.get_responses.pop(0) if self.server.get_responses else None
+        if canned is not None:
+            self._reply(*canned)
+            return
+        url = urlsplit(self.path)
+        with self.server.lock:
+            issues = [
+                {"number": n, "title": issue["title"], "node_id": f"I_{n}"}
+                for n, issue in enumerate(self.server.issues, 1)
+            ]
+        collections = {
+            "/repos/octo/repo/milestones": self.server.milestones,
+            "/repos/octo/repo/labels": self.server.labels,
+            "/repos/octo/repo/issues": issues + self.server.pulls,
+        }
+        if url.path not in collections:
+            self._reply(404, {"message": "Not Found"})
+            return
+
+        page = int(parse_qs(url.query).get("page", ["1"])[0])
+        size = self.server.page_size
+        items = collections[url.path]
+        headers = {}
+        if page * size < len(items):
+            headers["Link"] = f'<{self.server.url}{url.path}?page={page + 1}>; rel="next"'
+        self._reply(200, items[(page - 1) * size : page * size], headers)
+
+    def do_POST(self) -> None:
+        payload = self._record()
+        server = self.server
+        if self.path == "/graphql":
+            self._reply(200, self._graphql(payload["query"], payload.get("variables") or {}))
+            return
+        if self.path != "/repos/octo/repo/issues":
+            self._reply(404, {"message": "Not Found"})
+            return
+
+        with server.lock:
+            canned = server.responses.pop(0) if server.responses else None
+        if canned is not None:
+            self._reply(*canned)
+            return
+
+        time.sleep(server.latency)
+        with server.lock:
+            server.issues.append(payload)
+            number = len(server.issues)
+        self._reply(201, {"number": number, "title": payload["title"], "node_id": f"I_{number}"})
+
+    def _graphql(self, query: str, variables: dict) -> dict:
+        if "projectsV2(" in query:
+            return {"data": {"repository": {"projectsV2": self._page(self.server.projects, variables)}}}
+        if "fields(" in query:
+            return {"data": {"node": {"fields": self._page(self.server.fields, variables)}}}
+        if query.lstrip().startswith("mutation"):
+            return self._mutations(query, variables)
+        return {"data": {}}
+
+    def _mutations(self, query: str, variables: dict) -> dict:
+        """Serve aliased addProjectV2ItemById / updateProjectV2ItemFieldValue mutations."""
+        with self.server.lock:
+            self.server.mutations.append((query, variables))
+        data, errors = {}, []
+        for alias, name in re.findall(r"(\w+): (\w+)\(", query):
+            index = alias[3:]
+            if name == "addProjectV2ItemById":
+                content = variables[f"content{index}"]
+                if content in self.server.unaddable:
+                    data[alias] = None
+                    errors.append({"message": f"Could not resolve {content}", "path": [alias]})
+                else:
+                    data[alias] = {"item": {"id": f"PVTI_{content}"}}
+            elif name == "updateProjectV2ItemFieldValue":
+                assert variables["option"] == "O_backlog"
+                data[alias] = {"projectV2Item": {"id": variables[f"item{index}"]}}
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+    def _page(self, items: list, variables: dict) -> dict:
+        start = int(variables.get("after") or 0)
+        end = start + self.server.page_size
+        return {
+            "nodes": items[start:end],
+            "pageInfo": {"hasNextPage": end < len(items), "endCursor": str(end)},
+        }
+
+    def _record(self) -> dict:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.requests.append((time.time(), self.command, self.path))
+        return json.loads(body) if body else {}
+
+    def _reply(self, status: int, body, headers=None) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        headers = dict(headers or {})
+        if self.server.rate_limit is not None:
+            headers.setdefault("X-RateLimit-Remaining", str(self.server.rate_limit[0]))
+            headers.setdefault("X-RateLimit-Reset", str(self.server.rate_limit[1]))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def github():
+    """A running mock GitHub API."""
+    server = MockGitHub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def creator(issue_creator_module, github):
+    """An issue creator pointed at the mock API with fast backoff."""
+    creator = issue_creator_module.GitHubIssueCreator(
+        "token", "octo", "repo", api_url=github.url, backoff_base=0.01, secondary_wait=0.2
+    )
+    creator.rate_limiter.min_interval = 0.0
+    return creator
+
+
+def make_issues(count: int) -> list:
+    return [{"title": f"Issue {i}", "body": "Body", "milestone": "MVP"} for i in range(count)]
+
+
+def issue_posts(github) -> list:
+    return [t for t, method, path in github.requests if method == "POST" and path.endswith("/issues")]
+
+
+def paths(github, method: str) -> list:
+    return [urlsplit(path).path for _, m, path in github.requests if m == method]
+
+
+def test_issues_are_created_concurrently(creator, github) -> None:
+    """Slow responses overlap when several workers create issues."""
+    github.latency = 0.1
+
+    start = time.monotonic()
+    results = creator.create_issues_batch(make_issues(12), delay=0.0, max_workers=6)
+    elapsed = time.monotonic() - start
+
+    assert results == {"created": 12, "skipped": 0, "failed": 0, "total": 12}
+    assert sorted(issue["title"] for issue in github.issues) == sorted(
+        f"Issue {i}" for i in range(12)
+    )
+    assert all(issue["milestone"] == 1 for issue in github.issues)
+    assert elapsed < 12 * 0.1 / 2
+
+
+def test_content_creation_is_spaced_by_delay(creator, github) -> None:
+    """Issue POSTs from all workers stay at least ``delay`` apart."""
+    creator.create_issues_batch(make_issues(4), delay=0.1, max_workers=4)
+
+    posts = sorted(issue_posts(github))
+    assert len(posts) == 4
+    assert min(b - a for a, b in zip(posts, posts[1:])) >= 0.09
+
+
+def test_retry_after_pauses_all_workers(creator, github) -> None:
+    """A secondary rate limit with Retry-After holds back every worker, then succeeds."""
+    github.latency = 0.1
+    github.responses = [
+        (403, {"message": "You have exceeded a secondary rate limit"}, {"Retry-After": "0.3"})
+    ]
+
+    results = creator.create_issues_batch(make_issues(4), delay=0.0, max_workers=2)
+
+    assert results["created"] == 4
+    posts = sorted(issue_posts(github))
+    assert len(posts) == 5
+    # The two first requests went out together; everything after waited out the pause
+    assert posts[1] - posts[0] < 0.1
+    assert all(t - posts[0] >= 0.28 for t in posts[2:])
+
+
+def test_secondary_limit_without_retry_after(creator, github) -> None:
+    """Without Retry-After a secondary rate limit waits ``secondary_wait``."""
+    github.responses = [(403, {"message": "You have exceeded a secondary rate limit."})]
+
+    start = time.monotonic()
+    assert creator.create_issue(make_issues(1)[0], add_to_project=False)
+    assert time.monotonic() - start >= 0.2
+
+
+def test_exhausted_primary_limit_waits_for_reset(creator, github) -> None:
+    """X-RateLimit-Remaining: 0 waits until X-RateLimit-Reset before retrying."""
+    reset_at = time.time() + 0.4
+    github.responses = [
+        (
+            403,
+            {"message": "API rate limit exceeded"},
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)},
+        )
+    ]
+
+    assert creator.create_issue(make_issues(1)[0], add_to_project=False)
+    assert issue_posts(github)[-1] >= reset_at
+
+
+def test_server_errors_are_retried_for_reads_only(creator, github) -> None:
+    """5xx responses are retried for GETs; writes and permission errors are not."""
+    github.get_responses = [(502, {"message": "Bad Gateway"}), (503, {"message": "Unavailable"})]
+    assert creator.get_milestones() == {"MVP": 1}
+    assert paths(github, "GET").count("/repos/octo/repo/milestones") == 3
+
+    # The issue may have been created before the gateway failed
+    github.responses = [(502, {"message": "Bad Gateway"})]
+    assert not creator.create_issue(make_issues(1)[0], add_to_project=False)
+    assert len(issue_posts(github)) == 1
+
+    github.responses = [(403, {"message": "Resource not accessible by integration"})]
+    assert not creator.create_issue(make_issues(1)[0], add_to_project=False)
+    assert len(issue_posts(github)) == 2
+
+
+def test_timed_out_writes_are_not_retried(creator, github) -> None:
+    """A POST that timed out waiting for the reply is not sent again."""
+    creator.get_milestones()
+    creator.get_labels()
+    creator.timeout = 0.1
+    github.latency = 0.3
+
+    assert not creator.create_issue(make_issues(1)[0], add_to_project=False)
+    time.sleep(0.3)
+    assert len(issue_posts(github)) == 1
+    assert len(github.issues) == 1
+
+
+def test_connection_failures_are_retried_for_writes(issue_creator_module) -> None:
+    """A POST that never reached the server is retried."""
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        port = unused.getsockname()[1]
+    creator = issue_creator_module.GitHubIssueCreator(
+        "token", "octo", "repo", api_url=f"http://127.0.0.1:{port}", max_retries=2, backoff_base=0.01
+    )
+    creator.rate_limiter.min_interval = 0.0
+    attempts = []
+    send = creator.session.request
+
+    def counting_send(*args, **kwargs):
+        attempts.append(args)
+        return send(*args, **kwargs)
+
+    creator.session.request = counting_send
+    assert creator._request("POST", f"{creator.base_url}/issues", json={}) is None
+    assert len(attempts) == 3
+
+
+def test_rate_limiter_spreads_low_remaining_budget(issue_creator_module) -> None:
+    """With few requests left, the limiter spaces them out until the reset."""
+    limiter = issue_creator_module.RateLimiter(min_interval=0.0, low_water=10)
+    limiter.update("core", {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": str(time.time() + 0.4)})
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire("core")
+    elapsed = time.monotonic() - start
+
+    # Slots at 0, ~0.1 and ~0.23 seconds
+    assert 0.15 <= elapsed < 0.4
+    # Other resources are unaffected
+    start = time.monotonic()
+    limiter.acquire("graphql")
+    assert time.monotonic() - start < 0.05
+
+
+def test_metadata_is_fetched_once_per_batch(creator, github) -> None:
+    """Milestones and labels are prefetched across all pages, then served from the cache."""
+    github.milestones = [{"title": f"M{i}", "number": i} for i in range(1, 6)]
+    issues = [
+        {"title": f"Issue {i}", "body": "Body", "milestone": "M5", "labels": ["bug", "new"]}
+        for i in range(10)
+    ]
+
+    results = creator.create_issues_batch(issues, delay=0.0, max_workers=4)
+
+    assert results["created"] == 10
+    assert all(issue["milestone"] == 5 for issue in github.issues)
+    gets = paths(github, "GET")
+    # 5 milestones over 3 pages and 1 page of labels, not one round trip per issue
+    assert gets.count("/repos/octo/repo/milestones") == 3
+    assert gets.count("/repos/octo/repo/labels") == 1
+    assert creator.get_labels()["new"] is None
+
+
+def test_metadata_invalidation_and_ttl(creator, github) -> None:
+    """Invalidated or expired metadata is refetched on the next lookup."""
+    assert creator.get_milestones() == {"MVP": 1}
+    github.milestones.append({"title": "Beta", "number": 2})
+    assert creator.get_milestones() == {"MVP": 1}
+
+    creator.invalidate_metadata("milestones")
+    assert creator.get_milestones() == {"MVP": 1, "Beta": 2}
+
+    creator.metadata_ttl = 0.0
+    github.milestones.append({"title": "GA", "number": 3})
+    assert "GA" in creator.get_milestones()
+
+
+def test_project_lookup_paginates_and_caches(creator, github) -> None:
+    """Projects and their fields are found past the first page and cached by project."""
+    github.projects = [{"id": f"P_{i}", "title": f"Board {i}"} for i in range(5)]
+    github.fields = [{"id": f"F_{i}", "name": f"Field {i}"} for i in range(3)] + github.fields
+
+    assert creator.find_project("Board 4") == "P_4"
+    assert creator.find_project("Board 0") == "P_0"
+    assert creator.find_project("Missing") is None
+    assert creator.get_project_field_info("P_4") == ("F_status", "O_backlog")
+    assert creator.get_project_field_info("P_4") == ("F_status", "O_backlog")
+
+    # 3 pages of projects, 3 pages of fields
+    assert paths(github, "POST").count("/graphql") == 6
+
+
+def test_project_assignment_is_batched(creator, github) -> None:
+    """Issues join the board with two GraphQL requests per batch, not two per issue."""
+    creator.project_batch_size = 4
+
+    results = creator.create_issues_batch(
+        make_issues(10), delay=0.0, project_name="LUMIN Project Tracker", max_workers=4
+    )
+
+    assert results["created"] == 10
+    assert results["project_failed"] == 0
+    # 10 issues in chunks of 4: 3 add requests and 3 status requests
+    assert len(github.mutations) == 6
+    for query, variables in github.mutations:
+        # IDs travel as variables, never interpolated into the document
+        assert "I_" not in query and "P_1" not in query
+        assert variables["project"] == "P_1"
+    added = [v for q, v in github.mutations if "addProjectV2ItemById" in q]
+    assert sorted(v for vs in added for k, v in vs.items() if k.startswith("content")) == sorted(
+        f"I_{n}" for n in range(1, 11)
+    )
+
+
+def test_project_batch_reports_failures_per_item(creator, github) -> None:
+    """One unresolvable issue fails alone; the rest of its batch is still set to Backlog."""
+    creator.project_id = "P_1"
+    creator.project_field_id, creator.backlog_option_id = "F_status", "O_backlog"
+    github.unaddable = {"I_2"}
+
+    results = creator.add_issues_to_project(["I_1", "I_2", "I_3"])
+
+    assert results["I_1"] == {"item_id": "PVTI_I_1", "backlog": True, "error": None}
+    assert results["I_2"] == {"item_id": None, "backlog": False, "error": "Could not resolve I_2"}
+    assert results["I_3"]["backlog"]
+    status_query, status_variables = github.mutations[-1]
+    assert status_query.count("updateProjectV2ItemFieldValue") == 2
+    assert "item1" not in status_variables
+
+
+def test_project_batch_size_one_adds_each_issue(creator, github) -> None:
+    """A batch size of 1 adds every issue to the board right after creating it."""
+    creator.project_batch_size = 1
+
+    results = creator.create_issues_batch(
+        make_issues(2), delay=0.0, project_name="LUMIN Project Tracker", max_workers=1
+    )
+
+    assert results["created"] == 2
+    assert "project_failed" not in results
+    assert len(github.mutations) == 4
+
+
+def test_requests_share_pooled_keep_alive_connections(creator, github) -> None:
+    """A batch reuses a handful of pooled connections and reports its latency."""
+    creator.create_issues_batch(make_issues(20), delay=0.0, max_workers=4)
+
+    stats = creator.stats.summary(creator.adapter)
+    assert stats["requests"] == len(github.requests)
+    assert stats["connections"] <= 4
+    assert stats["reuse_rate"] >= 0.8
+    assert 0 < stats["latency_p50_ms"] <= stats["latency_p95_ms"] <= stats["latency_max_ms"]
+    assert creator.session.headers["Accept-Encoding"] == "gzip"
+
+
+def test_summary_when_every_request_fails(issue_creator_module, tmp_path, monkeypatch, capsys) -> None:
+    """A run that never reached the API reports its requests without latencies."""
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        port = unused.getsockname()[1]
+    path = tmp_path / "issues.json"
+    path.write_text(json.dumps(make_issues(2)), encoding="utf-8")
+    # No backoff between the retries of the refused connections
+    monkeypatch.setattr(issue_creator_module.random, "uniform", lambda a, b: 0.0)
+    monkeypatch.setattr("builtins.input", lambda prompt: "y")
+    monkeypatch.setattr(sys, "argv", [
+        "gh-issue-creator.py", str(path), "--token", "x", "--api-url", f"http://127.0.0.1:{port}",
+        "--no-journal", "--no-project", "--delay", "0",
+    ])
+
+    issue_creator_module.main()
+
+    out = capsys.readouterr().out
+    assert "❌ Failed: 2" in out
+    assert "API requests over" in out and "latency" not in out
+
+
+def test_interrupted_import_resumes_without_duplicates(issue_creator_module, creator, github, tmp_path) -> None:
+    """A rerun with the same journal only creates the issues the first run didn't."""
+    path = str(tmp_path / "journal.db")
+    issues = make_issues(6)
+    # Two issues fail on the first run, as if it had died partway through
+    github.responses = [(422, {"message": "Validation Failed"}, {})] * 2
+    journal = issue_creator_module.IssueJournal(path)
+    first = creator.create_issues_batch(issues, delay=0.0, max_workers=1, journal=journal)
+    journal.close()
+    assert (first["created"], first["failed"]) == (4, 2)
+
+    journal = issue_creator_module.IssueJournal(path)
+    assert journal.counts() == {"created": 4, "pending": 2}
+    creator.invalidate_metadata()
+    second = creator.create_issues_batch(issues, delay=0.0, max_workers=3, journal=journal)
+
+    assert (second["created"], second["skipped"], second["failed"]) == (2, 4, 0)
+    assert sorted(issue["title"] for issue in github.issues) == sorted(i["title"] for i in issues)
+    assert journal.counts() == {"created": 6}
+    # Existing issues are only fetched when the journal has pending issues (4 at 2 per page)
+    assert paths(github, "GET").count("/repos/octo/repo/issues") == 2
+
+
+def test_pending_issue_created_before_a_crash_is_adopted(issue_creator_module, creator, github, tmp_path) -> None:
+    """An issue posted before the run died is matched by title instead of being posted again."""
+    issues = make_issues(3)
+    github.issues.append({"title": "Issue 1"})
+    github.pulls = [{"number": 99, "title": "Issue 2", "node_id": "PR_99", "pull_request": {}}]
+    journal = issue_creator_module.IssueJournal(str(tmp_path / "journal.db"))
+    journal.record(issue_creator_module.issue_key(issues[1]), "Issue 1", "pending")
+
+    results = creator.create_issues_batch(issues, delay=0.0, max_workers=2, journal=journal)
+
+    # Issue 1 already exists; a pull request with the title of Issue 2 doesn't count
+    assert (results["created"], results["skipped"]) == (2, 1)
+    assert sorted(issue["title"] for issue in github.issues) == ["Issue 0", "Issue 1", "Issue 2"]
+    assert journal.get(issue_creator_module.issue_key(issues[1]))["number"] == 1
+
+
+def test_new_issue_matching_an_old_title_is_created(issue_creator_module, creator, github, tmp_path) -> None:
+    """Only pending journal entries are matched by title; unseen issues are always created."""
+    issues = make_issues(2)
+    github.issues.append({"title": "Issue 0"})  # e.g. a closed issue from long ago
+    journal = issue_creator_module.IssueJournal(str(tmp_path / "journal.db"))
+    journal.record(issue_creator_module.issue_key({"title": "Other"}), "Other", "pending")
+
+    results = creator.create_issues_batch(issues, delay=0.0, max_workers=2, journal=journal)
+
+    assert (results["created"], results["skipped"]) == (2, 0)
+    assert sorted(issue["title"] for issue in github.issues) == ["Issue 0", "Issue 0", "Issue 1"]
+
+
+def test_journal_tracks_project_assignment(issue_creator_module, creator, github, tmp_path) -> None:
+    """Created issues that never reached the board are added on the next run."""
+    creator.project_batch_size = 4
+    issues = make_issues(3)
+    journal = issue_creator_module.IssueJournal(str(tmp_path / "journal.db"))
+    for n, issue in enumerate(issues, 1):
+        github.issues.append({"title": issue["title"]})
+        state = "added" if n == 1 else "created"
+        journal.record(issue_creator_module.issue_key(issue), issue["title"], state, n, f"I_{n}")
+
+    results = creator.create_issues_batch(
+        issues, delay=0.0, project_name="LUMIN Project Tracker", max_workers=2, journal=journal
+    )
+
+    assert (results["created"], results["skipped"], results["project_failed"]) == (0, 3, 0)
+    added = [v for q, v in github.mutations if "addProjectV2ItemById" in q]
+    assert sorted(v for vs in added for k, v in vs.items() if k.startswith("content")) == ["I_2", "I_3"]
+    assert journal.counts() == {"added": 3}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+@pytest.mark.parametrize("layout", ["array", "ndjson"])
+def test_issues_file_is_parsed_incrementally(issue_creator_module, tmp_path, layout, chunk_size) -> None:
+    """JSON arrays and NDJSON decode to the same issues whatever the read size."""
+    issues = [
+        {"title": "Unicode ✓ \"quoted\"", "body": "a\nb", "labels": ["x", "y"]},
+        {"title": "Numbers", "body": "", "estimate": 12345, "ratio": -1.5e3, "done": False},
+        {"title": "Nested", "body": "[]{},", "meta": {"list": [1, [2, 3]], "none": None}},
+    ]
+    path = tmp_path / "issues.json"
+    if layout == "array":
+        path.write_text(json.dumps(issues, indent=2, ensure_ascii=False), encoding="utf-8")
+    else:
+        path.write_text("\n".join(json.dumps(issue) for issue in issues) + "\n", encoding="utf-8")
+
+    assert list(issue_creator_module.read_issues(str(path), chunk_size=chunk_size)) == issues
+
+
+@pytest.mark.parametrize(
+    "text, error",
+    [
+        ('[{"title": "a", "body": ""} {"title": "b"}]', "delimiter"),
+        ('[{"title": "a", "body": ""},]', "Expecting value"),
+        ('[{"title": "a", "body": ""}', "Unterminated array"),
+        ('[{"title": "a", "body": ""}] []', "Extra data"),
+        ('{"title": "a", "body": ""}\n{"title": "b"}', "Issue 2 missing required field: body"),
+        ('[{"title": "a", "body": ""}, 5]', "Issue 2 is not a JSON object"),
+        ("", "Expecting value"),
+        (" \n\t\n", "Expecting value"),
+    ],
+)
+def test_malformed_issues_file_is_rejected(issue_creator_module, tmp_path, text, error) -> None:
+    """Bad input raises ValueError once the reader gets to it."""
+    path = tmp_path / "issues.json"
+    path.write_text(text, encoding="utf-8")
+
+    with pytest.raises(ValueError, match=error):
+        list(issue_creator_module.read_issues(str(path), chunk_size=4))
+
+
+def test_empty_array_yields_no_issues(issue_creator_module, tmp_path) -> None:
+    """An empty JSON array is valid input holding no issues."""
+    path = tmp_path / "issues.json"
+    path.write_text(" [ ]\n", encoding="utf-8")
+
+    assert list(issue_creator_module.read_issues(str(path), chunk_size=2)) == []
+
+
+def test_malformed_value_fails_without_reading_ahead(issue_creator_module) -> None:
+    """A syntax error mid-buffer is raised at once, not after buffering the rest."""
+    lines = [json.dumps(issue) for issue in make_issues(2000)]
+    lines[1] = '{"title": "bad", "body": ""  "labels": []}'
+    f = io.StringIO("\n".join(lines))
+
+    with pytest.raises(ValueError, match="delimiter"):
+        list(issue_creator_module.iter_json_values(f, chunk_size=256))
+    assert f.tell() <= 2 * 256
+
+
+def test_worker_errors_count_as_failed(creator, github) -> None:
+    """An issue whose creation raises fails alone; the batch goes on."""
+    github.responses = [(201, "not an issue")]
+
+    results = creator.create_issues_batch(make_issues(3), delay=0.0, max_workers=1)
+
+    assert (results["created"], results["failed"], results["total"]) == (2, 1, 3)
+    assert "input_error" not in results
+
+
+def test_streamed_issues_are_created_as_they_are_read(issue_creator_module, creator, github, tmp_path) -> None:
+    """Creation starts before the file is read to the end and stops at invalid input."""
+    path = tmp_path / "issues.ndjson"
+    lines = [json.dumps(issue) for issue in make_issues(20)]
+    lines.insert(15, json.dumps({"title": "No body"}))
+    path.write_text("\n".join(lines), encoding="utf-8")
+    consumed = []
+
+    def issues():
+        for issue in issue_creator_module.read_issues(str(path), chunk_size=64):
+            consumed.append((issue["title"], len(github.issues)))
+            yield issue
+
+    results = creator.create_issues_batch(issues(), delay=0.0, max_workers=2)
+
+    assert results["created"] == results["total"] == 15
+    assert results["input_error"] == "Issue 16 missing required field: body"
+    assert len(github.issues) == 15
+    # At most two issues per worker were read ahead of the ones created
+    assert all(index - created <= 4 for index, (_, created) in enumerate(consumed))
@@ -0,0 +1,195 @@
+"""Tests for the metrics module."""
+
+# Standard library imports
+import asyncio
+import re
+import threading
+import urllib.request
+from types import SimpleNamespace
+from typing import Any, Dict
+
+# Third-party imports
+import pytest
+
+# Project imports
+from lumin_ai.metrics import CONTENT_TYPE, Counter, Histogram, MetricsMiddleware, MetricsRegistry
+
+
+def test_counter_aggregates_across_threads() -> None:
+    """Increments from several threads are merged on read."""
+    registry = MetricsRegistry()
+    counter = Counter("rows", "Rows processed", ["wave"], registry=registry)
+
+    def work() -> None:
+        for _ in range(1000):
+            counter.inc(wave="1")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc(5, wave="2")
+
+    assert counter.value(wave="1") == 4000
+    assert 'rows_total{wave="1"} 4000' in registry.render()
+    assert 'rows_total{wave="2"} 5' in registry.render()
+
+
+def test_counter_rejects_bad_input() -> None:
+    """Negative increments and mismatched labels raise ValueError."""
+    counter = Counter("events", "Events", ["kind"], registry=None)
+    with pytest.raises(ValueError):
+        counter.inc(-1, kind="a")
+    with pytest.raises(ValueError):
+        counter.inc(other="a")
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    """Histogram samples are cumulative and end with the +Inf bucket, sum and count."""
+    registry = MetricsRegistry()
+    histogram = Histogram("latency_seconds", "Latency", buckets=[0.1, 1.0], registry=registry)
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value)
+
+    text = registry.render()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "latency_seconds_sum 4.05" in text
+    assert "latency_seconds_count 4" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_duplicate_registration_fails() -> None:
+    """Two metrics cannot share a name in one registry."""
+    registry = MetricsRegistry()
+    Counter("dup", "First", registry=registry)
+    with pytest.raises(ValueError):
+        Counter("dup", "Second", registry=registry)
+
+
+# Prometheus 0.0.4 text format lines
+TEXT_COMMENT = re.compile(r"# (HELP|TYPE) ([a-zA-Z_:][a-zA-Z0-9_:]*) (.*)")
+TEXT_SAMPLE = re.compile(
+    r'([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{((?:[a-zA-Z_]\w*="(?:[^"\\]|\\.)*",?)*)\})? (\S+)'
+)
+TEXT_SUFFIXES = {"counter": ("",), "histogram": ("_bucket", "_sum", "_count")}
+
+
+def parse_textfile(text: str) -> Dict[str, Dict[str, Any]]:
+    """Parse 0.0.4 text into families, checking every sample belongs to the last TYPE."""
+    assert text.endswith("\n")
+    families: Dict[str, Dict[str, Any]] = {}
+    current = None
+    for line in text.splitlines():
+        comment = TEXT_COMMENT.fullmatch(line)
+        if comment:
+            kind, name, rest = comment.groups()
+            family = families.setdefault(name, {"samples": {}})
+            family[kind.lower()] = rest
+            current = name
+            continue
+        sample = TEXT_SAMPLE.fullmatch(line)
+        assert sample, f"not a 0.0.4 sample line: {line!r}"
+        name, labels, value = sample.groups()
+        assert current is not None
+        suffixes = TEXT_SUFFIXES[families[current]["type"]]
+        assert name in {current + suffix for suffix in suffixes}, (name, current)
+        families[current]["samples"][f"{name}{{{labels or ''}}}"] = float(value)
+    return families
+
+
+def test_write_textfile(tmp_path) -> None:
+    """The textfile collector gets the Prometheus 0.0.4 text format."""
+    registry = MetricsRegistry()
+    Counter("jobs", 'Jobs "done"', ["kind"], registry=registry).inc(kind="a")
+    histogram = Histogram("wait_seconds", "Wait", buckets=[1.0], registry=registry)
+    histogram.observe(0.5)
+    path = tmp_path / "lumin.prom"
+
+    registry.write_textfile(str(path))
+
+    families = parse_textfile(path.read_text())
+    assert families == {
+        "jobs_total": {
+            "help": 'Jobs "done"',
+            "type": "counter",
+            "samples": {'jobs_total{kind="a"}': 1.0},
+        },
+        "wait_seconds": {
+            "help": "Wait",
+            "type": "histogram",
+            "samples": {
+                'wait_seconds_bucket{le="1.0"}': 1.0,
+                'wait_seconds_bucket{le="+Inf"}': 1.0,
+                "wait_seconds_sum{}": 0.5,
+                "wait_seconds_count{}": 1.0,
+            },
+        },
+    }
+    assert "# EOF" not in path.read_text()
+    assert [p.name for p in tmp_path.iterdir()] == ["lumin.prom"]
+
+
+def test_http_endpoint_serves_metrics() -> None:
+    """The HTTP server exposes the registry on /metrics."""
+    registry = MetricsRegistry()
+    Counter("hits", "Hits", registry=registry).inc(3)
+    server = registry.start_http_server(0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert "hits_total 3" in response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_exited_thread_shards_are_reclaimed() -> None:
+    """Values of exited threads survive while their shards are dropped."""
+    counter = Counter("jobs", "Jobs", ["kind"], registry=None)
+    histogram = Histogram("job_seconds", "Job time", ["kind"], buckets=(1.0,), registry=None)
+
+    def work() -> None:
+        counter.inc(kind="a")
+        histogram.observe(0.5, kind="a")
+
+    for _ in range(50):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    assert counter.value(kind="a") == 50
+    assert 'job_seconds_count{kind="a"} 50' in histogram.samples()
+    assert len(counter._shards) <= 1
+    assert len(histogram._shards) <= 1
+
+
+def test_middleware_records_request_latency() -> None:
+    """The ASGI middleware labels requests with the matched route template."""
+    from lumin_ai.metrics import API_REQUEST_DURATION
+
+    async def app(scope, receive, send) -> None:
+        # Starlette's router records the matched route in the scope
+        if scope["path"].startswith("/trust-metrics/"):
+            scope["route"] = SimpleNamespace(path="/trust-metrics/{group}")
+        await send({"type": "http.response.start", "status": 204})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message) -> None:
+        pass
+
+    for path in ("/trust-metrics/age_18-29", "/trust-metrics/age_30-44", "/no/such/page"):
+        scope = {"type": "http", "method": "GET", "path": path}
+        asyncio.run(MetricsMiddleware(app)(scope, None, send))
+
+    samples = "\n".join(API_REQUEST_DURATION.samples())
+    assert (
+        'lumin_api_request_duration_seconds_count{method="GET",route="/trust-metrics/{group}",status="204"} 2'
+        in samples
+    )
+    assert 'route="unmatched"' in samples
+    assert "age_18-29" not in samples
@@ -0,0 +1,424 @@
+"""Tests for the data science pipeline in data-science/setup_pipeline.py."""
+
+# Standard library imports
+import hashlib
+import json
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+
+@pytest.fixture
+def survey_df():
+    """A small standardized-ready raw survey frame."""
+    pd = pytest.importorskip("pandas")
+    return pd.DataFrame(
+        {
+            "v1_trust_government": [5.0, 6.0, 4.0, 7.0, 3.0, 5.5],
+            "v2_trust_parliament": [4.0, 5.0, 4.5, 6.0, 3.5, 5.0],
+            "v3_trust_courts": [6.0, 7.0, 5.0, 8.0, 4.0, 6.5],
+            "v4_transparency_perception": [5.0, 5.5, 4.0, 6.0, 3.0, 5.0],
+            "v5_participation_frequency": [4.0, 5.0, 3.0, 6.0, 2.0, 4.5],
+            "demo_age": ["18-29", "18-29", "30-49", "30-49", "50+", "50+"],
+            "demo_region": ["Wien", "Tirol", "Wien", "Salzburg", "Kärnten", "Wien"],
+        }
+    )
+
+
+def test_profiling_disabled_by_default(setup_pipeline, tmp_path, survey_df) -> None:
+    """Without profile=True no stage profiles are recorded or exported."""
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+    metrics = processor.calculate_trust_metrics(processor.standardize_data(survey_df))
+    api_data = processor.export_for_api(metrics, tmp_path / "api.json")
+
+    assert processor.stage_profiles == []
+    assert "stage_profiles" not in api_data["metadata"]
+
+
+def test_stage_profiles_attached_to_export(setup_pipeline, tmp_path, survey_df) -> None:
+    """Each stage records timings and row counts that end up in the export metadata."""
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path), profile=True)
+    df = processor.standardize_data(survey_df)
+    metrics = processor.calculate_trust_metrics(df)
+    processor.export_for_api(metrics, tmp_path / "api.json")
+
+    stages = [p.stage for p in processor.stage_profiles]
+    assert stages == ["standardize_data", "calculate_trust_metrics", "export_for_api"]
+    assert processor.stage_profiles[0].rows_processed == len(survey_df)
+    assert processor.stage_profiles[2].rows_processed == len(metrics)
+    for profile in processor.stage_profiles:
+        assert profile.wall_time_s >= 0
+        assert profile.cpu_time_s >= 0
+        assert profile.peak_memory_mb >= 0
+
+    with open(tmp_path / "api.json") as f:
+        exported = json.load(f)
+    assert [p["stage"] for p in exported["metadata"]["stage_profiles"]] == stages[:2]
+
+
+def test_profile_dir_dumps_cprofile_stats(setup_pipeline, tmp_path, survey_df) -> None:
+    """Passing profile_dir writes one cProfile dump per stage call."""
+    profile_dir = tmp_path / "profiles"
+    processor = setup_pipeline.DemocracyRadarProcessor(
+        data_dir=str(tmp_path), profile_dir=str(profile_dir)
+    )
+    processor.standardize_data(survey_df)
+
+    (profile,) = processor.stage_profiles
+    assert profile.profile_file is not None
+    assert profile.profile_file.startswith(str(profile_dir))
+    assert len(list(profile_dir.glob("standardize_data-*.prof"))) == 1
+
+
+def test_stage_durations_exported_as_metrics(setup_pipeline, tmp_path, survey_df) -> None:
+    """Stage wall times are recorded in the lumin_ai metrics registry."""
+    metrics = pytest.importorskip("lumin_ai.metrics")
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+    processor.standardize_data(survey_df)
+
+    assert any(
+        line.startswith('lumin_pipeline_stage_duration_seconds_count{stage="standardize_data"}')
+        for line in metrics.STAGE_DURATION.samples()
+    )
+
+
+@pytest.fixture
+def lfs_repo(tmp_path):
+    """A repository whose raw wave file is a Git LFS pointer with its object stored locally."""
+    content = b"v1_trust_government,v2_trust_parliament,demo_age\n5.0,4.0,18-29\n7.0,6.0,30-49\n"
+    oid = hashlib.sha256(content).hexdigest()
+    objects_dir = tmp_path / "repo" / ".git" / "lfs" / "objects"
+    object_path = objects_dir / oid[:2] / oid[2:4] / oid
+    object_path.parent.mkdir(parents=True)
+    object_path.write_bytes(content)
+
+    raw_dir = tmp_path / "repo" / "data" / "raw" / "democracy-radar"
+    raw_dir.mkdir(parents=True)
+    pointer = f"version https://git-lfs.github.com/spec/v1\noid sha256:{oid}\nsize {len(content)}\n"
+    (raw_dir / "wave-1.csv").write_text(pointer)
+    return tmp_path / "repo", object_path
+
+
+def test_lfs_pointer_is_read_from_object_store(setup_pipeline, lfs_repo) -> None:
+    """A pointer file loads the object's rows instead of a one-column frame of pointer text."""
+    repo, _ = lfs_repo
+    processor = setup_pipeline.DemocracyRadarProcessor(
+        data_dir=str(repo / "data"), fetch_lfs_objects=False
+    )
+
+    df = processor.load_democracy_radar_data()
+
+    assert list(df.columns) == ["v1_trust_government", "v2_trust_parliament", "demo_age", "wave"]
+    assert df["v1_trust_government"].tolist() == [5.0, 7.0]
+    assert processor.load_democracy_radar_data(wave=1).shape == (2, 3)
+
+
+def test_pointer_detection_only_sniffs_small_files(setup_pipeline, tmp_path, lfs_repo) -> None:
+    """Regular CSVs are not pointers, and files past the pointer size limit are never opened."""
+    repo, _ = lfs_repo
+    regular = tmp_path / "regular.csv"
+    regular.write_text("a,b\n1,2\n")
+    large = tmp_path / "large.csv"
+    large.write_bytes(setup_pipeline.LFS_POINTER_PREFIX + b"x" * setup_pipeline.LFS_POINTER_MAX_SIZE)
+
+    assert setup_pipeline.read_lfs_pointer(regular) is None
+    assert setup_pipeline.read_lfs_pointer(large) is None
+    pointer = setup_pipeline.read_lfs_pointer(repo / "data" / "raw" / "democracy-radar" / "wave-1.csv")
+    assert len(pointer.oid) == 64 and pointer.size > 0
+
+    # The sample data checked into this repository is itself a pointer
+    repo_root = Path(__file__).resolve().parents[1]
+    sample = setup_pipeline.read_lfs_pointer(repo_root / "data" / "examples" / "sample_data.csv")
+    assert sample is not None and sample.oid.startswith("9e54fb84")
+
+
+def test_missing_or_incomplete_lfs_object_raises(setup_pipeline, lfs_repo) -> None:
+    """A pointer without a complete local object fails loudly instead of parsing the pointer."""
+    repo, object_path = lfs_repo
+    processor = setup_pipeline.DemocracyRadarProcessor(
+        data_dir=str(repo / "data"), fetch_lfs_objects=False
+    )
+
+    object_path.write_bytes(b"partial")
+    with pytest.raises(FileNotFoundError, match="incomplete"):
+        processor.load_democracy_radar_data(wave=1)
+
+    object_path.unlink()
+    with pytest.raises(FileNotFoundError, match="git lfs pull"):
+        processor.load_democracy_radar_data(wave=1)
+
+
+def test_missing_lfs_object_is_fetched_lazily(setup_pipeline, lfs_repo, monkeypatch) -> None:
+    """A missing object is fetched into the object store, not checked out, then read."""
+    repo, object_path = lfs_repo
+    content = object_path.read_bytes()
+    object_path.unlink()
+    commands = []
+
+    def fake_run(cmd, cwd, **kwargs):
+        commands.append((cmd, cwd))
+        assert kwargs["timeout"] == setup_pipeline.LFS_FETCH_TIMEOUT
+        assert kwargs["env"]["GIT_TERMINAL_PROMPT"] == "0"
+        object_path.write_bytes(content)
+
+    monkeypatch.setattr(setup_pipeline.subprocess, "run", fake_run)
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(repo / "data"))
+
+    df = processor.load_democracy_radar_data(wave=1)
+
+    assert len(df) == 2
+    assert commands == [(["git", "lfs", "fetch", "--include", "wave-1.csv"], processor.raw_dir)]
+    assert "version https" in (repo / "data" / "raw" / "democracy-radar" / "wave-1.csv").read_text()
+
+
+def test_hung_lfs_fetch_times_out(setup_pipeline, lfs_repo, monkeypatch) -> None:
+    """A fetch that outlives its timeout is reported as a missing object."""
+    repo, object_path = lfs_repo
+    object_path.unlink()
+
+    def hung_run(cmd, timeout, **kwargs):
+        raise setup_pipeline.subprocess.TimeoutExpired(cmd, timeout)
+
+    monkeypatch.setattr(setup_pipeline.subprocess, "run", hung_run)
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(repo / "data"))
+
+    with pytest.raises(FileNotFoundError, match="git lfs pull"):
+        processor.load_democracy_radar_data(wave=1)
+
+
+@pytest.mark.parametrize(
+    "oid",
+    ["sha256:" + "A" * 64, "sha256:" + "a" * 63, "sha256:../../../../etc/passwd", "md5:" + "a" * 64],
+)
+def test_malformed_lfs_oid_is_rejected(setup_pipeline, tmp_path, oid) -> None:
+    """Only lowercase 64-digit hex sha256 oids are accepted, since they become paths."""
+    path = tmp_path / "wave-1.csv"
+    path.write_text(f"version https://git-lfs.github.com/spec/v1\noid {oid}\nsize 10\n")
+
+    with pytest.raises(ValueError, match="Malformed"):
+        setup_pipeline.read_lfs_pointer(path)
+
+
+def test_lfs_objects_found_from_worktree(setup_pipeline, lfs_repo, tmp_path) -> None:
+    """A linked worktree's .git file leads to the main repository's object store."""
+    repo, _ = lfs_repo
+    worktree_git_dir = repo / ".git" / "worktrees" / "feature"
+    worktree_git_dir.mkdir(parents=True)
+    (worktree_git_dir / "commondir").write_text("../..\n")
+    worktree = tmp_path / "feature"
+    (worktree / "data").mkdir(parents=True)
+    (worktree / ".git").write_text(f"gitdir: {worktree_git_dir}\n")
+
+    objects_dir = setup_pipeline.find_lfs_objects_dir(worktree / "data" / "wave-1.csv")
+
+    assert objects_dir == (repo / ".git" / "lfs" / "objects").resolve()
+
+
+@pytest.fixture
+def wave_df():
+    """Standardized responses over four waves with one respondent missing an age group."""
+    pd = pytest.importorskip("pandas")
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(7)
+    n = 240
+    df = pd.DataFrame(
+        {
+            "trust_government": rng.normal(5, 1.5, n),
+            "trust_parliament": rng.normal(4.5, 1.3, n),
+            "transparency_perception": rng.normal(5.5, 1.4, n),
+            "participation_frequency": rng.normal(4.8, 1.6, n),
+            "age_group": rng.choice(["18-29", "30-49", "50+"], n),
+            "wave": rng.integers(1, 5, n),
+        }
+    )
+    df.loc[0, "age_group"] = None
+    df.loc[1, "trust_parliament"] = np.nan
+    return df
+
+
+def _naive_composite(df):
+    institutional = df[["trust_government", "trust_parliament"]].mean(axis=1)
+    return (institutional + df["transparency_perception"] + df["participation_frequency"]) / 3
+
+
+def test_trust_time_series_matches_per_group_computation(setup_pipeline, tmp_path, wave_df) -> None:
+    """Wave means, CIs, rolling windows and deltas agree with a direct per-group computation."""
+    pd = pytest.importorskip("pandas")
+    np = pytest.importorskip("numpy")
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+
+    series = processor.calculate_trust_time_series(wave_df, windows=(2,), ewm_span=2.0)
+
+    groups = list(dict.fromkeys(series.index.get_level_values("group")))
+    assert groups == ["overall", "age_18-29", "age_30-49", "age_50+"]
+    composite = _naive_composite(wave_df)
+    for group, mask in [("overall", wave_df["wave"] > 0), ("age_30-49", wave_df["age_group"] == "30-49")]:
+        by_wave = [composite[mask & (wave_df["wave"] == wave)] for wave in range(1, 5)]
+        rows = series.loc[group]
+        for wave, values in enumerate(by_wave, 1):
+            row = rows.loc[wave]
+            assert row["n"] == len(values)
+            assert row["composite_score"] == pytest.approx(values.mean())
+            lower, upper = processor._calculate_confidence_interval(values)
+            assert (row["composite_score_ci_lower"], row["composite_score_ci_upper"]) == pytest.approx(
+                (lower, upper)
+            )
+        pooled = np.concatenate([by_wave[2], by_wave[3]]).mean()
+        assert rows.loc[4, "composite_score_rolling_2"] == pytest.approx(pooled)
+        assert rows.loc[4, "composite_score_delta"] == pytest.approx(
+            by_wave[3].mean() - by_wave[2].mean()
+        )
+        means = [values.mean() for values in by_wave]
+        assert rows["composite_score_ewm"].tolist() == pytest.approx(
+            list(pd.Series(means).ewm(span=2.0).mean())
+        )
+
+    # The respondent without an age group counts only towards the overall series
+    assert series.loc["overall", "n"].sum() == len(wave_df)
+    assert series.drop(index="overall", level="group")["n"].sum() == len(wave_df) - 1
+    # A missing trust item is skipped in the institutional mean, as in calculate_trust_metrics
+    assert series.loc["overall", "institutional_trust"].notna().all()
+
+
+def test_trust_time_series_delta_interval(setup_pipeline, tmp_path) -> None:
+    """A clear shift between waves gives a delta CI excluding zero; the first wave has none."""
+    pd = pytest.importorskip("pandas")
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(3)
+    waves = np.repeat([1, 2], 100)
+    shift = np.where(waves == 2, 2.0, 0.0)
+    df = pd.DataFrame(
+        {
+            "trust_government": rng.normal(5, 1, 200) + shift,
+            "transparency_perception": rng.normal(5, 1, 200),
+            "participation_frequency": rng.normal(5, 1, 200),
+            "wave": waves,
+        }
+    )
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+
+    overall = processor.calculate_trust_time_series(df).loc["overall"]
+
+    assert np.isnan(overall.loc[1, "institutional_trust_delta"])
+    second = overall.loc[2]
+    assert 0 < second["institutional_trust_delta_ci_lower"] < second["institutional_trust_delta"]
+    assert second["process_satisfaction_delta_ci_lower"] < 0 < second["process_satisfaction_delta_ci_upper"]
+
+
+def test_trust_time_series_requires_waves(setup_pipeline, tmp_path, survey_df) -> None:
+    """Frames without a wave column are rejected."""
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+    with pytest.raises(ValueError, match="wave"):
+        processor.calculate_trust_time_series(processor.standardize_data(survey_df))
+
+
+def test_time_series_exported_for_api(setup_pipeline, tmp_path, wave_df) -> None:
+    """The exported JSON holds one list of wave records per group, with null for undefined deltas."""
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+    metrics = processor.calculate_trust_metrics(wave_df)
+    series = processor.calculate_trust_time_series(wave_df)
+
+    processor.export_for_api(metrics, tmp_path / "api.json", time_series=series)
+
+    with open(tmp_path / "api.json") as f:
+        exported = json.load(f)["trust_time_series"]
+    assert list(exported) == ["overall", "age_18-29", "age_30-49", "age_50+"]
+    first, second = exported["overall"][:2]
+    assert first["wave"] == 1 and first["composite_score_delta"] is None
+    assert second["composite_score_delta"] == pytest.approx(
+        second["composite_score"] - first["composite_score"], abs=2e-3
+    )
+
+
+def _naive_alpha(items):
+    """Cronbach's alpha and corrected item-total correlations straight from the definition."""
+    items = items.dropna()
+    k = items.shape[1]
+    total = items.sum(axis=1)
+    alpha = k / (k - 1) * (1 - items.var().sum() / total.var())
+    item_total = {col: items[col].corr(total - items[col]) for col in items.columns}
+    return len(items), alpha, item_total
+
+
+@pytest.fixture
+def reliability_df(wave_df):
+    """Correlated trust items sharing a latent trust factor."""
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(11)
+    latent = rng.normal(5, 1.5, len(wave_df))
+    df = wave_df.copy()
+    for item, noise in [("trust_government", 1.0), ("trust_parliament", 1.2), ("trust_courts", 0.8)]:
+        df[item] = latent + rng.normal(0, noise, len(df))
+    df.loc[1, "trust_parliament"] = np.nan
+    return df
+
+
+def test_reliability_matches_definition_per_group(setup_pipeline, tmp_path, reliability_df) -> None:
+    """Batched alpha and item-total correlations agree with a direct computation for each group."""
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+    items = ["trust_government", "trust_parliament", "trust_courts"]
+
+    reliability = processor.calculate_reliability(reliability_df)
+
+    assert list(reliability.index) == ["overall", "age_18-29", "age_30-49", "age_50+"]
+    for group, mask in [
+        ("overall", reliability_df["wave"] > 0),
+        ("age_50+", reliability_df["age_group"] == "50+"),
+    ]:
+        n, alpha, item_total = _naive_alpha(reliability_df.loc[mask, items])
+        row = reliability.loc[group]
+        assert row["n"] == n
+        assert row["alpha"] == pytest.approx(alpha)
+        for item in items:
+            assert row[f"{item}_item_total_r"] == pytest.approx(item_total[item])
+        others = [item for item in items if item != "trust_courts"]
+        assert row["trust_courts_alpha_if_deleted"] == pytest.approx(
+            _naive_alpha(reliability_df.loc[mask, others])[1]
+        )
+    assert reliability.loc["overall", "alpha"] > setup_pipeline.RELIABILITY_THRESHOLD
+
+
+def test_reliability_chunks_and_merges_like_one_pass(setup_pipeline, tmp_path, reliability_df) -> None:
+    """Chunked updates and merged partial accumulators give the single-pass result."""
+    pd = pytest.importorskip("pandas")
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+    items = ["trust_government", "trust_parliament", "trust_courts"]
+
+    whole = processor.calculate_reliability(reliability_df, by_wave=True)
+    chunked = processor.calculate_reliability(reliability_df, by_wave=True, chunk_size=17)
+    pd.testing.assert_frame_equal(chunked, whole)
+
+    halves = []
+    for part in (reliability_df.iloc[::2], reliability_df.iloc[1::2]):
+        accumulator = setup_pipeline.ReliabilityAccumulator(items)
+        accumulator.update(part, ("age_group",), "wave")
+        halves.append(accumulator)
+    merged = halves[0].merge(halves[1]).results()
+    pd.testing.assert_frame_equal(merged, whole, check_exact=False)
+
+    assert whole.index.names == ["group", "wave"]
+    assert whole.loc["overall"]["n"].sum() == len(reliability_df) - 1
+
+    with pytest.raises(ValueError, match="same items"):
+        halves[0].merge(setup_pipeline.ReliabilityAccumulator(items[:2]))
+
+
+def test_reliability_exported_for_api(setup_pipeline, tmp_path, reliability_df) -> None:
+    """Alpha and per-item statistics are exported per group."""
+    processor = setup_pipeline.DemocracyRadarProcessor(data_dir=str(tmp_path))
+    metrics = processor.calculate_trust_metrics(reliability_df)
+    reliability = processor.calculate_reliability(reliability_df)
+
+    processor.export_for_api(metrics, tmp_path / "api.json", reliability=reliability)
+
+    with open(tmp_path / "api.json") as f:
+        exported = json.load(f)["reliability"]
+    assert list(exported) == ["overall", "age_18-29", "age_30-49", "age_50+"]
+    overall = exported["overall"]
+    assert overall["cronbach_alpha"] == round(reliability.loc["overall", "alpha"], 3)
+    assert set(overall["item_total_correlation"]) == {
+        "trust_government",
+        "trust_parliament",
+        "trust_courts",
+    }
@@ -0,0 +1,109 @@
+"""Tests for the shared git command cache and report of scripts/verify_git_lfs.py."""
+
+# Standard library imports
+import json
+import threading
+import time
+
+# Third-party imports
+import pytest
+
+
+class FakeGit:
+    """Stand-in for ``run_git_command`` with a fixed latency per command."""
+
+    def __init__(self, outputs: dict, latency: float = 0.0) -> None:
+        self.outputs = outputs
+        self.latency = latency
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, args):
+        with self.lock:
+            self.calls.append(tuple(args))
+        time.sleep(self.latency)
+        return self.outputs.get(tuple(args))
+
+
+@pytest.fixture
+def lfs_repo(tmp_path, monkeypatch):
+    """A working directory with LFS patterns and the sample data file."""
+    (tmp_path / ".gitattributes").write_text("*.csv filter=lfs diff=lfs merge=lfs -text\n")
+    sample = tmp_path / "data" / "examples" / "sample_data.csv"
+    sample.parent.mkdir(parents=True)
+    sample.write_text("version https://git-lfs.github.com/spec/v1\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def lfs_outputs(module) -> dict:
+    return {
+        module.LFS_VERSION: "git-lfs/3.4.0",
+        module.LFS_LS_FILES: "0123456789 * data/examples/sample_data.csv\nabcdef0123 * model.pt",
+        module.SAMPLE_LS_FILES: "data/examples/sample_data.csv",
+    }
+
+
+def test_each_git_command_runs_once(verify_lfs_module, lfs_repo) -> None:
+    """Checks sharing `git lfs ls-files` reuse a single run of it."""
+    fake = FakeGit(lfs_outputs(verify_lfs_module))
+    git = verify_lfs_module.GitCommandCache(runner=fake)
+
+    report = verify_lfs_module.run_checks(git, quiet=True)
+
+    assert report["passed"]
+    assert sorted(fake.calls) == sorted(set(fake.calls))
+    hits = {entry["command"]: entry["cache_hits"] for entry in report["commands"]}
+    assert hits["git lfs ls-files"] == 2
+
+
+def test_git_commands_run_concurrently(verify_lfs_module, lfs_repo) -> None:
+    """Independent commands overlap, and a concurrent request waits for the running one."""
+    fake = FakeGit(lfs_outputs(verify_lfs_module), latency=0.2)
+    git = verify_lfs_module.GitCommandCache(runner=fake)
+
+    start = time.monotonic()
+    report = verify_lfs_module.run_checks(git, quiet=True)
+
+    assert time.monotonic() - start < 0.4
+    assert report["prefetch_seconds"] >= 0.2
+
+    waiter = threading.Thread(target=git.run, args=(("status",),))
+    waiter.start()
+    assert git.run(("status",)) is None
+    waiter.join()
+    assert fake.calls.count(("status",)) == 1
+
+
+def test_json_report(verify_lfs_module, lfs_repo, monkeypatch, capsys) -> None:
+    """--json prints one machine-readable report with per-check and per-command timings."""
+    outputs = lfs_outputs(verify_lfs_module)
+    outputs[verify_lfs_module.LFS_LS_FILES] = "abcdef0123 * model.pt"
+
+    def fake_run(args):
+        print("noise from git")
+        return outputs.get(tuple(args))
+
+    monkeypatch.setattr(verify_lfs_module, "run_git_command", fake_run)
+
+    assert verify_lfs_module.main(["--json"]) == 1
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["passed"] is False
+    assert report["errors"] == ["noise from git"] * 3
+    assert [check["name"] for check in report["checks"]] == [
+        "check_git_lfs_installed",
+        "check_gitattributes",
+        "check_lfs_files",
+        "check_sample_file",
+    ]
+    sample = report["checks"][-1]
+    assert not sample["passed"]
+    assert "not tracked by Git LFS" in sample["output"][0]
+    assert {entry["command"] for entry in report["commands"]} == {
+        "git lfs version",
+        "git lfs ls-files",
+        "git ls-files data/examples/sample_data.csv",
+    }
+    assert all(check["seconds"] >= 0 for check in report["checks"])
+    assert report["total_seconds"] >= report["prefetch_seconds"]